@@ -0,0 +1,28 @@
+"""add_processing_task_owner
+
+Revision ID: a9c4e7f2d813
+Revises: f1b6e3d8a925
+Create Date: 2026-10-17 09:14:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e7f2d813'
+down_revision: Union[str, None] = 'f1b6e3d8a925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('processing_tasks', sa.Column('owner', sa.String(length=200), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('processing_tasks', 'owner')
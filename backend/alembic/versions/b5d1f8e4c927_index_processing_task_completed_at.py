@@ -0,0 +1,28 @@
+"""index_processing_task_completed_at
+
+Revision ID: b5d1f8e4c927
+Revises: e2f7b9c3a461
+Create Date: 2026-10-17 17:12:53.604182
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1f8e4c927'
+down_revision: Union[str, None] = 'e2f7b9c3a461'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_processing_tasks_completed_at'), 'processing_tasks', ['completed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_processing_tasks_completed_at'), table_name='processing_tasks')
@@ -0,0 +1,44 @@
+"""add_processing_tasks
+
+Revision ID: b7d41c9e2f60
+Revises: 63eed5e8ed94
+Create Date: 2026-10-16 10:12:31.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41c9e2f60'
+down_revision: Union[str, None] = '63eed5e8ed94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'processing_tasks',
+        sa.Column('task_id', sa.String(length=36), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('progress', sa.Float(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('task_id')
+    )
+    op.create_index(op.f('ix_processing_tasks_status'), 'processing_tasks', ['status'], unique=False)
+    op.create_index(op.f('ix_processing_tasks_created_at'), 'processing_tasks', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_processing_tasks_created_at'), table_name='processing_tasks')
+    op.drop_index(op.f('ix_processing_tasks_status'), table_name='processing_tasks')
+    op.drop_table('processing_tasks')
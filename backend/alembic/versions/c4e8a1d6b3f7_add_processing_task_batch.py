@@ -0,0 +1,32 @@
+"""add_processing_task_batch
+
+Revision ID: c4e8a1d6b3f7
+Revises: a9c4e7f2d813
+Create Date: 2026-10-17 14:02:37.519204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1d6b3f7'
+down_revision: Union[str, None] = 'a9c4e7f2d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('processing_tasks', sa.Column('batch_id', sa.String(length=36), nullable=True))
+    op.add_column('processing_tasks', sa.Column('recording_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_processing_tasks_batch_id'), 'processing_tasks', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_processing_tasks_batch_id'), table_name='processing_tasks')
+    op.drop_column('processing_tasks', 'recording_id')
+    op.drop_column('processing_tasks', 'batch_id')
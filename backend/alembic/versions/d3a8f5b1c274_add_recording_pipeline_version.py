@@ -0,0 +1,30 @@
+"""add_recording_pipeline_version
+
+Revision ID: d3a8f5b1c274
+Revises: b7d41c9e2f60
+Create Date: 2026-10-16 14:03:52.618230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8f5b1c274'
+down_revision: Union[str, None] = 'b7d41c9e2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('audio_recordings', sa.Column('pipeline_version', sa.String(length=20), nullable=True))
+    op.create_index(op.f('ix_audio_recordings_pipeline_version'), 'audio_recordings', ['pipeline_version'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_audio_recordings_pipeline_version'), table_name='audio_recordings')
+    op.drop_column('audio_recordings', 'pipeline_version')
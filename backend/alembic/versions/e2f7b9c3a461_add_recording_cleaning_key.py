@@ -0,0 +1,28 @@
+"""add_recording_cleaning_key
+
+Revision ID: e2f7b9c3a461
+Revises: c4e8a1d6b3f7
+Create Date: 2026-10-17 16:41:09.283716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f7b9c3a461'
+down_revision: Union[str, None] = 'c4e8a1d6b3f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('audio_recordings', sa.Column('cleaning_key', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('audio_recordings', 'cleaning_key')
@@ -0,0 +1,34 @@
+"""add_recording_content_hash
+
+Revision ID: e5c92a7d4b18
+Revises: d3a8f5b1c274
+Create Date: 2026-10-16 16:41:07.392854
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c92a7d4b18'
+down_revision: Union[str, None] = 'd3a8f5b1c274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('audio_recordings', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('audio_recordings', sa.Column('feature_cache_key', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_audio_recordings_content_hash'), 'audio_recordings', ['content_hash'], unique=False)
+    op.create_index(op.f('ix_audio_recordings_feature_cache_key'), 'audio_recordings', ['feature_cache_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_audio_recordings_feature_cache_key'), table_name='audio_recordings')
+    op.drop_index(op.f('ix_audio_recordings_content_hash'), table_name='audio_recordings')
+    op.drop_column('audio_recordings', 'feature_cache_key')
+    op.drop_column('audio_recordings', 'content_hash')
@@ -0,0 +1,32 @@
+"""add_feature_group_versions
+
+Revision ID: f1b6e3d8a925
+Revises: e5c92a7d4b18
+Create Date: 2026-10-16 18:20:44.107362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b6e3d8a925'
+down_revision: Union[str, None] = 'e5c92a7d4b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('audio_features', sa.Column('feature_group', sa.String(length=30), nullable=True))
+    op.add_column('audio_features', sa.Column('group_version', sa.String(length=20), nullable=True))
+    op.add_column('audio_recordings', sa.Column('feature_group_versions', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('audio_recordings', 'feature_group_versions')
+    op.drop_column('audio_features', 'group_version')
+    op.drop_column('audio_features', 'feature_group')
@@ -1,18 +1,41 @@
 # backend/app/api/v1/endpoints/audio_processing.py
 
 import os
+import math
+import numbers
+import shutil
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
-from app.crud.audio_crud import get_recording, create_feature
-from app.schemas.audio_schema import AudioFeatureCreate
+from app.crud.audio_crud import (
+    get_recording,
+    get_features,
+    replace_features,
+    find_cached_features_source,
+    copy_features,
+)
+from app.schemas.audio_schema import AudioProcessingRequest
 from app.services.task_manager import task_manager, TaskStatus
-from app.services.audio_processing import clean_and_extract_features
+from app.services.pipeline_config import (
+    assign_feature_groups,
+    validate_feature_groups,
+    cleaning_key,
+    cleaning_params,
+    FEATURE_GROUPS,
+    FEATURE_GROUP_VERSIONS,
+    PIPELINE_VERSION,
+    STREAMING_FEATURE_GROUPS,
+    STREAMING_FEATURE_GROUP_VERSIONS,
+)
+from app.services.feature_cache import hash_file, feature_cache_key
+from app.services.signal_cache import cleaned_signal_path
+from app.services.extraction_pool import extraction_pool, WorkerFunction
+from app.services.metrics import observe_stage
 
 # Import database dependencies here to avoid circular imports
 from app.core.database import async_session
@@ -23,13 +46,118 @@ router = APIRouter(
     tags=["audio-processing"],
 )
 
+# Run in extraction workers; the API process never imports the audio stack
+clean_and_extract_features = WorkerFunction("app.services.audio_processing", "clean_and_extract_features")
+recompute_feature_groups = WorkerFunction("app.services.audio_processing", "recompute_feature_groups")
+stream_clean_and_extract_features = WorkerFunction("app.services.streaming", "stream_clean_and_extract_features")
+stream_extract_features = WorkerFunction("app.services.streaming", "stream_extract_features")
+
 UPLOAD_DIR = os.getenv("AUDIO_UPLOAD_DIR", "uploads/recordings")
+# Process recordings of at least STREAMING_MIN_DURATION_SECONDS block by block with
+# bounded memory; streaming skips some groups and approximates others
+STREAMING_ENABLED = os.getenv("STREAMING_ENABLED", "false").lower() == "true"
+STREAMING_MIN_DURATION_SECONDS = float(os.getenv("STREAMING_MIN_DURATION_SECONDS", 1800))
+
+def _json_features(features: Dict[str, Any]) -> Dict[str, Any]:
+    """Plain floats for JSON; NaN and infinite values become None, non-numeric values are dropped."""
+    return {
+        name: float(value) if math.isfinite(value) else None
+        for name, value in features.items()
+        if isinstance(value, numbers.Real)
+    }
+
+def _audio_duration(file_path: str) -> Optional[float]:
+    """Duration in seconds from the file header, or None if soundfile cannot read it."""
+    import soundfile as sf  # with NumPy, only loaded once a recording is processed
 
-async def process_audio_background(task_id: str, recording_id: int, file_path: str):
-    """Background task to process audio and extract features."""
     try:
-        task_manager.mark_task_running(task_id)
-        task_manager.update_task_progress(task_id, 0.1)
+        return sf.info(file_path).duration
+    except Exception:
+        return None
+
+def _is_current(group: str, version: Optional[str], streaming: bool) -> bool:
+    """Whether a stored group version needs no recompute; streamed versions only count while streaming."""
+    return version == FEATURE_GROUP_VERSIONS[group] or (
+        streaming and version is not None and version == STREAMING_FEATURE_GROUP_VERSIONS.get(group)
+    )
+
+def _cleaned_path(file_path: str) -> str:
+    base, ext = os.path.splitext(file_path)
+    return f"{base}_cleaned{ext}"
+
+async def _copy_cached_features(recording_id: int, file_path: str,
+                                cleaned_file_path: str) -> Tuple[str, Dict[str, Any], Optional[int]]:
+    """
+    Look up features of an identical recording processed with the same pipeline.
+
+    Returns the recording's feature cache key, the cleaning options for the
+    extraction functions (cleaned-signal cache entry and recording device)
+    and, on a hit, the number of features copied (None on a miss). A hit
+    also copies the cleaned audio.
+    """
+    async with async_session() as db:
+        recording = await get_recording(db, recording_id)
+        if recording is None:
+            raise ValueError(f"Recording {recording_id} not found")
+        if recording.content_hash is None:  # uploaded before hashes were stored
+            recording.content_hash = await asyncio.to_thread(hash_file, file_path)
+            await db.commit()
+        params = cleaning_params(recording.recording_device)
+        cache_key = feature_cache_key(
+            recording.content_hash, PIPELINE_VERSION,
+            {"params": params, "groups": FEATURE_GROUP_VERSIONS},
+        )
+        cleaning = {
+            "signal_cache_path": cleaned_signal_path(file_path, recording.content_hash, PIPELINE_VERSION, params),
+            "recording_device": recording.recording_device,
+        }
+
+        source = await find_cached_features_source(db, cache_key, recording_id)
+        if source is None:
+            return cache_key, cleaning, None
+        source_cleaned_path = _cleaned_path(source.file_path.lstrip('/'))
+        if not os.path.exists(source_cleaned_path):
+            return cache_key, cleaning, None
+        await asyncio.to_thread(shutil.copyfile, source_cleaned_path, cleaned_file_path)
+        return cache_key, cleaning, await copy_features(
+            db, source.recording_id, recording_id, PIPELINE_VERSION, cache_key,
+            cleaning_key(recording.recording_device),
+        )
+
+async def _stored_feature_groups(
+    recording_id: int, current_cleaning_key: str,
+) -> Tuple[Optional[Dict[str, str]], Dict[str, Tuple[str, float]]]:
+    """
+    Group versions and features (as {name: (group, value)}) stored for a recording.
+
+    Returns (None, {}) when the stored features cannot be reused: the
+    recording was never processed with group versions or was cleaned by
+    another pipeline version or with other cleaning parameters.
+    """
+    async with async_session() as db:
+        recording = await get_recording(db, recording_id)
+        stored = await get_features(db, recording_id)
+    if (
+        not recording.feature_group_versions
+        or recording.pipeline_version != PIPELINE_VERSION
+        or recording.cleaning_key != current_cleaning_key
+    ):
+        return None, {}
+    return recording.feature_group_versions, {f.feature_name: (f.feature_group, f.feature_value) for f in stored}
+
+async def process_audio_background(task_id: str, recording_id: int, file_path: str,
+                                   groups: Optional[List[str]] = None):
+    """
+    Background task to process audio and extract features.
+
+    Only the requested feature groups (default: all) are extracted; features
+    of other groups stored for the recording are kept.
+    """
+    try:
+        requested = validate_feature_groups(FEATURE_GROUPS if groups is None else groups)
+
+        await task_manager.mark_task_running(task_id)
+        await task_manager.update_task_progress(task_id, 0.1)
         
         # Get full file path - remove leading slash if present
         if file_path.startswith('/'):
@@ -39,97 +167,142 @@ async def process_audio_background(task_id: str, recording_id: int, file_path: s
         if not os.path.exists(full_file_path):
             raise FileNotFoundError(f"Audio file not found: {full_file_path}")
         
-        task_manager.update_task_progress(task_id, 0.2)
+        await task_manager.update_task_progress(task_id, 0.2)
         
         # Generate cleaned audio filename
-        base, ext = os.path.splitext(full_file_path)
-        cleaned_file_path = f"{base}_cleaned{ext}"
+        cleaned_file_path = _cleaned_path(full_file_path)
+
+        # Identical audio already processed with this pipeline: copy its features
+        cache_key, cleaning, cached_count = await _copy_cached_features(
+            recording_id, full_file_path, cleaned_file_path
+        )
+        if cached_count is not None:
+            await task_manager.mark_task_completed(task_id, {
+                "features_extracted": cached_count,
+                "cleaned_audio_path": "/" + cleaned_file_path,
+                "original_features": cached_count,
+                "cache_hit": True,
+            })
+            return
         
-        task_manager.update_task_progress(task_id, 0.3)
+        # When enabled, very long recordings are streamed; groups needing whole-signal analyses are skipped
+        streaming = False
+        if STREAMING_ENABLED:
+            duration = await asyncio.to_thread(_audio_duration, full_file_path)
+            streaming = duration is not None and duration >= STREAMING_MIN_DURATION_SECONDS
+        versions = STREAMING_FEATURE_GROUP_VERSIONS if streaming else FEATURE_GROUP_VERSIONS
+
+        # Same cleaning pipeline as the stored features: recompute only requested groups whose version changed
+        current_cleaning_key = cleaning_key(cleaning["recording_device"])
+        stored_versions, stored_features = await _stored_feature_groups(recording_id, current_cleaning_key)
+        incremental = stored_versions is not None and os.path.exists(cleaned_file_path)
+        if incremental:
+            groups = [group for group in requested if not _is_current(group, stored_versions.get(group), streaming)]
+        else:
+            groups = requested
+
+        skipped_groups = []
+        if streaming:
+            skipped_groups = [group for group in groups if group not in STREAMING_FEATURE_GROUPS]
+            groups = [group for group in groups if group in STREAMING_FEATURE_GROUPS]
+
+        group_features = {}
+        partial_groups = {}
+        stages = {}
+        await task_manager.update_task_progress(
+            task_id, 0.3, {"stage": "extracting" if incremental else "cleaning", "feature_groups": {}}
+        )
+
+        async def publish_group(group: str, features: Dict[str, Any]):
+            group_features[group] = features
+            # Partial results are visible to pollers and event streams as each group finishes
+            partial_groups[group] = _json_features(features)
+            await task_manager.update_task_progress(
+                task_id,
+                0.3 + 0.4 * len(partial_groups) / len(groups),
+                {"stage": group, "feature_groups": dict(partial_groups)},
+            )
+
+        def record_stage(name: str, stats: Dict[str, float]):
+            # Per-task breakdown in the result, aggregated over tasks on /metrics
+            stages[name] = stats
+            observe_stage(name, stats)
+
+        callbacks = {"on_group": publish_group, "on_stage": record_stage}
         
-        # Process audio and extract features
-        features, cleaned_path = clean_and_extract_features(full_file_path, cleaned_file_path)
+        # Process audio and extract features in a worker process, off the event loop
+        if incremental and not groups:
+            features, cleaned_path = {}, cleaned_file_path
+        elif incremental and streaming:
+            features = await extraction_pool.run_with_callbacks(
+                stream_extract_features, full_file_path, cleaned_file_path, groups,
+                callbacks=callbacks,
+            )
+            cleaned_path = cleaned_file_path
+        elif incremental:
+            features = await extraction_pool.run_with_callbacks(
+                recompute_feature_groups, full_file_path, cleaned_file_path, groups,
+                callbacks=callbacks,
+                signal_cache_path=cleaning["signal_cache_path"],
+            )
+            cleaned_path = cleaned_file_path
+        elif streaming:
+            features, cleaned_path = await extraction_pool.run_with_callbacks(
+                stream_clean_and_extract_features, full_file_path, cleaned_file_path,
+                callbacks=callbacks, groups=groups,
+                recording_device=cleaning["recording_device"],
+            )
+        else:
+            features, cleaned_path = await extraction_pool.run_with_callbacks(
+                clean_and_extract_features, full_file_path, cleaned_file_path,
+                callbacks=callbacks, groups=groups, **cleaning,
+            )
         
-        task_manager.update_task_progress(task_id, 0.7)
+        await task_manager.update_task_progress(task_id, 0.7)
         
-        # Create new database session for background task
+        # Only groups whose features were received count as extracted; a missing
+        # group keeps its stored features and version, so it is recomputed later
+        groups = [group for group in groups if group in group_features]
+
+        # Replace previous features (keeping groups not extracted now) with a single bulk insert
+        grouped = assign_feature_groups(group_features, stored_features)
+        group_versions = dict(stored_versions or {})
+        group_versions.update((group, versions[group]) for group in groups)
+        # Only complete, current results can serve as feature cache source
+        complete = group_versions == FEATURE_GROUP_VERSIONS
         async with async_session() as db:
-            # Save features to database
-            feature_count = 0
-            total_features = len(features)
-            
-            for feature_name, feature_value in features.items():
-                if isinstance(feature_value, (int, float)) and not (
-                    isinstance(feature_value, float) and (
-                        feature_value != feature_value or  # NaN check
-                        feature_value == float('inf') or 
-                        feature_value == float('-inf')
-                    )
-                ):
-                    feature_create = AudioFeatureCreate(
-                        feature_name=feature_name,
-                        feature_value=float(feature_value)
-                    )
-                    await create_feature(db, recording_id, feature_create)
-                    feature_count += 1
-            
-            # Commit the changes
-            await db.commit()
+            feature_count = await replace_features(
+                db, recording_id,
+                {name: value for name, (group, value) in grouped.items()},
+                PIPELINE_VERSION, cache_key if complete else None,
+                {name: group for name, (group, value) in grouped.items()},
+                group_versions,
+                current_cleaning_key,
+            )
+        total_features = len(features)
         
-        task_manager.update_task_progress(task_id, 0.9)
+        await task_manager.update_task_progress(task_id, 0.9)
         
         # Store cleaned audio path in result
         result = {
             "features_extracted": feature_count,
             "cleaned_audio_path": "/" + cleaned_path if not cleaned_path.startswith('/') else cleaned_path,
-            "original_features": total_features
+            "original_features": total_features,
+            "cache_hit": False,
+            "recomputed_groups": groups,
+            "streaming": streaming,
+            "skipped_groups": skipped_groups,
+            "feature_groups": partial_groups,
+            "stages": stages,
         }
         
-        task_manager.mark_task_completed(task_id, result)
+        await task_manager.mark_task_completed(task_id, result)
         
     except Exception as e:
-        task_manager.mark_task_failed(task_id, str(e))
+        await task_manager.mark_task_failed(task_id, str(e))
         print(f"Error processing audio: {e}")
         import traceback
         traceback.print_exc()
-        
-        task_manager.update_task_progress(task_id, 0.7)
-        
-        # Create new database session for background task
-        async with get_async_session() as db:
-            # Save features to database
-            feature_count = 0
-            total_features = len(features)
-            
-            for feature_name, feature_value in features.items():
-                if isinstance(feature_value, (int, float)) and not (
-                    isinstance(feature_value, float) and (
-                        feature_value != feature_value or  # NaN check
-                        feature_value == float('inf') or 
-                        feature_value == float('-inf')
-                    )
-                ):
-                    feature_create = AudioFeatureCreate(
-                        feature_name=feature_name,
-                        feature_value=float(feature_value)
-                    )
-                    await create_feature(db, recording_id, feature_create)
-                    feature_count += 1
-        
-        task_manager.update_task_progress(task_id, 0.9)
-        
-        # Store cleaned audio path in result
-        result = {
-            "features_extracted": feature_count,
-            "cleaned_audio_path": os.path.join("/uploads/recordings", os.path.basename(cleaned_path)),
-            "original_features": total_features
-        }
-        
-        task_manager.mark_task_completed(task_id, result)
-        
-    except Exception as e:
-        task_manager.mark_task_failed(task_id, str(e))
-        print(f"Error processing audio: {e}")
 
 @router.post("/process", status_code=status.HTTP_202_ACCEPTED)
 async def start_audio_processing(
@@ -137,10 +310,12 @@ async def start_audio_processing(
     assessment_id: int,
     recording_id: int,
     background_tasks: BackgroundTasks,
+    request: Optional[AudioProcessingRequest] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Start audio cleaning and feature extraction process in the background.
+    An optional body selects the feature groups to extract (default: all).
     Returns a task ID to track progress.
     """
     # Verify recording exists
@@ -150,16 +325,27 @@ async def start_audio_processing(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Recording not found"
         )
+
+    groups = request.groups if request is not None else None
+    if groups is not None:
+        try:
+            groups = validate_feature_groups(groups)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
     
     # Create task
-    task_id = task_manager.create_task()
+    task_id = await task_manager.create_task()
     
     # Start background processing
     background_tasks.add_task(
         process_audio_background,
         task_id, 
         recording_id, 
-        recording.file_path
+        recording.file_path,
+        groups,
     )
     
     return {
@@ -178,7 +364,7 @@ async def get_processing_status(
     """
     Get the status of an audio processing task.
     """
-    task_info = task_manager.get_task_dict(task_id)
+    task_info = await task_manager.get_task_dict(task_id)
     
     if not task_info:
         raise HTTPException(
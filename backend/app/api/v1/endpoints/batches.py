@@ -0,0 +1,193 @@
+# backend/app/api/v1/endpoints/batches.py
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_db
+from app.api.v1.endpoints.audio_processing import process_audio_background
+from app.crud.audio_crud import get_recordings_in_scope
+from app.schemas.batch_schema import BatchScope
+from app.services.pipeline_config import PIPELINE_VERSION, FEATURE_GROUP_VERSIONS, cleaning_key
+from app.services.extraction_pool import EXTRACTION_WORKERS
+from app.services.task_manager import task_manager, TaskStatus
+
+router = APIRouter(
+    prefix="/batches",
+    tags=["batches"],
+)
+
+# Recordings processed at once across all batch jobs; more would only queue
+# inside the extraction pool while holding memory and task slots
+BATCH_CONCURRENCY = int(os.getenv("BATCH_PROCESSING_CONCURRENCY", EXTRACTION_WORKERS))
+_batch_slots = asyncio.Semaphore(max(1, BATCH_CONCURRENCY))
+# Minimum time between progress writes to the batch row; per-recording state
+# lives in the recordings' own task rows
+BATCH_PROGRESS_INTERVAL = float(os.getenv("BATCH_PROGRESS_INTERVAL_SECONDS", "1.0"))
+
+# (task ID, recording ID, file path) of a recording to process
+BatchItem = Tuple[str, int, str]
+
+
+def _update_throughput(state: Dict[str, Any], processed: int, started: float) -> Dict[str, Any]:
+    """Refresh the elapsed time and throughput of the current run."""
+    elapsed = time.monotonic() - started
+    state["elapsed_seconds"] = round(elapsed, 1)
+    state["recordings_per_minute"] = round(60 * processed / elapsed, 2) if elapsed > 0 else 0.0
+    return state
+
+
+async def run_batch(batch_id: str, state: Dict[str, Any], items: List[BatchItem]):
+    """Process the given items of a batch with bounded concurrency."""
+    started = time.monotonic()
+    processed = 0
+    last_publish = started
+    await task_manager.mark_task_running(batch_id)
+
+    async def publish():
+        nonlocal last_publish
+        if time.monotonic() - last_publish < BATCH_PROGRESS_INTERVAL:
+            return
+        last_publish = time.monotonic()
+        _update_throughput(state, processed, started)
+        progress = (state["completed"] + state["failed"]) / state["total"]
+        # Copy so the stored snapshot is not mutated by later updates
+        await task_manager.update_task_progress(batch_id, progress, dict(state))
+
+    async def run_item(task_id: str, recording_id: int, file_path: str):
+        nonlocal processed
+        async with _batch_slots:
+            try:
+                await process_audio_background(task_id, recording_id, file_path)
+                task = await task_manager.get_task(task_id)
+                completed = task is not None and task.status == TaskStatus.COMPLETED
+            except Exception as e:  # one recording must never stop the batch
+                await task_manager.mark_task_failed(task_id, str(e))
+                completed = False
+            state["completed" if completed else "failed"] += 1
+            processed += 1
+            await publish()
+
+    await asyncio.gather(*(run_item(*item) for item in items))
+    await task_manager.mark_task_completed(batch_id, _update_throughput(state, processed, started))
+
+
+@router.post("/", status_code=status.HTTP_202_ACCEPTED)
+async def start_batch_processing(
+    scope: BatchScope,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Process every recording in a scope (assessment, patient, task type,
+    unprocessed or outdated recordings) as one batch job.
+    Returns a batch ID to track aggregate progress.
+    """
+    recordings = await get_recordings_in_scope(
+        db, **scope.model_dump(), pipeline_version=PIPELINE_VERSION, group_versions=FEATURE_GROUP_VERSIONS,
+        cleaning_key=cleaning_key,
+    )
+    if not recordings:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No recordings match the batch scope"
+        )
+
+    batch_id = await task_manager.create_task()
+    # Each recording gets its own processing task, visible through /tasks/events
+    task_ids = await task_manager.create_batch_tasks(batch_id, [r.recording_id for r in recordings])
+    state = {
+        "scope": scope.model_dump(),
+        "pipeline_version": PIPELINE_VERSION,
+        "total": len(recordings),
+        "completed": 0,
+        "failed": 0,
+        "elapsed_seconds": 0.0,
+        "recordings_per_minute": 0.0,
+    }
+    await task_manager.update_task_progress(batch_id, 0.0, state)
+
+    items = [(task_id, r.recording_id, r.file_path) for task_id, r in zip(task_ids, recordings)]
+    background_tasks.add_task(run_batch, batch_id, dict(state), items)
+
+    return {
+        "batch_id": batch_id,
+        "total": len(recordings),
+        "task_ids": task_ids,
+        "message": "Batch processing started",
+        "status": "accepted"
+    }
+
+
+async def _get_batch(batch_id: str) -> Dict[str, Any]:
+    batch = await task_manager.get_task_dict(batch_id)
+    if not batch or not isinstance(batch["result"], dict) or "scope" not in batch["result"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch not found"
+        )
+    return batch
+
+
+@router.get("/{batch_id}")
+async def get_batch_status(batch_id: str):
+    """
+    Get aggregate progress, throughput and per-recording status of a batch job.
+    """
+    batch = await _get_batch(batch_id)
+    batch["result"]["items"] = [
+        {"recording_id": task.recording_id, "task_id": task.id, "status": task.status.value, "error": task.error}
+        for task in await task_manager.get_batch_tasks(batch_id)
+    ]
+    return batch
+
+
+@router.post("/{batch_id}/retry", status_code=status.HTTP_202_ACCEPTED)
+async def retry_batch(
+    batch_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Re-run the recordings of a finished batch that did not complete.
+    """
+    batch = await _get_batch(batch_id)
+    if batch["status"] in (TaskStatus.PENDING.value, TaskStatus.RUNNING.value):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Batch is still running"
+        )
+
+    tasks = await task_manager.get_batch_tasks(batch_id)
+    unfinished = [task for task in tasks if task.status != TaskStatus.COMPLETED]
+    # Recordings deleted since the batch ran stay failed
+    file_paths = {
+        r.recording_id: r.file_path
+        for r in await get_recordings_in_scope(db, recording_ids=[task.recording_id for task in unfinished])
+    }
+    items = [
+        (task.id, task.recording_id, file_paths[task.recording_id])
+        for task in unfinished if task.recording_id in file_paths
+    ]
+    if not items:
+        return {"batch_id": batch_id, "task_ids": [], "message": "Nothing to retry", "status": "completed"}
+
+    # Retried recordings keep their task IDs
+    await task_manager.restart_tasks(item[0] for item in items)
+    state = batch["result"]
+    state["completed"] = sum(task.status == TaskStatus.COMPLETED for task in tasks)
+    state["failed"] = len(tasks) - state["completed"] - len(items)
+    await task_manager.mark_task_running(batch_id)
+    await task_manager.update_task_progress(batch_id, (state["completed"] + state["failed"]) / state["total"], state)
+    background_tasks.add_task(run_batch, batch_id, dict(state), items)
+
+    return {
+        "batch_id": batch_id,
+        "task_ids": [item[0] for item in items],
+        "message": "Retrying failed recordings",
+        "status": "accepted"
+    }
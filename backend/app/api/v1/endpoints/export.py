@@ -1,108 +1,355 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from datetime import date, datetime, time, timedelta, timezone
+from typing import TYPE_CHECKING, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+import asyncio
 import csv
 import io
+import math
 
 from app.api.dependencies import get_db
+from app.core.database import async_session
 from app.models import Patient, CognitiveAssessment, AudioRecording, AudioFeature
 
+if TYPE_CHECKING:
+    import numpy as np
+
 router = APIRouter(
     prefix="/export",
     tags=["export"],
 )
 
+# Rows fetched from the server-side cursor and written per CSV chunk
+EXPORT_CHUNK_ROWS = 2000
+
+FEATURE_CSV_HEADERS = [
+    'Patient ID',
+    'Study Identifier',
+    'Assessment ID',
+    'Assessment Type',
+    'Assessment Date',
+    'Recording ID',
+    'Recording Filename',
+    'Task Type',
+    'Recording Device',
+    'Recording Date',
+    'Feature Name',
+    'Feature Value',
+    'Feature Created At'
+]
+
+
+def _feature_rows_query():
+    """Flat join of features with their recording, assessment and patient columns."""
+    return (
+        select(
+            Patient.patient_id,
+            Patient.study_identifier,
+            CognitiveAssessment.assessment_id,
+            CognitiveAssessment.assessment_type,
+            CognitiveAssessment.assessment_date,
+            AudioRecording.recording_id,
+            AudioRecording.filename,
+            AudioRecording.task_type,
+            AudioRecording.recording_device,
+            AudioRecording.recording_date,
+            AudioFeature.feature_name,
+            AudioFeature.feature_value,
+            AudioFeature.created_at,
+        )
+        .select_from(AudioFeature)
+        .join(AudioRecording, AudioFeature.recording_id == AudioRecording.recording_id)
+        .join(CognitiveAssessment, AudioRecording.assessment_id == CognitiveAssessment.assessment_id)
+        .join(Patient, CognitiveAssessment.patient_id == Patient.patient_id)
+        .order_by(
+            AudioFeature.recording_id,
+            AudioFeature.feature_name
+        )
+    )
+
+
+def _format_feature_row(row) -> list:
+    """Convert one joined row into CSV cells."""
+    (patient_id, study_identifier, assessment_id, assessment_type, assessment_date,
+     recording_id, filename, task_type, recording_device, recording_date,
+     feature_name, feature_value, created_at) = row
+    return [
+        patient_id,
+        study_identifier or '',
+        assessment_id,
+        assessment_type or '',
+        assessment_date.isoformat() if assessment_date else '',
+        recording_id,
+        filename or '',
+        task_type or '',
+        recording_device or '',
+        recording_date.isoformat() if recording_date else '',
+        feature_name,
+        feature_value,
+        created_at.isoformat() if created_at else ''
+    ]
+
+
 @router.get("/features/csv")
 async def export_all_features_csv(
     db: AsyncSession = Depends(get_db),
 ):
     """
     Export all extracted audio features for all patients/assessments/recordings as CSV.
+
+    Rows are read through a server-side cursor and written to the response
+    in chunks as they arrive, so memory use does not grow with the dataset.
+    The cursor runs in a session of its own, opened and closed by the
+    response body: the request's session may be closed before the body is
+    sent.
     """
     try:
-        # Query all features with their related data
-        result = await db.execute(
-            select(AudioFeature)
-            .options(
-                selectinload(AudioFeature.recording)
-                .selectinload(AudioRecording.assessment)
-                .selectinload(CognitiveAssessment.patient)
-            )
-            .order_by(
-                AudioFeature.recording_id,
-                AudioFeature.feature_name
-            )
+        has_features = (await db.execute(select(AudioFeature.feature_id).limit(1))).first() is not None
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to export features: {e}"
         )
-        features = result.scalars().all()
-        
-        if not features:
-            raise HTTPException(
-                status_code=404, 
-                detail="No features found for export"
-            )
-        
-        # Create CSV in memory
+
+    if not has_features:
+        raise HTTPException(
+            status_code=404,
+            detail="No features found for export"
+        )
+
+    async def generate():
         output = io.StringIO()
         writer = csv.writer(output)
-        
-        # Write header
-        headers = [
-            'Patient ID',
-            'Study Identifier', 
-            'Assessment ID',
-            'Assessment Type',
-            'Assessment Date',
-            'Recording ID',
-            'Recording Filename',
-            'Task Type',
-            'Recording Device',
-            'Recording Date',
-            'Feature Name',
-            'Feature Value',
-            'Feature Created At'
-        ]
-        writer.writerow(headers)
-        
-        # Write data rows
-        for feature in features:
-            recording = feature.recording
-            assessment = recording.assessment
-            patient = assessment.patient
-            
-            row = [
-                patient.patient_id,
-                patient.study_identifier or '',
-                assessment.assessment_id,
-                assessment.assessment_type or '',
-                assessment.assessment_date.isoformat() if assessment.assessment_date else '',
-                recording.recording_id,
-                recording.filename or '',
-                recording.task_type or '',
-                recording.recording_device or '',
-                recording.recording_date.isoformat() if recording.recording_date else '',
-                feature.feature_name,
-                feature.feature_value,
-                feature.created_at.isoformat() if feature.created_at else ''
-            ]
-            writer.writerow(row)
-        
-        # Prepare file for download
+        writer.writerow(FEATURE_CSV_HEADERS)
+        async with async_session() as session:
+            result = await session.stream(
+                _feature_rows_query().execution_options(yield_per=EXPORT_CHUNK_ROWS)
+            )
+            try:
+                rows = await result.fetchmany(EXPORT_CHUNK_ROWS)
+                # The header goes out even if the features were deleted in the meantime
+                while rows or output.tell():
+                    writer.writerows(_format_feature_row(row) for row in rows)
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate(0)
+                    rows = await result.fetchmany(EXPORT_CHUNK_ROWS)
+            finally:
+                await result.close()
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=neurocapture_features_export.csv"}
+    )
+
+
+# ─── Wide-format feature matrix ───────────────────────────────────────────────
+
+MATRIX_METADATA_COLUMNS = [
+    'patient_id',
+    'study_identifier',
+    'assessment_id',
+    'assessment_type',
+    'assessment_date',
+    'recording_id',
+    'filename',
+    'task_type',
+    'recording_device',
+    'recording_date',
+]
+
+
+def _matrix_filters(
+    assessment_type: Optional[str],
+    task_type: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> list:
+    """SQL conditions selecting recordings for the feature matrix."""
+    conditions = []
+    if assessment_type:
+        conditions.append(CognitiveAssessment.assessment_type == assessment_type)
+    if task_type:
+        conditions.append(AudioRecording.task_type == task_type)
+    if start_date:
+        conditions.append(
+            CognitiveAssessment.assessment_date >= datetime.combine(start_date, time.min, tzinfo=timezone.utc)
+        )
+    if end_date:
+        conditions.append(
+            CognitiveAssessment.assessment_date
+            < datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        )
+    return conditions
+
+
+async def _build_feature_matrix(db: AsyncSession, conditions: list):
+    """
+    Pivot features into one row per recording.
+
+    Returns (metadata rows, feature names, values) where values is a float
+    array of shape (recordings, features) with NaN for missing features.
+    """
+    recordings_query = (
+        select(
+            Patient.patient_id,
+            Patient.study_identifier,
+            CognitiveAssessment.assessment_id,
+            CognitiveAssessment.assessment_type,
+            CognitiveAssessment.assessment_date,
+            AudioRecording.recording_id,
+            AudioRecording.filename,
+            AudioRecording.task_type,
+            AudioRecording.recording_device,
+            AudioRecording.recording_date,
+        )
+        .select_from(AudioRecording)
+        .join(CognitiveAssessment, AudioRecording.assessment_id == CognitiveAssessment.assessment_id)
+        .join(Patient, CognitiveAssessment.patient_id == Patient.patient_id)
+        .where(
+            AudioRecording.recording_id.in_(select(AudioFeature.recording_id)),
+            *conditions,
+        )
+        .order_by(AudioRecording.recording_id)
+    )
+    recordings = (await db.execute(recordings_query)).all()
+    row_index = {row.recording_id: i for i, row in enumerate(recordings)}
+
+    selected_features = (
+        select(AudioFeature.recording_id, AudioFeature.feature_name, AudioFeature.feature_value)
+        .join(AudioRecording, AudioFeature.recording_id == AudioRecording.recording_id)
+        .join(CognitiveAssessment, AudioRecording.assessment_id == CognitiveAssessment.assessment_id)
+        .where(*conditions)
+    )
+    feature_names = sorted(
+        (await db.execute(
+            select(selected_features.subquery().c.feature_name).distinct()
+        )).scalars().all()
+    )
+    column_index = {name: j for j, name in enumerate(feature_names)}
+
+    import numpy as np
+
+    # Columnar accumulator, filled from a server-side cursor
+    values = np.full((len(recordings), len(feature_names)), np.nan)
+    result = await db.stream(
+        selected_features.order_by(AudioFeature.feature_id).execution_options(yield_per=EXPORT_CHUNK_ROWS)
+    )
+    try:
+        async for chunk in result.partitions():
+            for recording_id, feature_name, feature_value in chunk:
+                i, j = row_index.get(recording_id), column_index.get(feature_name)
+                if i is not None and j is not None:  # skip rows added after the first queries
+                    values[i, j] = feature_value
+    finally:
+        await result.close()
+
+    return recordings, feature_names, values
+
+
+def _matrix_to_arrow(recordings, feature_names: List[str], values: 'np.ndarray'):
+    import pyarrow as pa
+
+    timestamp = pa.timestamp('us', tz='UTC')
+    metadata_types = [
+        pa.int64(), pa.string(), pa.int64(), pa.string(), timestamp,
+        pa.int64(), pa.string(), pa.string(), pa.string(), timestamp,
+    ]
+    columns = {
+        name: pa.array([row[i] for row in recordings], type=metadata_types[i])
+        for i, name in enumerate(MATRIX_METADATA_COLUMNS)
+    }
+    for j, name in enumerate(feature_names):
+        columns[name] = pa.array(values[:, j], type=pa.float64(), from_pandas=True)  # NaN -> null
+    return pa.table(columns)
+
+
+def _matrix_file(recordings, feature_names: List[str], values: 'np.ndarray', format: str) -> bytes:
+    """Parquet or Arrow IPC file of the matrix."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = _matrix_to_arrow(recordings, feature_names, values)
+    sink = io.BytesIO()
+    if format == "parquet":
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue()
+
+
+def _matrix_csv_chunks(recordings, feature_names: List[str], values: 'np.ndarray'):
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(MATRIX_METADATA_COLUMNS + feature_names)
+    for start in range(0, len(recordings), EXPORT_CHUNK_ROWS):
+        for row, row_values in zip(recordings[start:start + EXPORT_CHUNK_ROWS],
+                                   values[start:start + EXPORT_CHUNK_ROWS]):
+            metadata = [cell.isoformat() if isinstance(cell, datetime) else ('' if cell is None else cell)
+                        for cell in row]
+            writer.writerow(metadata + ['' if math.isnan(v) else repr(float(v)) for v in row_values])
+        yield output.getvalue()
         output.seek(0)
-        
-        def generate():
-            yield output.getvalue()
-        
-        return StreamingResponse(
-            generate(),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=neurocapture_features_export.csv"}
+        output.truncate(0)
+
+
+@router.get("/features/matrix")
+async def export_feature_matrix(
+    format: Literal["parquet", "arrow", "csv"] = Query("parquet", description="Output format"),
+    assessment_type: Optional[str] = None,
+    task_type: Optional[str] = None,
+    start_date: Optional[date] = Query(None, description="Earliest assessment date (inclusive)"),
+    end_date: Optional[date] = Query(None, description="Latest assessment date (inclusive)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Export features as a recording × feature matrix (one row per recording).
+
+    Parquet and Arrow IPC output require pyarrow; without it the matrix is
+    returned as CSV.
+    """
+    try:
+        recordings, feature_names, values = await _build_feature_matrix(
+            db, _matrix_filters(assessment_type, task_type, start_date, end_date)
         )
-        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to export features: {e}"
         )
+
+    if not recordings:
+        raise HTTPException(
+            status_code=404,
+            detail="No features found for export"
+        )
+
+    if format != "csv":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            format = "csv"
+
+    if format == "csv":
+        return StreamingResponse(
+            _matrix_csv_chunks(recordings, feature_names, values),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=neurocapture_feature_matrix.csv"}
+        )
+
+    # Serialized off the event loop: large matrices take a while
+    content = await asyncio.to_thread(_matrix_file, recordings, feature_names, values, format)
+    if format == "parquet":
+        media_type, extension = "application/vnd.apache.parquet", "parquet"
+    else:
+        media_type, extension = "application/vnd.apache.arrow.file", "arrow"
+
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=neurocapture_feature_matrix.{extension}"}
+    )
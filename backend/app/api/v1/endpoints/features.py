@@ -1,9 +1,16 @@
+from collections import Counter
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db
-from app.crud.audio_crud import get_features, create_feature, delete_feature
+from app.crud.audio_crud import (
+    get_recording,
+    get_features,
+    create_feature,
+    create_features_bulk,
+    delete_feature,
+)
 from app.schemas.audio_schema import AudioFeatureCreate, AudioFeatureRead
 
 router = APIRouter(
@@ -48,6 +55,49 @@ async def add_feature(
         )
 
 
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED
+)
+async def add_features_batch(
+    patient_id: int,
+    assessment_id: int,
+    recording_id: int,
+    features_in: List[AudioFeatureCreate],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Add many features to the given recording in a single INSERT.
+    NaN and infinite values are skipped; feature names must be unique.
+    """
+    if not await get_recording(db, recording_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Recording not found"
+        )
+
+    counts = Counter(feature.feature_name for feature in features_in)
+    duplicates = sorted(name for name, count in counts.items() if count > 1)
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate feature names: {duplicates}"
+        )
+
+    try:
+        created = await create_features_bulk(
+            db,
+            recording_id,
+            {feature.feature_name: feature.feature_value for feature in features_in},
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Could not create features: {e}"
+        )
+    return {"features_created": created}
+
+
 @router.delete(
     "/{feature_id}",
     status_code=status.HTTP_204_NO_CONTENT
@@ -1,4 +1,4 @@
-import os, shutil
+import os
 from uuid import uuid4
 from datetime import datetime, timezone
 
@@ -20,6 +20,7 @@ from app.crud.audio_crud import (
     delete_recording,
 )
 from app.schemas.audio_schema import AudioRecordingCreate, AudioRecordingRead
+from app.services.uploads import save_upload, UnsupportedAudioFormat, UploadTooLarge
 
 router = APIRouter(
     prefix="/patients/{patient_id}/assessments/{assessment_id}/recordings",
@@ -29,6 +30,8 @@ router = APIRouter(
 # where on disk we save files
 UPLOAD_DIR = os.getenv("AUDIO_UPLOAD_DIR", "uploads/recordings")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
+# largest accepted upload
+MAX_UPLOAD_SIZE_MB = float(os.getenv("MAX_UPLOAD_SIZE_MB", 100))
 
 
 @router.get(
@@ -64,13 +67,23 @@ async def upload_recording(
     recording_device: str | None = Form(None, title="Recording Device"),
     db: AsyncSession = Depends(get_db),
 ):
-    # save to disk
+    # save to disk off the event loop, validating and hashing the bytes on the way
     ext = os.path.splitext(file.filename)[1]
     unique_name = f"{uuid4().hex}{ext}"
     dest_path = os.path.join(UPLOAD_DIR, unique_name)
     try:
-        with open(dest_path, "wb") as out:
-            shutil.copyfileobj(file.file, out)
+        content_hash = await save_upload(file, dest_path, int(MAX_UPLOAD_SIZE_MB * 1024 * 1024))
+    except UnsupportedAudioFormat as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(e),
+        )
+    except UploadTooLarge as e:
+        # Literal: older Starlette only has HTTP_413_REQUEST_ENTITY_TOO_LARGE, newer deprecates it
+        raise HTTPException(
+            status_code=413,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -88,7 +101,7 @@ async def upload_recording(
 
     # insert into DB
     try:
-        db_obj = await create_audio_recording(db, assessment_id, audio_in)
+        db_obj = await create_audio_recording(db, assessment_id, audio_in, content_hash)
     except Exception as e:
         # if DB write fails, remove the file we just wrote
         os.remove(dest_path)
@@ -0,0 +1,110 @@
+# backend/app/api/v1/endpoints/tasks.py
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.services.task_manager import task_manager, TaskStatus
+
+router = APIRouter(
+    prefix="/tasks",
+    tags=["tasks"],
+)
+
+# How often a stream re-reads the task store for changes made by other API workers
+TASK_EVENTS_POLL_SECONDS = float(os.getenv("TASK_EVENTS_POLL_SECONDS", "1.0"))
+# Comment line sent on idle streams so proxies keep the connection open
+TASK_EVENTS_KEEPALIVE_SECONDS = 15.0
+
+FINISHED_STATUSES = (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _task_events(task_id: str, previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]) -> List[str]:
+    """SSE messages describing what changed between two snapshots of a task."""
+    if current is None:
+        return [_sse("error", {"task_id": task_id, "error": "Task not found"})]
+
+    messages = []
+    # Partial results, and final results, list the extracted groups under "feature_groups";
+    # groups finished since the previous snapshot are sent before the final state
+    result = current["result"] if isinstance(current["result"], dict) else {}
+    groups = result.get("feature_groups") or {}
+    previous_result = (previous or {}).get("result")
+    sent_groups = previous_result.get("feature_groups") or {} if isinstance(previous_result, dict) else {}
+    for group, features in groups.items():
+        if group not in sent_groups:
+            messages.append(_sse("features", {"task_id": task_id, "group": group, "features": features}))
+
+    stage = result.get("stage") if current["status"] not in FINISHED_STATUSES else None
+    progress = {"task_id": task_id, "status": current["status"], "progress": current["progress"], "stage": stage}
+    if previous is None or (previous["status"], previous["progress"]) != (current["status"], current["progress"]):
+        messages.append(_sse("progress", progress))
+
+    if current["status"] in FINISHED_STATUSES:
+        messages.append(_sse(current["status"], current))
+    return messages
+
+
+async def _stream_task_events(task_ids: List[str]):
+    snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+    pending = list(dict.fromkeys(task_ids))
+    last_sent = time.monotonic()
+
+    with task_manager.watch(pending) as changed:
+        while pending:
+            changed.clear()
+            # One store read for all followed tasks; unchanged tasks produce no events
+            tasks = await task_manager.get_task_dicts(pending)
+            for task_id in list(pending):
+                current = tasks.get(task_id)
+                if task_id in snapshots and current == snapshots[task_id]:
+                    continue
+                messages = _task_events(task_id, snapshots.get(task_id), current)
+                if messages:
+                    yield "".join(messages)
+                    last_sent = time.monotonic()
+                snapshots[task_id] = current
+                if current is None or current["status"] in FINISHED_STATUSES:
+                    pending.remove(task_id)
+            if not pending:
+                break
+            try:
+                await asyncio.wait_for(changed.wait(), TASK_EVENTS_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                if time.monotonic() - last_sent >= TASK_EVENTS_KEEPALIVE_SECONDS:
+                    yield ": keep-alive\n\n"
+                    last_sent = time.monotonic()
+
+
+@router.get("/events")
+async def stream_task_events(
+    task_id: List[str] = Query(..., description="Task IDs to follow (repeat the parameter for several tasks)"),
+):
+    """
+    Stream progress of one or more processing tasks as Server-Sent Events.
+
+    Events: `progress` (status, progress and current stage), `features`
+    (one feature group as soon as it is extracted), `completed` / `failed`
+    (final task state) and `error` (unknown task ID). The stream closes once
+    every task has finished.
+    """
+    if not task_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one task_id is required"
+        )
+
+    return StreamingResponse(
+        _stream_task_events(task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
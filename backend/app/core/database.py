@@ -22,6 +22,8 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession
 )
 
+from app.services.metrics import instrument_engine
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -46,6 +48,8 @@ engine = create_async_engine(
     pool_pre_ping=True,    # Verify connections before use
     pool_recycle=3600,     # Recycle connections every hour
 )
+# Count pool checkouts for the /metrics endpoint
+instrument_engine(engine)
 
 # Create async session factory
 async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
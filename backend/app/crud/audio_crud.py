@@ -1,17 +1,24 @@
 # backend/app/crud/audio_crud.py
 
-from typing import List, Any
+import math
+import numbers
+from typing import Callable, Iterable, List, Any, Literal, Mapping, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, delete, update, and_, or_
 from fastapi import HTTPException
 
-from app.models import AudioRecording as AudioModel, AudioFeature as FeatureModel
+from app.models import (
+    AudioRecording as AudioModel,
+    AudioFeature as FeatureModel,
+    CognitiveAssessment,
+)
 from app.schemas.audio_schema import (
     AudioRecordingCreate,
     AudioRecordingRead,
     AudioFeatureCreate,
     AudioFeatureRead,
 )
+from app.services.signal_cache import remove_cleaned_signals
 
 # ─── Recordings CRUD ─────────────────────────────────────────────────────────
 
@@ -26,12 +33,77 @@ async def get_recordings_for_assessment(
 async def get_recording(db: AsyncSession, recording_id: int) -> AudioModel | None:
     return await db.get(AudioModel, recording_id)
 
+async def get_recordings_in_scope(
+    db: AsyncSession,
+    assessment_id: Optional[int] = None,
+    patient_id: Optional[int] = None,
+    task_type: Optional[str] = None,
+    only: Literal["all", "unprocessed", "outdated"] = "all",
+    pipeline_version: Optional[str] = None,
+    group_versions: Optional[Mapping[str, str]] = None,
+    recording_ids: Optional[Iterable[int]] = None,
+    cleaning_key: Optional[Callable[[Optional[str]], str]] = None,
+) -> List[AudioModel]:
+    """
+    Recordings matching all given filters, ordered by ID.
+
+    `only="unprocessed"` keeps recordings without features; `only="outdated"`
+    keeps recordings with features from a pipeline other than `pipeline_version`,
+    cleaned with another key than `cleaning_key` (recording device -> current
+    cleaning key) or from feature groups whose version differs from `group_versions`.
+    Manually added features (without a group) do not make a recording outdated.
+    """
+    query = select(AudioModel)
+    if assessment_id is not None:
+        query = query.where(AudioModel.assessment_id == assessment_id)
+    if patient_id is not None:
+        query = query.join(
+            CognitiveAssessment, AudioModel.assessment_id == CognitiveAssessment.assessment_id
+        ).where(CognitiveAssessment.patient_id == patient_id)
+    if task_type is not None:
+        query = query.where(AudioModel.task_type == task_type)
+    if recording_ids is not None:
+        query = query.where(AudioModel.recording_id.in_(list(recording_ids)))
+
+    has_features = AudioModel.recording_id.in_(select(FeatureModel.recording_id))
+    if only == "unprocessed":
+        query = query.where(~has_features)
+    elif only == "outdated":
+        outdated = AudioModel.pipeline_version.is_(None) | (AudioModel.pipeline_version != pipeline_version)
+        if cleaning_key is not None:
+            # The cleaning key depends on the recording device
+            devices = (await db.execute(select(AudioModel.recording_device).distinct())).scalars().all()
+            outdated = outdated | or_(*(
+                and_(
+                    AudioModel.recording_device.is_(None) if device is None
+                    else AudioModel.recording_device == device,
+                    AudioModel.cleaning_key.is_distinct_from(cleaning_key(device)),
+                )
+                for device in devices
+            ))
+        if group_versions:
+            current_group = or_(*(
+                and_(FeatureModel.feature_group == group, FeatureModel.group_version == version)
+                for group, version in group_versions.items()
+            ))
+            extracted = FeatureModel.feature_group.is_not(None)
+            # Processed before features had groups, or with a group whose version changed
+            outdated = (
+                outdated
+                | ~AudioModel.recording_id.in_(select(FeatureModel.recording_id).where(extracted))
+                | AudioModel.recording_id.in_(select(FeatureModel.recording_id).where(extracted, ~current_group))
+            )
+        query = query.where(has_features, outdated)
+    result = await db.execute(query.order_by(AudioModel.recording_id))
+    return result.scalars().all()
+
 async def create_audio_recording(
     db: AsyncSession,
     assessment_id: int,
     obj_in: AudioRecordingCreate,
+    content_hash: Optional[str] = None,
 ) -> AudioModel:
-    db_obj = AudioModel(assessment_id=assessment_id, **obj_in.model_dump())
+    db_obj = AudioModel(assessment_id=assessment_id, content_hash=content_hash, **obj_in.model_dump())
     db.add(db_obj)
     await db.commit()
     await db.refresh(db_obj)
@@ -59,6 +131,9 @@ async def delete_recording(db: AsyncSession, recording_id: int) -> None:
             if os.path.exists(cleaned_path):
                 os.remove(cleaned_path)
                 print(f"Deleted cleaned audio file: {cleaned_path}")
+
+            # And the cached cleaned signals
+            remove_cleaned_signals(relative_path)
                 
     except Exception as file_error:
         print(f"Warning: Could not delete audio file {obj.file_path}: {file_error}")
@@ -86,6 +161,108 @@ async def create_feature(
     await db.refresh(db_obj)
     return db_obj
 
+async def create_features_bulk(
+    db: AsyncSession, recording_id: int, features: Mapping[str, Any]
+) -> int:
+    """
+    Insert all features of a recording with one multi-row INSERT in a
+    single transaction. NaN, infinite and non-numeric values are skipped.
+    Returns the number of features stored.
+    """
+    rows = _feature_rows(recording_id, features)
+    if rows:
+        await db.execute(insert(FeatureModel), rows)
+        await db.commit()
+    return len(rows)
+
+async def replace_features(
+    db: AsyncSession,
+    recording_id: int,
+    features: Mapping[str, Any],
+    pipeline_version: str,
+    cache_key: Optional[str] = None,
+    feature_groups: Optional[Mapping[str, str]] = None,
+    group_versions: Optional[Mapping[str, str]] = None,
+    cleaning_key: Optional[str] = None,
+) -> int:
+    """
+    Replace the extracted features of a recording with a fresh extraction and
+    record the pipeline version (feature cache key and cleaning key) that
+    produced them, in a single transaction. `feature_groups` maps feature names to their
+    extractor group and `group_versions` maps groups to their version;
+    both are stored with the features.
+
+    Features added manually (without a group) are kept, unless the
+    extraction produces a feature of the same name.
+    Returns the number of features stored.
+    """
+    feature_groups, group_versions = feature_groups or {}, group_versions or {}
+    rows = _feature_rows(recording_id, features)
+    for row in rows:
+        row["feature_group"] = feature_groups.get(row["feature_name"])
+        row["group_version"] = group_versions.get(row["feature_group"])
+    names = [row["feature_name"] for row in rows]
+    await db.execute(
+        delete(FeatureModel).where(
+            FeatureModel.recording_id == recording_id,
+            FeatureModel.feature_group.is_not(None) | FeatureModel.feature_name.in_(names),
+        )
+    )
+    if rows:
+        await db.execute(insert(FeatureModel), rows)
+    await db.execute(
+        update(AudioModel)
+        .where(AudioModel.recording_id == recording_id)
+        .values(
+            pipeline_version=pipeline_version,
+            feature_cache_key=cache_key,
+            feature_group_versions=dict(group_versions) or None,
+            cleaning_key=cleaning_key,
+        )
+    )
+    await db.commit()
+    return len(rows)
+
+async def find_cached_features_source(
+    db: AsyncSession, cache_key: str, exclude_recording_id: int
+) -> AudioModel | None:
+    """Another recording whose stored features were produced under `cache_key`."""
+    result = await db.execute(
+        select(AudioModel)
+        .where(
+            AudioModel.feature_cache_key == cache_key,
+            AudioModel.recording_id != exclude_recording_id,
+            AudioModel.recording_id.in_(select(FeatureModel.recording_id)),
+        )
+        .order_by(AudioModel.recording_id)
+        .limit(1)
+    )
+    return result.scalars().first()
+
+async def copy_features(
+    db: AsyncSession, source_recording_id: int, recording_id: int, pipeline_version: str, cache_key: str,
+    cleaning_key: Optional[str] = None,
+) -> int:
+    """Replace the extracted features of a recording with a copy of another recording's extracted features."""
+    source_recording = await get_recording(db, source_recording_id)
+    source = [f for f in await get_features(db, source_recording_id) if f.feature_group is not None]
+    return await replace_features(
+        db, recording_id,
+        {f.feature_name: f.feature_value for f in source},
+        pipeline_version, cache_key,
+        {f.feature_name: f.feature_group for f in source},
+        source_recording.feature_group_versions,
+        cleaning_key,
+    )
+
+def _feature_rows(recording_id: int, features: Mapping[str, Any]) -> List[dict]:
+    """Insert rows for the finite numeric features."""
+    return [
+        {"recording_id": recording_id, "feature_name": name, "feature_value": float(value)}
+        for name, value in features.items()
+        if isinstance(value, numbers.Real) and math.isfinite(value)
+    ]
+
 async def delete_feature(db: AsyncSession, feature_id: int) -> None:
     obj = await db.get(FeatureModel, feature_id)
     if not obj:
@@ -9,7 +9,11 @@ Author: NeuroCapture Development Team
 Version: 0.1.0
 """
 
-from fastapi import FastAPI
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -21,6 +25,31 @@ from app.api.v1.endpoints.recordings import router as recordings_router
 from app.api.v1.endpoints.features import router as features_router
 from app.api.v1.endpoints.audio_processing import router as audio_processing_router
 from app.api.v1.endpoints.export import router as export_router
+from app.api.v1.endpoints.tasks import router as tasks_router
+from app.api.v1.endpoints.batches import router as batches_router
+from app.services.extraction_pool import EXTRACTION_PRESTART, extraction_pool
+from app.services.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, render_metrics
+from app.services.task_manager import task_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    # Fail tasks left running by a previous (crashed or restarted) worker
+    try:
+        await task_manager.recover_orphaned_tasks()
+    except Exception as e:
+        print(f"Warning: Could not recover orphaned tasks: {e}")
+    # Periodically drop expired tasks and fail orphaned ones
+    cleanup = asyncio.create_task(task_manager.run_periodic_cleanup())
+    # Spawn and warm up feature extraction workers before the first recording arrives
+    if EXTRACTION_PRESTART:
+        extraction_pool.start()
+    yield
+    cleanup.cancel()
+    # Stop feature extraction worker processes
+    extraction_pool.shutdown(wait=False)
+
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -28,7 +57,8 @@ app = FastAPI(
     description="RESTful API for neurological assessment and audio analysis",
     version="0.1.0",
     docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc documentation
+    redoc_url="/redoc",  # ReDoc documentation
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware for frontend communication
@@ -40,6 +70,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _route_template(request: Request) -> str:
+    """Path of a matched request with path parameter values replaced by their names."""
+    scope = request.scope
+    if scope.get("endpoint") is None:
+        return "unmatched"
+    if "route" not in scope:
+        # Mounted app (static files): a single series below the mount point
+        return scope.get("root_path", "")[len(scope.get("app_root_path", "")):] + "/{path}"
+    segments = request.url.path.split("/")
+    position = 0
+    for name, value in request.path_params.items():
+        value = str(value)
+        # Parameters are in path order; each replaces the first matching segment after the previous one
+        while position < len(segments) and segments[position] != value:
+            position += 1
+        if position < len(segments):
+            segments[position] = "{" + name + "}"
+    return "/".join(segments)
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observe request latency per route template (not per URL, to bound the number of series)."""
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        HTTP_REQUEST_SECONDS.labels(
+            method=request.method, route=_route_template(request), status=status_code,
+        ).observe(time.perf_counter() - start)
+
 # Serve static files (audio recordings and uploads)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
@@ -54,6 +117,8 @@ app.include_router(recordings_router, prefix=API_V1_PREFIX, tags=["recordings"])
 app.include_router(features_router, prefix=API_V1_PREFIX, tags=["features"])
 app.include_router(audio_processing_router, prefix=API_V1_PREFIX, tags=["audio-processing"])
 app.include_router(export_router, prefix=API_V1_PREFIX, tags=["export"])
+app.include_router(tasks_router, prefix=API_V1_PREFIX, tags=["tasks"])
+app.include_router(batches_router, prefix=API_V1_PREFIX, tags=["batches"])
 
 @app.get("/")
 async def root():
@@ -63,3 +128,8 @@ async def root():
         "version": "0.1.0",
         "docs": "/docs"
     }
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: pipeline stages, request latency, DB pool and extraction queue."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
@@ -16,7 +16,7 @@ Author: NeuroCapture Development Team
 
 from sqlalchemy import (
     Column, Integer, String, Float, Text,
-    Date, DateTime, ForeignKey
+    Date, DateTime, ForeignKey, JSON
 )
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime, timezone
@@ -210,6 +210,17 @@ class AudioRecording(Base):
     recording_date = Column(DateTime(timezone=True), nullable=False)
     recording_device = Column(String(50), nullable=True)
     task_type = Column(String(100), nullable=True)  # e.g., "sentence reading", "spontaneous speech"
+    # SHA-256 of the uploaded file
+    content_hash = Column(String(64), nullable=True, index=True)
+    # Feature pipeline version of the stored features (None until processed)
+    pipeline_version = Column(String(20), nullable=True, index=True)
+    # Content hash + pipeline version + parameters of the stored features;
+    # recordings with the same key share identical features
+    feature_cache_key = Column(String(64), nullable=True, index=True)
+    # Pipeline version + cleaning parameters of the cleaned audio behind the stored features
+    cleaning_key = Column(String(64), nullable=True)
+    # {feature group: version} of the groups last extracted for this recording
+    feature_group_versions = Column(JSON, nullable=True)
     
     # Future feature relationships
     interpretation_id = Column(Integer, ForeignKey("interpretations.interpretation_id"), nullable=True)
@@ -253,12 +264,42 @@ class AudioFeature(Base):
     )
     feature_name = Column(String(50), nullable=False, index=True)
     feature_value = Column(Float, nullable=False)
+    # Extractor group and its version that produced the value (None for manually added features)
+    feature_group = Column(String(30), nullable=True)
+    group_version = Column(String(20), nullable=True)
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
 
     recording = relationship("AudioRecording", back_populates="features")
 
 
+class ProcessingTask(Base):
+    """
+    State of a background audio processing task.
+
+    Shared by all API workers so a task started by one worker can be polled
+    through any other, and kept across restarts. Rows expire after a
+    retention period. `owner` identifies the API process running the task:
+    tasks of a stopped process are marked failed on startup, and tasks
+    whose owner stopped refreshing them are marked failed by any worker.
+    The per-recording tasks of a batch job carry its `batch_id` and their
+    `recording_id`; the batch row itself only holds aggregate counts.
+    """
+    __tablename__ = "processing_tasks"
+
+    task_id = Column(String(36), primary_key=True)
+    status = Column(String(20), nullable=False, index=True)
+    progress = Column(Float, nullable=False, default=0.0)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False, index=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
+    owner = Column(String(200), nullable=True)
+    batch_id = Column(String(36), nullable=True, index=True)
+    recording_id = Column(Integer, nullable=True)
+
 
 class Interpretation(Base):
     __tablename__ = "interpretations"
@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 # ─── Audio Recording Schemas ─────────────────────────────────────────────────
 
@@ -19,6 +19,8 @@ class AudioRecordingCreate(AudioRecordingBase):
 class AudioRecordingRead(AudioRecordingBase):
     recording_id: int
     assessment_id: int
+    content_hash: Optional[str] = None
+    pipeline_version: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -36,7 +38,18 @@ class AudioFeatureCreate(AudioFeatureBase):
 class AudioFeatureRead(AudioFeatureBase):
     feature_id: int
     recording_id: int
+    feature_group: Optional[str] = None
+    group_version: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+# ─── Audio Processing Schemas ────────────────────────────────────────────────
+
+class AudioProcessingRequest(BaseModel):
+    groups: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        description="Feature groups to extract (e.g. timing, spectral); all groups when omitted",
+    )
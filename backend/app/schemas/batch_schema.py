@@ -0,0 +1,17 @@
+# backend/app/schemas/batch_schema.py
+
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+# ─── Batch Processing Schemas ─────────────────────────────────────────────────
+
+class BatchScope(BaseModel):
+    """Recordings to process; all given filters must match."""
+    assessment_id: Optional[int] = None
+    patient_id: Optional[int] = None
+    task_type: Optional[str] = Field(None, max_length=100)
+    only: Literal["all", "unprocessed", "outdated"] = Field(
+        "all",
+        description='"unprocessed": recordings without features; '
+                    '"outdated": recordings processed with an older pipeline version',
+    )
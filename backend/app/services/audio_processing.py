@@ -31,17 +31,111 @@ import parselmouth
 from parselmouth.praat import call
 import scipy.signal
 import scipy.stats
+import soundfile as sf
+import soxr
 import webrtcvad
 import os
 import warnings
-from typing import Dict, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Callable, Dict, Iterable, NamedTuple, Tuple, List, Optional
 from uuid import uuid4
 
+from app.services.metrics import StageCallback, StageTimer
+from app.services.pipeline_config import (  # noqa: F401 (re-exported)
+    ACOUSTIC_FEATURE_GROUPS,
+    FEATURE_GROUP_VERSIONS,
+    FEATURE_GROUPS,
+    NOISE_PROFILE_DIR,
+    NOISE_REDUCTION_MODE,
+    PIPELINE_PARAMS,
+    PIPELINE_VERSION,
+    PROSODIC_FEATURE_GROUPS,
+    RESAMPLE_QUALITY,
+    assign_feature_groups,
+    cleaning_key,
+    cleaning_params,
+    validate_feature_groups,
+)
+from app.services.signal_cache import (
+    load_cleaned_signal,
+    load_noise_profile,
+    noise_profile_path,
+    save_cleaned_signal,
+    save_noise_profile,
+)
+
 # Suppress warnings for cleaner output during processing
 warnings.filterwarnings('ignore')
 
+# Longest noise clip taken from the silences in "vad" mode
+NOISE_CLIP_SECONDS = 30.0
+# Threads filtering noise reduction chunks concurrently; results do not depend on it
+NOISE_REDUCTION_THREADS = int(os.getenv("NOISE_REDUCTION_THREADS", 1))
+# noisereduce's own chunking (reduce_noise defaults), reproduced chunk by chunk
+NOISE_CHUNK_SIZE = 600000
+NOISE_PADDING = 30000
+
+# on_group(group name, features of that group)
+GroupCallback = Callable[[str, Dict[str, float]], None]
+
 # --- Audio Preprocessing Functions ---
 
+# PCM WAV sample formats that can be memory-mapped, with their scale to [-1, 1)
+_MEMMAP_SUBTYPES = {
+    'PCM_16': ('<i2', 2.0 ** -15),
+    'PCM_32': ('<i4', 2.0 ** -31),
+    'FLOAT': ('<f4', None),
+    'DOUBLE': ('<f8', None),
+}
+
+
+def _wav_data_offset(file_path: str) -> Optional[int]:
+    """Byte offset of the sample data in a RIFF/WAVE file, or None."""
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            size = int.from_bytes(chunk[4:], 'little')
+            if chunk[:4] == b'data':
+                return f.tell()
+            # Chunks are word-aligned
+            f.seek(size + (size & 1), os.SEEK_CUR)
+
+
+def _read_mono(file_path: str) -> Tuple[np.ndarray, int]:
+    """
+    Decode a file to a mono float32 signal at its native rate.
+
+    PCM WAV is memory-mapped and converted channel by channel, other formats
+    readable by soundfile (FLAC, OGG, MP3, AIFF, ...) are decoded straight to
+    float32. Values are the same soundfile produces.
+    """
+    info = sf.info(file_path)
+    offset = _wav_data_offset(file_path) if info.format in ('WAV', 'WAVEX') else None
+    if offset is not None and info.subtype in _MEMMAP_SUBTYPES:
+        dtype, scale = _MEMMAP_SUBTYPES[info.subtype]
+        frames = np.memmap(file_path, dtype=dtype, mode='r', offset=offset,
+                           shape=(info.frames, info.channels))
+        audio_data = frames[:, 0].astype(np.float32)
+        for channel in range(1, info.channels):
+            # Cast in buffered chunks rather than a full-length temporary
+            np.add(audio_data, frames[:, channel], out=audio_data, dtype=np.float32, casting='unsafe')
+        if info.channels > 1:
+            audio_data /= np.float32(info.channels)
+        if scale is not None:
+            audio_data *= np.float32(scale)
+        return audio_data, info.samplerate
+
+    frames = sf.read(file_path, dtype='float32', always_2d=True)[0]
+    audio_data = frames[:, 0] if info.channels == 1 else frames.mean(axis=1)
+    return np.ascontiguousarray(audio_data), info.samplerate
+
+
 def load_audio(file_path: str, target_sr: int = 16000) -> Tuple[np.ndarray, int]:
     """
     Load audio file and convert to standardized format.
@@ -54,10 +148,20 @@ def load_audio(file_path: str, target_sr: int = 16000) -> Tuple[np.ndarray, int]
         Tuple of (audio_data, sample_rate)
         
     Note:
-        Automatically converts to mono and resamples to target rate.
-        Supports multiple formats: WAV, MP3, FLAC, etc.
+        Automatically converts to mono and resamples to target rate
+        (soxr, RESAMPLE_QUALITY); files already at the target rate are not
+        resampled. Supports multiple formats: WAV, MP3, FLAC, etc.
     """
-    audio_data, sr = librosa.load(file_path, sr=target_sr, mono=True)
+    try:
+        audio_data, sr = _read_mono(file_path)
+    except sf.SoundFileRuntimeError:
+        audio_data, sr = librosa.load(file_path, sr=None, mono=True)
+    if sr != target_sr:
+        # Same output length as librosa.resample
+        n_samples = int(np.ceil(len(audio_data) * target_sr / sr))
+        audio_data = librosa.util.fix_length(
+            soxr.resample(audio_data, sr, target_sr, quality=RESAMPLE_QUALITY), size=n_samples
+        )
     return audio_data, target_sr
 
 def normalize_audio(audio_data: np.ndarray, target_rms: float = 0.1) -> np.ndarray:
@@ -81,13 +185,32 @@ def normalize_audio(audio_data: np.ndarray, target_rms: float = 0.1) -> np.ndarr
         return audio_data * scaling_factor
     return audio_data
 
-def reduce_noise(audio_data: np.ndarray, sr: int) -> np.ndarray:
+def _noise_reduction_args(noise_clip: Optional[np.ndarray]) -> Dict:
+    if noise_clip is None:
+        return {}
+    return {"stationary": True, "y_noise": noise_clip}
+
+def _reduce_noise_chunk(chunk: np.ndarray, sr: int, noise_clip: Optional[np.ndarray] = None) -> np.ndarray:
+    """Filter one padded chunk exactly as reduce_noise filters its internal chunks."""
+    try:
+        return nr.reduce_noise(y=chunk, sr=sr, chunk_size=len(chunk), padding=0,
+                               **_noise_reduction_args(noise_clip))
+    except Exception as e:
+        print(f"Warning: Noise reduction failed: {e}")
+        return chunk
+
+def reduce_noise(audio_data: np.ndarray, sr: int, noise_clip: Optional[np.ndarray] = None,
+                 n_threads: int = 1) -> np.ndarray:
     """
     Apply noise reduction to improve signal quality.
     
     Args:
         audio_data: Input audio signal
         sr: Sample rate
+        noise_clip: Optional noise-only samples (see estimate_noise_clip); when
+            given, stationary gating against their statistics is used instead
+            of the non-stationary noise floor estimate
+        n_threads: Threads filtering the signal's chunks concurrently
     
     Returns:
         Noise-reduced audio signal
@@ -95,14 +218,75 @@ def reduce_noise(audio_data: np.ndarray, sr: int) -> np.ndarray:
     Note:
         Uses spectral gating algorithm to identify and reduce
         stationary background noise while preserving speech.
+        Chunks are the padded chunks noisereduce uses internally, so the
+        result does not depend on n_threads.
     """
     try:
-        reduced_audio = nr.reduce_noise(y=audio_data, sr=sr)
-        return reduced_audio
+        num_samples = len(audio_data)
+        if n_threads <= 1 or num_samples <= NOISE_CHUNK_SIZE:
+            return nr.reduce_noise(y=audio_data, sr=sr, **_noise_reduction_args(noise_clip))
+
+        def filter_chunk(start: int) -> np.ndarray:
+            low, high = start - NOISE_PADDING, start + NOISE_CHUNK_SIZE + NOISE_PADDING
+            chunk = np.zeros(high - low)
+            read_low, read_high = max(low, 0), min(high, num_samples)
+            chunk[read_low - low:read_high - low] = audio_data[read_low:read_high]
+            reduced = _reduce_noise_chunk(chunk, sr, noise_clip)
+            return reduced[NOISE_PADDING:NOISE_PADDING + min(NOISE_CHUNK_SIZE, num_samples - start)]
+
+        # The FFTs release the GIL, so threads filter chunks in parallel
+        with ThreadPoolExecutor(n_threads) as executor:
+            reduced = list(executor.map(filter_chunk, range(0, num_samples, NOISE_CHUNK_SIZE)))
+        return np.concatenate(reduced).astype(audio_data.dtype)
     except Exception as e:
         print(f"Warning: Noise reduction failed: {e}")
         return audio_data
 
+def noise_clip_from_silences(silence_segments: Iterable[Tuple[float, float]],
+                             read: Callable[[int, int], np.ndarray], sr: int,
+                             max_seconds: float = NOISE_CLIP_SECONDS) -> Optional[np.ndarray]:
+    """
+    Noise-only samples for reduce_noise: the silence segments read with
+    read(start, stop) in order, up to max_seconds. None without silences.
+    """
+    parts, remaining = [], int(max_seconds * sr)
+    for start, end in silence_segments:
+        low = int(start * sr)
+        high = min(int(end * sr), low + remaining)
+        if high > low:
+            parts.append(read(low, high))
+            remaining -= high - low
+        if remaining <= 0:
+            break
+    return np.concatenate(parts) if parts else None
+
+def noise_profile(estimate: Callable[[], Optional[np.ndarray]],
+                  recording_device: Optional[str] = None) -> Optional[np.ndarray]:
+    """
+    Noise clip to clean a recording with under NOISE_REDUCTION_MODE.
+
+    None in "nonstationary" mode. In "vad" mode the clip comes from
+    `estimate`, unless NOISE_PROFILE_DIR is set and a clip was already
+    stored for the recording device, which is then reused.
+    """
+    if NOISE_REDUCTION_MODE != "vad":
+        return None
+    path = None
+    if NOISE_PROFILE_DIR and recording_device:
+        path = noise_profile_path(NOISE_PROFILE_DIR, recording_device, PIPELINE_PARAMS)
+        stored = load_noise_profile(path)
+        if stored is not None:
+            return stored
+    noise_clip = estimate()
+    if path is not None and noise_clip is not None:
+        save_noise_profile(path, noise_clip)
+    return noise_clip
+
+def estimate_noise_clip(audio_data: np.ndarray, sr: int) -> Optional[np.ndarray]:
+    """Noise clip cut from the silences extract_silences finds in audio_data."""
+    silences, _ = extract_silences(audio_data, sr)
+    return noise_clip_from_silences(silences, lambda start, stop: audio_data[start:stop], sr)
+
 def remove_extreme_peaks(audio_data: np.ndarray, k: int = 7, reduction_ratio: float = 0.99) -> np.ndarray:
     """
     Remove extreme peaks from audio data.
@@ -162,104 +346,270 @@ def extract_silences(audio_data: np.ndarray, sr: int, frame_duration: int = 30,
     if not (0 <= aggressiveness <= 3):
         raise ValueError("Aggressiveness must be between 0 and 3")
 
+    vad = webrtcvad.Vad(aggressiveness)
+    frame_size = int(sr * frame_duration / 1000)
+    is_speech = vad_frame_decisions(vad, audio_data, sr, frame_size)
+
+    return vad_segments(is_speech, frame_size, sr, len(audio_data) / sr,
+                        min_silence_duration, min_speech_duration)
+
+def vad_frame_decisions(vad: webrtcvad.Vad, audio_data: np.ndarray, sr: int, frame_size: int,
+                        previous: bool = False) -> np.ndarray:
+    """
+    Per-frame speech decisions of `vad` for consecutive frames of audio_data.
+
+    A frame the VAD cannot process keeps the previous decision (`previous`
+    for the first frame), i.e. it never starts or ends a segment. Trailing
+    samples that do not fill a frame are ignored.
+    """
     # Convert to int16 if needed
     if audio_data.dtype != np.int16:
         audio_data = convert_to_int16(audio_data)
+    audio_data = np.ascontiguousarray(audio_data)
 
-    vad = webrtcvad.Vad(aggressiveness)
-    frame_size = int(sr * frame_duration / 1000)
+    frame_bytes = frame_size * audio_data.itemsize
     num_frames = len(audio_data) // frame_size
 
-    # Use temporary lists to store all segments before filtering
-    temp_speech_segments = []
-    temp_silence_segments = []
-    voiced = False
-    start_time = 0
+    # Zero-copy byte view over the whole buffer; frames are slices of it
+    buffer = memoryview(audio_data).cast('B')
 
+    is_speech = np.zeros(num_frames, dtype=bool)
     for i in range(num_frames):
-        start_idx = i * frame_size
-        end_idx = start_idx + frame_size
-
-        frame = audio_data[start_idx:end_idx]
-        if len(frame) != frame_size:
-            frame = np.pad(frame, (0, frame_size - len(frame)), 'constant')
-
         try:
-            is_speech = vad.is_speech(frame.tobytes(), sr)
+            previous = vad.is_speech(buffer[i * frame_bytes:(i + 1) * frame_bytes], sr)
         except Exception as e:
             print(f"Error processing frame {i}: {e}")
-            continue
-
-        current_time = start_idx / sr
+        is_speech[i] = previous
+    return is_speech
 
-        if is_speech != voiced:
-            if is_speech:
-                start_time = current_time
-                if len(temp_silence_segments) == 0 and start_time > 0:
-                    temp_silence_segments.append((0, start_time))
-            else:
-                temp_speech_segments.append((start_time, current_time))
-            voiced = is_speech
-
-    # Handle the final segment
-    if voiced:
-        temp_speech_segments.append((start_time, len(audio_data) / sr))
-    elif len(temp_speech_segments) > 0:
-        temp_silence_segments.append((temp_speech_segments[-1][1], len(audio_data) / sr))
-    elif len(temp_speech_segments) == 0:
-        temp_silence_segments.append((0, len(audio_data) / sr))
-
-    # Add intermediate silence segments
-    if len(temp_speech_segments) > 1:
-        for i in range(1, len(temp_speech_segments)):
-            temp_silence_segments.append((temp_speech_segments[i-1][1], temp_speech_segments[i][0]))
+def vad_segments(is_speech: np.ndarray, frame_size: int, sr: int, total_duration: float,
+                 min_silence_duration: float = 0.5,
+                 min_speech_duration: float = 0.2) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+    """
+    Silence and speech segments (as in extract_silences) from per-frame VAD decisions.
+    """
+    num_frames = len(is_speech)
+
+    # Run-length encode the decisions into speech runs [start_frame, end_frame)
+    transitions = np.diff(np.concatenate(([0], is_speech.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(transitions == 1)
+    run_ends = np.flatnonzero(transitions == -1)
+
+    speech_starts = run_starts * frame_size / sr
+    speech_ends = run_ends * frame_size / sr
+    if run_ends.size and run_ends[-1] == num_frames:
+        # Speech continues to the end of the recording
+        speech_ends[-1] = total_duration
+
+    # Silences are the gaps around and between the speech runs
+    if speech_starts.size == 0:
+        silence_starts, silence_ends = np.array([0.0]), np.array([total_duration])
+    else:
+        silence_starts, silence_ends = speech_ends[:-1], speech_starts[1:]
+        # The leading silence ends at the first speech onset after t=0. When
+        # speech starts at t=0 it spans the first run and is folded into the
+        # following gap by the merge below.
+        first_onset = speech_starts[speech_starts > 0][:1]
+        if first_onset.size:
+            silence_starts = np.concatenate(([0.0], silence_starts))
+            silence_ends = np.concatenate((first_onset, silence_ends))
+        if run_ends[-1] < num_frames:
+            silence_starts = np.concatenate((silence_starts, speech_ends[-1:]))
+            silence_ends = np.concatenate((silence_ends, [total_duration]))
 
     # Filter segments based on duration thresholds
-    speech_segments = []
-    silence_segments = []
-
-    for start, end in temp_speech_segments:
-        duration = end - start
-        if duration >= min_speech_duration:
-            speech_segments.append((start, end))
-
-    for start, end in temp_silence_segments:
-        duration = end - start
-        if duration >= min_silence_duration:
-            silence_segments.append((start, end))
-
-    # Sort the filtered segments
-    speech_segments.sort(key=lambda x: x[0])
-    silence_segments.sort(key=lambda x: x[0])
-
-    # Merge adjacent silence segments if any gaps were created by filtering
-    if len(silence_segments) > 1:
-        merged_silence = []
-        current_start, current_end = silence_segments[0]
-
-        for start, end in silence_segments[1:]:
-            if start <= current_end:  # Overlapping or adjacent segments
-                current_end = max(current_end, end)
-            else:
-                merged_silence.append((current_start, current_end))
-                current_start, current_end = start, end
+    keep_speech = (speech_ends - speech_starts) >= min_speech_duration
+    speech_starts, speech_ends = speech_starts[keep_speech], speech_ends[keep_speech]
+
+    keep_silence = (silence_ends - silence_starts) >= min_silence_duration
+    silence_starts, silence_ends = silence_starts[keep_silence], silence_ends[keep_silence]
 
-        merged_silence.append((current_start, current_end))
-        silence_segments = merged_silence
+    # Merge overlapping or adjacent silence segments
+    if silence_starts.size > 1:
+        running_end = np.maximum.accumulate(silence_ends)
+        new_group = np.concatenate(([True], silence_starts[1:] > running_end[:-1]))
+        silence_starts = silence_starts[new_group]
+        silence_ends = np.maximum.reduceat(silence_ends, np.flatnonzero(new_group))
+
+    speech_segments = list(zip(speech_starts.tolist(), speech_ends.tolist()))
+    silence_segments = list(zip(silence_starts.tolist(), silence_ends.tolist()))
 
     return silence_segments, speech_segments
 
+# --- Shared Analysis Context ---
+
+def hop_block_energy(y: np.ndarray, hop_length: int) -> np.ndarray:
+    """
+    Sum of squared samples in each hop-length block of `y`, in float64 (the
+    last block may be partial). Used by AudioAnalysis.hop_energy and by the
+    streaming extractors, so batch and streamed energies are computed alike.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    num_full = len(y) // hop_length
+    full_blocks = y[:num_full * hop_length].reshape(num_full, hop_length)
+    energy = np.einsum('ij,ij->i', full_blocks, full_blocks)
+    if len(y) % hop_length:
+        tail = y[num_full * hop_length:]
+        energy = np.append(energy, np.dot(tail, tail))
+    return energy
+
+class AudioAnalysis:
+    """
+    Per-recording analysis context shared by all feature extractors.
+
+    Holds the preprocessed signal and lazily computes the intermediate
+    representations several extractors rely on: the librosa-side magnitude
+    STFT, mel spectrogram and framed signal, the Praat-side Sound,
+    Spectrum, Pitch, PointProcess, Intensity, Formant and Harmonicity
+    objects, and the VAD segmentation. Each representation is computed on
+    first access and reused afterwards, so nothing is recomputed for a
+    recording and analyses no extractor asks for are never computed.
+
+    Args:
+        audio_data: Preprocessed audio signal
+        sr: Sample rate
+        n_fft: FFT size shared by all spectral extractors (default: 2048)
+        hop_length: Hop size in samples (default: 512)
+        original_audio_data: Signal before preprocessing, used by the amplitude group
+    """
+
+    def __init__(self, audio_data: np.ndarray, sr: int, n_fft: int = 2048, hop_length: int = 512,
+                 original_audio_data: np.ndarray = None):
+        # The signal as given (extractors working on raw samples) and as float64 (analyses)
+        self.signal = audio_data
+        self.audio_data = np.asarray(audio_data, dtype=np.float64)
+        self.original_audio_data = original_audio_data
+        self.sr = sr
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self._frames: Dict[Tuple[int, int, str], np.ndarray] = {}
+
+    @cached_property
+    def stft_magnitude(self) -> np.ndarray:
+        """Magnitude STFT, shape (1 + n_fft // 2, n_frames)."""
+        return np.abs(librosa.stft(self.audio_data, n_fft=self.n_fft, hop_length=self.hop_length))
+
+    @cached_property
+    def mel_spectrogram(self) -> np.ndarray:
+        """Mel power spectrogram derived from the cached STFT."""
+        return librosa.feature.melspectrogram(S=self.stft_magnitude ** 2, sr=self.sr)
+
+    @cached_property
+    def log_mel_spectrogram(self) -> np.ndarray:
+        """Mel spectrogram in dB, as used by MFCC and onset strength."""
+        return librosa.power_to_db(self.mel_spectrogram)
+
+    @cached_property
+    def hop_energy(self) -> np.ndarray:
+        """Sum of squared samples in each hop-length block (the last block may be partial)."""
+        return hop_block_energy(self.audio_data, self.hop_length)
+
+    def frame_energy(self, frame_length: int, center: bool = False) -> np.ndarray:
+        """
+        Short-time energy (sum of squares) per frame, built from `hop_energy`.
+
+        Args:
+            frame_length: Frame size in samples; a multiple of hop_length
+                (an even multiple when centered)
+            center: If True, frames are centered on multiples of hop_length
+                with zero padding, as in librosa. Otherwise frames start at
+                every multiple of hop_length and are zero-padded past the end.
+        """
+        blocks_per_frame, remainder = divmod(frame_length, self.hop_length)
+        if remainder or (center and blocks_per_frame % 2):
+            raise ValueError("frame_length must be a multiple of hop_length")
+
+        if center:
+            lead = blocks_per_frame // 2
+            num_frames = 1 + len(self.audio_data) // self.hop_length
+        else:
+            lead = 0
+            num_frames = len(self.hop_energy)
+        if num_frames == 0:
+            return np.zeros(0)
+
+        padded = np.zeros(num_frames + blocks_per_frame - 1)
+        num_blocks = min(len(self.hop_energy), len(padded) - lead)
+        padded[lead:lead + num_blocks] = self.hop_energy[:num_blocks]
+        return np.lib.stride_tricks.sliding_window_view(padded, blocks_per_frame).sum(axis=1)
+
+    # Praat analyses (parselmouth)
+
+    @cached_property
+    def sound(self) -> parselmouth.Sound:
+        return parselmouth.Sound(self.audio_data, self.sr)
+
+    @cached_property
+    def spectrum(self) -> parselmouth.Spectrum:
+        return self.sound.to_spectrum()
+
+    @cached_property
+    def pitch(self) -> parselmouth.Pitch:
+        """Pitch track (75-500 Hz, 10 ms step)."""
+        return call(self.sound, "To Pitch", 0.01, 75, 500)
+
+    @cached_property
+    def point_process(self) -> parselmouth.Data:
+        """Glottal pulses derived from the shared pitch track."""
+        # Equivalent to "To PointProcess (periodic, cc)" with the same pitch range,
+        # which would otherwise compute its own pitch track internally
+        return call([self.sound, self.pitch], "To PointProcess (cc)")
+
+    @cached_property
+    def intensity(self) -> parselmouth.Intensity:
+        return self.sound.to_intensity()
+
+    @cached_property
+    def formant(self) -> parselmouth.Formant:
+        return self.sound.to_formant_burg(
+            time_step=0.01,
+            max_number_of_formants=5,
+            maximum_formant=6500
+        )
+
+    @cached_property
+    def harmonicity(self) -> parselmouth.Harmonicity:
+        """Autocorrelation HNR with a 60 Hz floor for elderly speakers."""
+        # time step, pitch floor, silence threshold, periods per window
+        return call(self.sound, "To Harmonicity (ac)", 0.01, 60, 0.1, 3.0)
+
+    def frames(self, frame_length: int = 2048, pad_mode: str = 'constant') -> np.ndarray:
+        """
+        Centered frames of the signal, shape (frame_length, n_frames).
+
+        Frames are strided views over a single padded copy of the signal and
+        are memoized per (frame_length, hop_length, pad_mode).
+        """
+        key = (frame_length, self.hop_length, pad_mode)
+        if key not in self._frames:
+            padded = np.pad(self.audio_data, frame_length // 2, mode=pad_mode)
+            self._frames[key] = librosa.util.frame(padded, frame_length=frame_length, hop_length=self.hop_length)
+        return self._frames[key]
+
+    @cached_property
+    def vad_segments(self) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """(silence segments, speech segments) from WebRTC VAD at 16 kHz."""
+        vad_audio = librosa.resample(self.signal, orig_sr=self.sr, target_sr=16000) if self.sr != 16000 else self.signal
+        return extract_silences(vad_audio, 16000)
+
+    def release(self, name: str) -> None:
+        """Drop a cached analysis (e.g. 'stft_magnitude', 'frames') to free its memory."""
+        if name == 'frames':
+            self._frames.clear()
+        else:
+            self.__dict__.pop(name, None)
+
 # --- Prosodic Feature Extraction Functions ---
 
-def _extract_timing_features(audio_data: np.ndarray, sr: int) -> Dict[str, float]:
+def _extract_timing_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract timing-related features using VAD."""
-    features = {}
+    silence_segments, speech_segments = analysis.vad_segments
+    return timing_features(silence_segments, speech_segments, len(analysis.signal) / analysis.sr)
 
-    # Prepare audio for VAD
-    vad_audio = librosa.resample(audio_data, orig_sr=sr, target_sr=16000) if sr != 16000 else audio_data
-
-    # Get speech and silence segments
-    silence_segments, speech_segments = extract_silences(vad_audio, 16000)
+def timing_features(silence_segments: List[Tuple[float, float]], speech_segments: List[Tuple[float, float]],
+                    total_duration: float) -> Dict[str, float]:
+    """Timing features of a recording from its VAD silence and speech segments."""
+    features = {}
 
     # Filter silence segments between speech
     filtered_silence_segments = [
@@ -273,7 +623,6 @@ def _extract_timing_features(audio_data: np.ndarray, sr: int) -> Dict[str, float
     # Calculate speech segment durations
     speech_durations = [end - start for start, end in speech_segments]
 
-    total_duration = len(audio_data) / sr
     total_speech_duration = sum(speech_durations)
 
     features.update({
@@ -304,11 +653,11 @@ def _extract_timing_features(audio_data: np.ndarray, sr: int) -> Dict[str, float
 
     return features
 
-def _extract_rhythm_features(sound) -> Dict[str, float]:
+def _extract_rhythm_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract rhythm-related features including PVI measures."""
     features = {}
     try:
-        intensity = sound.to_intensity()
+        intensity = analysis.intensity
         intensity_values = intensity.values[0]
         time_step = intensity.get_time_step()
 
@@ -336,15 +685,21 @@ def _extract_rhythm_features(sound) -> Dict[str, float]:
 
     return features
 
-def _extract_tempo_beat_features(audio_data: np.ndarray, sr: int) -> Dict[str, float]:
+def _extract_tempo_beat_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract tempo and beat-related features."""
     features = {}
+    sr, hop_length = analysis.sr, analysis.hop_length
     try:
-        # Estimate tempo and beat frames
-        tempo, beat_frames = librosa.beat.beat_track(y=audio_data, sr=sr, hop_length=512, trim=False)
+        # Estimate tempo and beat frames from the shared mel spectrogram
+        onset_envelope = librosa.onset.onset_strength(
+            S=analysis.log_mel_spectrogram, sr=sr, hop_length=hop_length, aggregate=np.median
+        )
+        tempo, beat_frames = librosa.beat.beat_track(
+            onset_envelope=onset_envelope, sr=sr, hop_length=hop_length, trim=False
+        )
 
         # Convert beat frames to time
-        beat_times = librosa.frames_to_time(beat_frames, sr=sr, hop_length=512)
+        beat_times = librosa.frames_to_time(beat_frames, sr=sr, hop_length=hop_length)
 
         # Number of beats
         num_beats = len(beat_frames)
@@ -382,17 +737,12 @@ def _extract_tempo_beat_features(audio_data: np.ndarray, sr: int) -> Dict[str, f
 
     return features
 
-def _extract_energy_temporal_features(audio_data: np.ndarray, sr: int) -> Dict[str, float]:
+def _extract_energy_temporal_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract energy-based temporal features."""
     features = {}
     try:
-        # Compute Short-Time Energy (STE)
-        frame_length = 1024
-        hop_length = 512
-        energy = np.array([
-            np.sum(np.abs(audio_data[i:i+frame_length]**2))
-            for i in range(0, len(audio_data), hop_length)
-        ])
+        # Compute Short-Time Energy (STE) over 1024-sample frames every hop (512)
+        energy = analysis.frame_energy(1024)
 
         # Mean Energy
         features['energy_mean'] = np.mean(energy) if len(energy) > 0 else 0
@@ -419,44 +769,75 @@ def _extract_energy_temporal_features(audio_data: np.ndarray, sr: int) -> Dict[s
 
     return features
 
-def extract_prosodic_features(audio_data: np.ndarray, sr: int) -> Dict[str, float]:
+def _add_group(features: Dict[str, float], group: str, group_features: Dict[str, float],
+               on_group: Optional[GroupCallback]) -> None:
+    features.update(group_features)
+    if on_group is not None:
+        on_group(group, group_features)
+
+def _extract_groups(analysis: 'AudioAnalysis', groups: Iterable[str], on_group: Optional[GroupCallback],
+                    release: bool = False, on_stage: Optional[StageCallback] = None) -> Dict[str, float]:
+    """
+    Run the registered extractors of the given groups, in FEATURE_GROUPS order.
+
+    With `release`, each analysis is dropped once the last group requiring it
+    has run, so long recordings do not keep every representation in memory.
+    Each extractor is timed as the stage "extract.<group>", which includes
+    the shared analyses it is the first to require.
+    """
+    groups = [group for group in FEATURE_GROUPS if group in set(groups)]
+    last_use = {}
+    for group in groups:
+        for name in FEATURE_EXTRACTORS[group].requires:
+            last_use[name] = group
+
+    timer = StageTimer(on_stage)
+    features = {}
+    for group in groups:
+        with timer.stage(f"extract.{group}"):
+            group_features = FEATURE_EXTRACTORS[group].extract(analysis)
+        _add_group(features, group, group_features, on_group)
+        if release:
+            for name in [name for name, last in last_use.items() if last == group]:
+                analysis.release(name)
+    return features
+
+def extract_prosodic_features(audio_data: np.ndarray, sr: int, analysis: AudioAnalysis = None,
+                              on_group: Optional[GroupCallback] = None,
+                              groups: Iterable[str] = PROSODIC_FEATURE_GROUPS,
+                              on_stage: Optional[StageCallback] = None) -> Dict[str, float]:
     """
     Extract comprehensive prosodic features from audio data.
 
     Args:
         audio_data (array): Audio signal
         sr (int): Sampling rate
+        analysis (AudioAnalysis, optional): Shared analysis context for audio_data
+        on_group (callable, optional): Called with (group, features) as each feature group finishes
+        groups (iterable, optional): Feature groups to extract (default: all prosodic groups)
+        on_stage (callable, optional): Called with (stage, stats) as each extractor finishes (see StageTimer)
 
     Returns:
         dict: Dictionary containing all extracted features
     """
 
-    features = {}
-    sound = parselmouth.Sound(audio_data, sr)
-        
-    # 1. Timing and Speech/Silence Features
-    features.update(_extract_timing_features(audio_data, sr))
-
-    # 2. Rhythm Features
-    features.update(_extract_rhythm_features(sound))
+    if analysis is None:
+        analysis = AudioAnalysis(audio_data, sr)
 
-    # 3. Tempo and Beat Features
-    features.update(_extract_tempo_beat_features(audio_data, sr))
-
-    # 4. Energy-Based Temporal Features
-    features.update(_extract_energy_temporal_features(audio_data, sr))
-
-    return features
+    # Timing (VAD), rhythm, tempo/beat and energy-based temporal features
+    return _extract_groups(analysis, set(groups).intersection(PROSODIC_FEATURE_GROUPS), on_group,
+                           on_stage=on_stage)
 
 # --- Acoustic Feature Extraction Functions ---
 
-def _extract_voice_quality_features(sound) -> Dict[str, float]:
+def _extract_voice_quality_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract voice quality features including jitter, shimmer, and CPPS."""
     features = {}
 
     try:
         # Jitter and Shimmer
-        point_process = call(sound, "To PointProcess (periodic, cc)", 75, 500)
+        sound = analysis.sound
+        point_process = analysis.point_process
         features.update({
             'jitter_local': call(point_process, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3),
             'jitter_ppq5': call(point_process, "Get jitter (ppq5)", 0, 0, 0.0001, 0.02, 1.3),
@@ -465,7 +846,7 @@ def _extract_voice_quality_features(sound) -> Dict[str, float]:
         })
 
         # CPPS Analysis
-        spectrum = sound.to_spectrum()
+        spectrum = analysis.spectrum
         power_spectrum = np.abs(spectrum.values[0])**2
         cepstrum = np.fft.ifft(np.log(power_spectrum + 1e-10)).real
 
@@ -513,41 +894,74 @@ def _extract_amplitude_features(sound) -> Dict[str, float]:
 
     return features
 
-def _extract_formant_features(sound) -> Dict[str, float]:
+def _interpolate_frames(me, track: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of Praat's interpolated Sampled value lookup.
+
+    Args:
+        me: Praat Sampled object providing the frame grid (x1, dx, nx)
+        track: Per-frame values, NaN where undefined
+        times: Query times in seconds
+
+    Returns:
+        Linearly interpolated values at `times`, NaN where undefined. Like
+        `Formant.get_value_at_time`, falls back to the nearest frame when the
+        neighbouring frame is missing or undefined.
+    """
+    index = (times - me.x1) / me.dx + 1.0
+    left = np.floor(index).astype(np.int64)
+    phase = index - left
+    use_left = phase < 0.5
+    near = np.where(use_left, left, left + 1)
+    far = np.where(use_left, left + 1, left)
+    phase = np.where(use_left, phase, 1.0 - phase)
+
+    padded = np.concatenate(([np.nan], track, [np.nan]))  # 1-based with undefined edges
+    f_near = padded[np.clip(near, 0, me.nx + 1)]
+    f_far = padded[np.clip(far, 0, me.nx + 1)]
+    return np.where(np.isnan(f_far), f_near, f_near + phase * (f_far - f_near))
+
+def _formant_tracks(formant, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract F1-F4 frequency tracks and the F3 bandwidth track at `times`.
+
+    All frames are pulled out of the Formant object with a single Praat call
+    instead of one `get_value_at_time` call per formant and time step.
+
+    Returns:
+        Tuple of (frequencies with shape (4, len(times)), F3 bandwidths)
+    """
+    # Columns: time, nformants, F1, B1, F2, B2, ... (undefined formants are NaN)
+    table = call(formant, "Down to Table", False, True, 6, False, 3, True, 10, True)
+    frames = call(table, "Down to Matrix").values
+    if frames.ndim != 2 or frames.shape[0] != formant.nx:
+        raise ValueError("Unexpected formant table layout")
+
+    frequencies = np.vstack([
+        _interpolate_frames(formant, frames[:, 2 * formant_number], times)
+        for formant_number in range(1, 5)
+    ])
+    f3_bandwidths = _interpolate_frames(formant, frames[:, 7], times)
+    return frequencies, f3_bandwidths
+
+def _extract_formant_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract formant features (F1-F4) and their dynamics."""
     features = {}
     try:
-        formant = sound.to_formant_burg(
-            time_step=0.01,
-            max_number_of_formants=5,
-            maximum_formant=6500
-        )
-
-        formant_values = {i: [] for i in range(1, 5)}  # F1-F4
-        formant_deltas = {i: [] for i in range(1, 5)}  # Derivatives of F1-F4
-        f3_b3_values = []  # Bandwidth of F3
+        sound = analysis.sound
+        formant = analysis.formant
 
         times = np.arange(0, sound.duration, 0.01)
+        frequencies, f3_bandwidths = _formant_tracks(formant, times)
 
-        for t in times:
-            for formant_number in range(1, 5):
-                try:
-                    value = formant.get_value_at_time(formant_number, t)
-                    if value > 0:
-                        formant_values[formant_number].append(value)
-                        if len(formant_values[formant_number]) > 1:
-                            # Compute delta (difference between consecutive formant values)
-                            delta = value - formant_values[formant_number][-2]
-                            formant_deltas[formant_number].append(delta)
-                    if formant_number == 3:
-                        bandwidth = formant.get_bandwidth_at_time(formant_number, t)
-                        if bandwidth > 0:
-                            f3_b3_values.append(bandwidth)
-                except:
-                    continue
+        # Keep defined (positive) values per formant; deltas are differences
+        # between consecutive defined values
+        formant_values = {i: track[track > 0] for i, track in enumerate(frequencies, start=1)}  # F1-F4
+        formant_deltas = {i: np.diff(values) for i, values in formant_values.items()}  # Derivatives of F1-F4
+        f3_b3_values = f3_bandwidths[f3_bandwidths > 0]  # Bandwidth of F3
 
         for formant_number, values in formant_values.items():
-            if values:
+            if values.size:
                 prefix = f'F{formant_number}'
                 features.update({
                     f'{prefix}_mean': np.mean(values),
@@ -561,7 +975,7 @@ def _extract_formant_features(sound) -> Dict[str, float]:
                     features[f'{prefix}_coefficient_of_variation'] = np.std(values) / np.mean(values)
                 # Formant delta statistics
                 deltas = formant_deltas[formant_number]
-                if deltas:
+                if deltas.size:
                     features.update({
                         f'{prefix}_delta_mean': np.mean(deltas),
                         f'{prefix}_delta_std': np.std(deltas),
@@ -584,10 +998,10 @@ def _extract_formant_features(sound) -> Dict[str, float]:
                     features[f'{prefix}_coefficient_of_variation'] = 0
 
         # F3 Bandwidth (F3_B3)
-        features['F3_B3'] = np.mean(f3_b3_values) if f3_b3_values else 0
+        features['F3_B3'] = np.mean(f3_b3_values) if f3_b3_values.size else 0
 
         # F1 Standard Deviation (F1_sd)
-        if formant_values[1]:
+        if formant_values[1].size:
             features['F1_sd'] = np.std(formant_values[1])
         else:
             features['F1_sd'] = 0
@@ -614,8 +1028,15 @@ def _extract_formant_features(sound) -> Dict[str, float]:
 
     return features
 
-def _extract_complexity_features(audio_data: np.ndarray) -> Dict[str, float]:
-    """Extract complexity features including Higuchi Fractal Dimension."""
+def _extract_complexity_features(audio_data: np.ndarray, chunk_samples: int = 1 << 20) -> Dict[str, float]:
+    """
+    Extract complexity features including Higuchi Fractal Dimension.
+
+    Args:
+        audio_data: Preprocessed audio signal
+        chunk_samples: Upper bound on samples processed per HFD batch, which
+            keeps the temporary difference arrays bounded for long recordings
+    """
     features = {}
     try:
         window_sizes = [128, 256, 512, 1024]
@@ -623,15 +1044,20 @@ def _extract_complexity_features(audio_data: np.ndarray) -> Dict[str, float]:
 
         for window_size in window_sizes:
             num_windows = len(audio_data) // window_size
-            for i in range(num_windows):
-                start_idx = i * window_size
-                end_idx = start_idx + window_size
-                window_data = audio_data[start_idx:end_idx]
-                hfd = _calculate_hfd(window_data)
-                if not np.isnan(hfd):
-                    hfd_values.append(hfd)
-
-        if hfd_values:
+            if num_windows == 0:
+                continue
+
+            # Non-overlapping windows as a zero-copy (num_windows, window_size) view
+            windows = audio_data[:num_windows * window_size].reshape(num_windows, window_size)
+            windows_per_chunk = max(1, chunk_samples // window_size)
+
+            for start in range(0, num_windows, windows_per_chunk):
+                hfd = _calculate_hfd_batch(windows[start:start + windows_per_chunk])
+                hfd_values.append(hfd[~np.isnan(hfd)])
+
+        hfd_values = np.concatenate(hfd_values) if hfd_values else np.array([])
+
+        if hfd_values.size:
             features.update({
                 'HFD_mean': np.mean(hfd_values),
                 'HFD_max': np.max(hfd_values),
@@ -668,30 +1094,52 @@ def _calculate_hfd(signal: np.ndarray, kmax: int = 10) -> float:
     Returns:
         float: Higuchi Fractal Dimension
     """
-    N = len(signal)
-    L = np.zeros((kmax,))
-    x = np.zeros((kmax,))
+    return _calculate_hfd_batch(np.asarray(signal)[np.newaxis, :], kmax)[0]
 
-    for k in range(1, kmax + 1):
-        Lk = 0
-        for m in range(k):
-            indices = np.arange(1, int((N-m)/k))
-            Lmk = np.abs(signal[m + k*indices] - signal[m + k*(indices-1)]).sum()
-            Lmk = (Lmk * (N - 1) / (((N-m)/k)*k)) / k
-            Lk += Lmk
+def _calculate_hfd_batch(windows: np.ndarray, kmax: int = 10) -> np.ndarray:
+    """
+    Calculate the Higuchi Fractal Dimension of every row of a 2-D array.
 
-        L[k-1] = Lk / k
-        x[k-1] = np.log(1.0 / k)
+    Curve lengths L(k) are computed for all windows at once and the
+    log-log regression is solved in closed form across the batch.
 
-    p = np.polyfit(x, np.log(L), 1)
-    return p[0]
+    Args:
+        windows (array): Signal windows, shape (num_windows, window_size)
+        kmax (int): Maximum delay/lag (default=10)
 
-def _extract_spectral_features(sound, sr: int) -> Dict[str, float]:
+    Returns:
+        array: Fractal dimension per window (NaN where L(k) vanishes)
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    num_windows, N = windows.shape
+    L = np.zeros((num_windows, kmax))
+
+    for k in range(1, kmax + 1):
+        abs_diff = np.abs(windows[:, k:] - windows[:, :-k])
+        Lk = np.zeros(num_windows)
+        for m in range(k):
+            # Same increments as the per-window definition: int((N-m)/k) - 1 steps from m
+            num_steps = int((N - m) / k) - 1
+            Lmk = abs_diff[:, m:m + k * num_steps:k].sum(axis=1)
+            Lk += (Lmk * (N - 1) / (((N - m) / k) * k)) / k
+        L[:, k - 1] = Lk / k
+
+    # Least-squares slope of log L(k) against log(1/k) for every row
+    x = np.log(1.0 / np.arange(1, kmax + 1))
+    x_centered = x - x.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = np.log(L)
+        slopes = (y - y.mean(axis=1, keepdims=True)) @ x_centered / np.dot(x_centered, x_centered)
+    slopes[~np.isfinite(y).all(axis=1)] = np.nan
+    return slopes
+
+def _extract_spectral_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract spectral features including MFCCs, spectral slope, centroid, flux, roll-off, zero-crossing rate, and energy entropy."""
     features = {}
+    sr = analysis.sr
     try:
-        # Convert sound to spectrum
-        spectrum = sound.to_spectrum()
+        # Shared Praat spectrum
+        spectrum = analysis.spectrum
         spectral_values = spectrum.values[0]
         frequencies = np.linspace(0, sr / 2, len(spectral_values))
         
@@ -703,10 +1151,9 @@ def _extract_spectral_features(sound, sr: int) -> Dict[str, float]:
         spectral_centroid = np.sum(frequencies * np.abs(spectral_values)) / np.sum(np.abs(spectral_values))
         features['spectral_centroid'] = spectral_centroid
 
-        # MFCCs (using librosa)
-        audio_signal = sound.values[0]
+        # MFCCs (using librosa, from the shared mel spectrogram)
         n_mfcc = 30  # Increased number of MFCCs
-        mfccs = librosa.feature.mfcc(y=audio_signal, sr=sr, n_mfcc=n_mfcc, hop_length=512)
+        mfccs = librosa.feature.mfcc(S=analysis.log_mel_spectrogram, sr=sr, n_mfcc=n_mfcc)
         # Delta coefficients
         delta_mfccs = librosa.feature.delta(mfccs)
         # Delta-Delta coefficients
@@ -725,23 +1172,23 @@ def _extract_spectral_features(sound, sr: int) -> Dict[str, float]:
             features[f'delta2_mfcc_{i+1}_std'] = np.std(delta2_mfccs[i])
         
         # Spectral Flux
-        spectral_flux = librosa.onset.onset_strength(y=audio_signal, sr=sr, hop_length=512)
+        spectral_flux = librosa.onset.onset_strength(S=analysis.log_mel_spectrogram, sr=sr, hop_length=analysis.hop_length)
         features['spectral_flux_mean'] = np.mean(spectral_flux)
         features['spectral_flux_std'] = np.std(spectral_flux)
         
         # Spectral Roll-off
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=audio_signal, sr=sr, hop_length=512)
+        spectral_rolloff = librosa.feature.spectral_rolloff(S=analysis.stft_magnitude, sr=sr)
         features['spectral_rolloff_mean'] = np.mean(spectral_rolloff)
         features['spectral_rolloff_std'] = np.std(spectral_rolloff)
         
         # Zero-Crossing Rate
-        zero_crossing_rate = librosa.feature.zero_crossing_rate(y=audio_signal, hop_length=512)
+        zcr_frames = analysis.frames(2048, pad_mode='edge')
+        zero_crossing_rate = np.mean(librosa.zero_crossings(zcr_frames, axis=-2, pad=False), axis=-2)
         features['zero_crossing_rate_mean'] = np.mean(zero_crossing_rate)
         features['zero_crossing_rate_std'] = np.std(zero_crossing_rate)
         
         # Energy Entropy
-        stft = np.abs(librosa.stft(audio_signal, n_fft=2048, hop_length=512))
-        energy = np.sum(stft ** 2, axis=0)
+        energy = np.sum(analysis.stft_magnitude ** 2, axis=0)
         energy_norm = energy / np.sum(energy)
         energy_entropy = -np.sum(energy_norm * np.log2(energy_norm + 1e-12))  # Add epsilon to avoid log(0)
         features['energy_entropy'] = energy_entropy
@@ -765,16 +1212,13 @@ def _extract_spectral_features(sound, sr: int) -> Dict[str, float]:
         features.update({name: 0 for name in feature_names})
     return features
 
-def _extract_hnr_features(sound) -> Dict[str, float]:
+def _extract_hnr_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract Harmonics-to-Noise Ratio (HNR) using autocorrelation method with required parameters."""
     features = {}
-    pitch_floor = 60  # Adjusted pitch floor for elderly speakers
-    silence_threshold = 0.1  # Typical silence threshold value
-    periods_per_window = 3.0  # Periods per window
 
     try:
-        # Use autocorrelation method with silence threshold and periods per window
-        hnr = call(sound, "To Harmonicity (ac)", 0.01, pitch_floor, silence_threshold, periods_per_window)
+        # Autocorrelation HNR from the shared analysis context
+        hnr = analysis.harmonicity
 
         if hnr:
             frame_count = hnr.get_number_of_frames()
@@ -795,11 +1239,11 @@ def _extract_hnr_features(sound) -> Dict[str, float]:
 
     return features
 
-def _extract_pitch_features(sound) -> Dict[str, float]:
+def _extract_pitch_features(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract pitch features including mean and standard deviation of pitch."""
     features = {}
     try:
-        pitch = call(sound, "To Pitch", 0.01, 75, 500)
+        pitch = analysis.pitch
         features['pitch_mean'] = call(pitch, "Get mean", 0, 0, "Hertz")
         features['pitch_std'] = call(pitch, "Get standard deviation", 0, 0, "Hertz")
     except Exception as e:
@@ -824,12 +1268,12 @@ def _extract_additional_features(audio_data: np.ndarray) -> Dict[str, float]:
         features['TrajIntra'] = 0
     return features
 
-def _extract_avqi_hnr_sd(audio_data: np.ndarray, sr: int) -> Dict[str, float]:
+def _extract_avqi_hnr_sd(analysis: AudioAnalysis) -> Dict[str, float]:
     """Extract AVQI HNR_sd feature using RMS of the audio signal."""
     features = {}
     try:
-        # Calculate RMS energy using librosa
-        rms = librosa.feature.rms(y=audio_data)
+        # RMS over centered 2048-sample frames, from the shared short-time energy
+        rms = np.sqrt(analysis.frame_energy(2048, center=True) / 2048)
         features['AVQI_HNR_sd'] = np.std(rms)
     except Exception as e:
         print(f"Error in AVQI HNR_sd calculation: {e}")
@@ -856,7 +1300,56 @@ def _extract_amplitude_minimum(audio_data: np.ndarray) -> Dict[str, float]:
         features['Amplitude_Minimum'] = 0
     return features
 
-def extract_acoustic_features(audio_data: np.ndarray, sr: int, original_audio_data: np.ndarray = None) -> Dict[str, float]:
+def _extract_amplitude_group(analysis: AudioAnalysis) -> Dict[str, float]:
+    """Amplitude features of the original (unnormalized) signal when available."""
+    if analysis.original_audio_data is not None:
+        return _extract_amplitude_features(parselmouth.Sound(analysis.original_audio_data, analysis.sr))
+    return _extract_amplitude_features(analysis.sound)
+
+def _extract_amplitude_extrema(analysis: AudioAnalysis) -> Dict[str, float]:
+    features = _extract_amplitude_maximum_difference_mean(analysis.signal)
+    features.update(_extract_amplitude_minimum(analysis.signal))
+    return features
+
+# --- Extractor Registry ---
+
+class FeatureExtractor(NamedTuple):
+    """Extraction function of a feature group and the analyses it reads."""
+    extract: Callable[[AudioAnalysis], Dict[str, float]]
+    # AudioAnalysis representations used, including those they are derived from
+    requires: Tuple[str, ...]
+
+_STFT = ('stft_magnitude',)
+_LOG_MEL = _STFT + ('mel_spectrogram', 'log_mel_spectrogram')
+
+FEATURE_EXTRACTORS: Dict[str, FeatureExtractor] = {
+    'voice_quality': FeatureExtractor(
+        _extract_voice_quality_features, ('sound', 'pitch', 'point_process', 'spectrum')),
+    'formant': FeatureExtractor(_extract_formant_features, ('sound', 'formant')),
+    'spectral': FeatureExtractor(_extract_spectral_features, ('sound', 'spectrum', 'frames') + _LOG_MEL),
+    'hnr': FeatureExtractor(_extract_hnr_features, ('sound', 'harmonicity')),
+    'amplitude': FeatureExtractor(_extract_amplitude_group, ('sound',)),
+    'complexity': FeatureExtractor(lambda analysis: _extract_complexity_features(analysis.signal), ()),
+    'pitch': FeatureExtractor(_extract_pitch_features, ('sound', 'pitch')),
+    'additional': FeatureExtractor(lambda analysis: _extract_additional_features(analysis.signal), ()),
+    'avqi': FeatureExtractor(_extract_avqi_hnr_sd, ('hop_energy',)),
+    'amplitude_extrema': FeatureExtractor(_extract_amplitude_extrema, ()),
+    'timing': FeatureExtractor(_extract_timing_features, ('vad_segments',)),
+    'rhythm': FeatureExtractor(_extract_rhythm_features, ('sound', 'intensity')),
+    'tempo': FeatureExtractor(_extract_tempo_beat_features, _LOG_MEL),
+    'energy': FeatureExtractor(_extract_energy_temporal_features, ('hop_energy',)),
+}
+
+def required_analyses(groups: Iterable[str]) -> List[str]:
+    """Intermediate analyses computed when extracting the given feature groups."""
+    names = {name for group in groups for name in FEATURE_EXTRACTORS[group].requires}
+    return sorted(names)
+
+def extract_acoustic_features(audio_data: np.ndarray, sr: int, original_audio_data: np.ndarray = None,
+                              analysis: AudioAnalysis = None,
+                              on_group: Optional[GroupCallback] = None,
+                              groups: Iterable[str] = ACOUSTIC_FEATURE_GROUPS,
+                              on_stage: Optional[StageCallback] = None) -> Dict[str, float]:
     """
     Extract comprehensive acoustic features from audio data.
 
@@ -864,53 +1357,28 @@ def extract_acoustic_features(audio_data: np.ndarray, sr: int, original_audio_da
         audio_data (array): Preprocessed audio signal
         sr (int): Sampling rate
         original_audio_data (array, optional): Original audio signal before normalization
+        analysis (AudioAnalysis, optional): Shared analysis context for audio_data
+        on_group (callable, optional): Called with (group, features) as each feature group finishes
+        groups (iterable, optional): Feature groups to extract (default: all acoustic groups)
+        on_stage (callable, optional): Called with (stage, stats) as each extractor finishes (see StageTimer)
 
     Returns:
         dict: Dictionary containing all extracted features
     """
-    features = {}
-    sound = parselmouth.Sound(audio_data, sr)
-
-    # Voice Quality Features (Jitter, Shimmer, CPPS)
-    features.update(_extract_voice_quality_features(sound))
-
-    # Formant Features (Updated)
-    features.update(_extract_formant_features(sound))
-
-    # Spectral Features (Updated)
-    features.update(_extract_spectral_features(sound, sr))
-
-    # Harmonics-to-Noise Ratio (HNR)
-    features.update(_extract_hnr_features(sound))
-
-    # Amplitude Features (Extracted from original audio data)
-    if original_audio_data is not None:
-        original_sound = parselmouth.Sound(original_audio_data, sr)
-        features.update(_extract_amplitude_features(original_sound))
-    else:
-        features.update(_extract_amplitude_features(sound))
-
-    # Complexity Features (HFD)
-    features.update(_extract_complexity_features(audio_data))
-
-    # Pitch Features
-    features.update(_extract_pitch_features(sound))
-
-    # Additional Features (e.g., TrajIntra, Asymmetry)
-    features.update(_extract_additional_features(audio_data))
-
-    # AVQI HNR_sd Feature
-    features.update(_extract_avqi_hnr_sd(audio_data, sr))
-
-    # Amplitude Maximum Difference Mean
-    features.update(_extract_amplitude_maximum_difference_mean(audio_data))
-
-    # Amplitude Minimum
-    features.update(_extract_amplitude_minimum(audio_data))
-
-    return features
-
-def extract_all_features(audio_data: np.ndarray, sr: int, original_audio_data: np.ndarray = None) -> Dict[str, float]:
+    if analysis is None:
+        analysis = AudioAnalysis(audio_data, sr, original_audio_data=original_audio_data)
+    elif original_audio_data is not None:
+        analysis.original_audio_data = original_audio_data
+
+    # Voice quality, formant, spectral, HNR, amplitude, complexity (HFD), pitch,
+    # additional (TrajIntra, asymmetry), AVQI HNR_sd and amplitude extrema features
+    return _extract_groups(analysis, set(groups).intersection(ACOUSTIC_FEATURE_GROUPS), on_group,
+                           on_stage=on_stage)
+
+def extract_all_features(audio_data: np.ndarray, sr: int, original_audio_data: np.ndarray = None,
+                         on_group: Optional[GroupCallback] = None,
+                         groups: Iterable[str] = FEATURE_GROUPS,
+                         on_stage: Optional[StageCallback] = None) -> Dict[str, float]:
     """
     Extract both acoustic and prosodic features from audio data.
 
@@ -918,53 +1386,160 @@ def extract_all_features(audio_data: np.ndarray, sr: int, original_audio_data: n
         audio_data (array): Preprocessed audio signal
         sr (int): Sampling rate
         original_audio_data (array, optional): Original audio signal before normalization
+        on_group (callable, optional): Called with (group, features) as each feature group finishes
+        groups (iterable, optional): Feature groups to extract (default: all groups)
+        on_stage (callable, optional): Called with (stage, stats) as each extractor finishes (see StageTimer)
 
     Returns:
         dict: Dictionary containing all extracted features
     """
+    groups = validate_feature_groups(groups)
 
-    # Get acoustic features
-    features = extract_acoustic_features(audio_data, sr, original_audio_data)
-
-    # Get prosodic features
-    prosodic_features = extract_prosodic_features(audio_data, sr)
-
-    # Update features with prosodic features
-    features.update(prosodic_features)
+    # Shared spectral and Praat analysis context, computed once per recording;
+    # only the analyses required by the requested groups are computed
+    analysis = AudioAnalysis(audio_data, sr, original_audio_data=original_audio_data)
 
-    return features
+    # Acoustic then prosodic features
+    return _extract_groups(analysis, groups, on_group, release=True, on_stage=on_stage)
 
-def clean_and_extract_features(input_file_path: str, output_file_path: str = None) -> Tuple[Dict[str, float], str]:
+def clean_and_extract_features(input_file_path: str, output_file_path: str = None,
+                               on_group: Optional[GroupCallback] = None,
+                               groups: Iterable[str] = FEATURE_GROUPS,
+                               signal_cache_path: Optional[str] = None,
+                               recording_device: Optional[str] = None,
+                               on_stage: Optional[StageCallback] = None) -> Tuple[Dict[str, float], str]:
     """
     Main function to clean audio and extract features.
     
     Args:
         input_file_path: Path to the input audio file
         output_file_path: Optional path to save cleaned audio
+        on_group: Optional callback called with (group, features) as each feature group finishes
+        groups: Feature groups to extract (default: all groups)
+        signal_cache_path: Optional cleaned-signal cache entry (see app.services.signal_cache);
+            when it exists, decoding and cleaning are skipped, otherwise it is written
+        recording_device: Optional device name selecting a stored noise profile (see noise_profile)
+        on_stage: Optional callback called with (stage, stats) as each cleaning stage and
+            extractor finishes (see StageTimer)
         
     Returns:
         Tuple of (features dict, cleaned audio file path)
     """
-    # Load and preprocess audio
-    audio_data, sr = load_audio(input_file_path, target_sr=16000)
-    original_audio_data = audio_data.copy()
-    
-    # Apply preprocessing steps
-    audio_data = normalize_audio(audio_data)
-    audio_data = reduce_noise(audio_data, sr)
-    audio_data = remove_extreme_peaks(audio_data)
-    
+    groups = validate_feature_groups(groups)
+    timer = StageTimer(on_stage)
+    sr = PIPELINE_PARAMS["sample_rate"]
+
     # Save cleaned audio if output path is provided
     if output_file_path is None:
         # Generate a new filename with "cleaned" suffix
         base, ext = os.path.splitext(input_file_path)
         output_file_path = f"{base}_cleaned{ext}"
+
+    audio_data = None
+    if signal_cache_path:
+        audio_data = timer.run("load_cached_signal", load_cleaned_signal, signal_cache_path)
+    if audio_data is not None:
+        # Cleaned before with the same parameters; the original is only needed by the amplitude group
+        original_audio_data = None
+        if 'amplitude' in groups:
+            original_audio_data, _ = timer.run("load_audio", load_audio, input_file_path, target_sr=sr)
+        if not os.path.exists(output_file_path):
+            timer.run("write_cleaned", sf.write, output_file_path, audio_data, sr)
+        features = extract_all_features(audio_data, sr, original_audio_data, on_group=on_group, groups=groups,
+                                        on_stage=on_stage)
+        return features, output_file_path
+
+    # Load and preprocess audio
+    audio_data, sr = timer.run("load_audio", load_audio, input_file_path, target_sr=sr)
+    original_audio_data = audio_data.copy()
+    
+    # Apply preprocessing steps
+    audio_data = timer.run("normalize_audio", normalize_audio, audio_data)
+    noise_clip = timer.run(
+        "noise_profile", noise_profile, lambda: estimate_noise_clip(audio_data, sr), recording_device
+    )
+    audio_data = timer.run(
+        "reduce_noise", reduce_noise, audio_data, sr, noise_clip, n_threads=NOISE_REDUCTION_THREADS
+    )
+    audio_data = timer.run("remove_extreme_peaks", remove_extreme_peaks, audio_data)
     
     # Save cleaned audio
-    import soundfile as sf
-    sf.write(output_file_path, audio_data, sr)
+    timer.run("write_cleaned", sf.write, output_file_path, audio_data, sr)
+    if signal_cache_path:
+        timer.run("save_cached_signal", save_cleaned_signal, signal_cache_path, audio_data)
     
     # Extract features
-    features = extract_all_features(audio_data, sr, original_audio_data)
+    features = extract_all_features(audio_data, sr, original_audio_data, on_group=on_group, groups=groups,
+                                    on_stage=on_stage)
     
     return features, output_file_path
+
+def recompute_feature_groups(input_file_path: str, cleaned_file_path: str, groups: Iterable[str],
+                             on_group: Optional[GroupCallback] = None,
+                             signal_cache_path: Optional[str] = None,
+                             on_stage: Optional[StageCallback] = None) -> Dict[str, float]:
+    """
+    Re-extract selected feature groups from a previously cleaned recording.
+
+    Skips loading and cleaning: the cached cleaned signal is memory-mapped
+    when available, otherwise the cleaned audio saved by
+    clean_and_extract_features is read back (at its stored 16-bit
+    precision). The original file is only loaded for the amplitude group.
+
+    Args:
+        input_file_path: Path to the original audio file
+        cleaned_file_path: Path of the cleaned audio written by clean_and_extract_features
+        groups: Feature groups to extract
+        on_group: Optional callback called with (group, features) as each feature group finishes
+        signal_cache_path: Optional cleaned-signal cache entry (see app.services.signal_cache)
+        on_stage: Optional callback called with (stage, stats) as each loading stage and
+            extractor finishes (see StageTimer)
+
+    Returns:
+        Features of the requested groups
+    """
+    groups = set(groups)
+    sr = PIPELINE_PARAMS["sample_rate"]
+    timer = StageTimer(on_stage)
+    audio_data = None
+    if signal_cache_path:
+        audio_data = timer.run("load_cached_signal", load_cleaned_signal, signal_cache_path)
+    if audio_data is None:
+        audio_data, sr = timer.run("load_cleaned", sf.read, cleaned_file_path, dtype='float32')
+    original_audio_data = None
+    if 'amplitude' in groups:
+        original_audio_data, _ = timer.run("load_audio", load_audio, input_file_path, target_sr=sr)
+    return extract_all_features(audio_data, sr, original_audio_data, on_group=on_group, groups=groups,
+                                on_stage=on_stage)
+
+def _warm_up_signal(seconds: float, sr: int) -> np.ndarray:
+    """Deterministic voiced syllables separated by pauses over faint noise, as load_audio returns it."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sr)) / sr
+    f0 = 140 * (1 + 0.05 * np.sin(2 * np.pi * 5 * t))
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 10))
+    # 0.4 s syllables, with a pause long enough to count as a silence every second
+    syllables = ((t % 1.0) > 0.1) & ((t % 0.5) < 0.4)
+    signal = 0.3 * voiced * syllables + 0.003 * rng.standard_normal(len(t))
+    return signal.astype(np.float32)
+
+def warm_up(seconds: float = 3.0) -> float:
+    """
+    Run the cleaning steps and extract_all_features once on a short synthetic recording.
+
+    librosa's numba kernels are compiled (or loaded from the numba cache)
+    on first call; extraction workers call this at startup so that no
+    task pays that cost. Nothing is written to disk apart from the numba
+    cache. Returns the wall time in seconds.
+    """
+    timer = StageTimer()
+    sr = PIPELINE_PARAMS["sample_rate"]
+    with timer.stage("warm_up"):
+        original_audio_data = _warm_up_signal(seconds, sr)
+        audio_data = normalize_audio(original_audio_data)
+        noise_clip = estimate_noise_clip(audio_data, sr) if NOISE_REDUCTION_MODE == "vad" else None
+        audio_data = reduce_noise(audio_data, sr, noise_clip, n_threads=NOISE_REDUCTION_THREADS)
+        audio_data = remove_extreme_peaks(audio_data)
+        extract_all_features(audio_data, sr, original_audio_data)
+    return timer.stages["warm_up"]["seconds"]
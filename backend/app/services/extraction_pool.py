@@ -0,0 +1,199 @@
+# backend/app/services/extraction_pool.py
+
+import asyncio
+import importlib
+import inspect
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Mapping, Optional
+
+from app.services.metrics import EXTRACTION_QUEUE_DEPTH, EXTRACTION_TASKS_RUNNING
+
+# Number of worker processes used for CPU-bound feature extraction
+EXTRACTION_WORKERS = int(os.getenv("AUDIO_PROCESSING_WORKERS", os.cpu_count() or 1))
+# Run a synthetic recording through the pipeline when a worker starts, so
+# that librosa's numba kernels are compiled before the first task. Compiled
+# kernels are cached on disk in NUMBA_CACHE_DIR (numba's own setting), which
+# makes later warm-ups fast; point it at a persistent directory.
+EXTRACTION_WARMUP = os.getenv("EXTRACTION_WARMUP", "true").lower() == "true"
+# Start (and warm up) all workers when the API starts instead of on first use
+EXTRACTION_PRESTART = os.getenv("EXTRACTION_PRESTART", "true").lower() == "true"
+
+
+def _init_worker(warm_up: bool = False):
+    """Pre-import (and optionally warm up) the audio stack so no task pays the import or JIT cost."""
+    import app.services.audio_processing
+    import app.services.streaming  # noqa: F401
+
+    if warm_up:
+        try:
+            app.services.audio_processing.warm_up()
+        except Exception as e:
+            # A failed warm-up only leaves compilation to the first task
+            print(f"Warning: Extraction worker warm-up failed: {e}")
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+class WorkerFunction:
+    """
+    Picklable reference to a module-level function, imported when called.
+
+    Lets the API process submit audio processing functions to the pool
+    without importing the audio stack itself; only workers load it.
+    """
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.__name__ = name
+
+    def __call__(self, *args, **kwargs):
+        return getattr(importlib.import_module(self.module), self.__name__)(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<WorkerFunction {self.module}.{self.__name__}>"
+
+
+class _QueueCallback:
+    """Picklable callback that forwards its name and arguments to a manager queue."""
+
+    def __init__(self, events, name: str):
+        self.events = events
+        self.name = name
+
+    def __call__(self, *args):
+        self.events.put((self.name, args))
+
+
+def _run_with_events(func: Callable[..., Any], events, callback_names, args, kwargs) -> Any:
+    """Worker-side wrapper: inject the queue callbacks and signal completion."""
+    try:
+        callbacks = {name: _QueueCallback(events, name) for name in callback_names}
+        return func(*args, **callbacks, **kwargs)
+    finally:
+        events.put(None)
+
+
+class ExtractionPool:
+    """
+    Process pool that runs CPU-bound audio processing off the event loop.
+
+    Workers are spawned on first use, or all at once by `start`, and import
+    librosa/parselmouth once at startup, then warm them up (see
+    EXTRACTION_WARMUP). Several recordings submitted together are
+    processed in parallel, one per worker.
+    """
+
+    def __init__(self, max_workers: int = EXTRACTION_WORKERS, warm_up: bool = EXTRACTION_WARMUP):
+        self.max_workers = max(1, max_workers)
+        self.warm_up = warm_up
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._in_flight = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # "spawn" avoids forking a process that holds an event loop and DB connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.warm_up,),
+            )
+        return self._executor
+
+    def start(self) -> None:
+        """Spawn every worker now, in the background; tasks submitted meanwhile wait for the warm-up."""
+        for _ in range(self.max_workers):
+            self.executor.submit(_worker_ready)
+
+    def _track(self, change: int) -> None:
+        """Update the running and queued task gauges; tasks beyond max_workers wait in the executor."""
+        self._in_flight += change
+        EXTRACTION_TASKS_RUNNING.set(min(self._in_flight, self.max_workers))
+        EXTRACTION_QUEUE_DEPTH.set(max(self._in_flight - self.max_workers, 0))
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run `func(*args, **kwargs)` in a worker process and await its result."""
+        loop = asyncio.get_running_loop()
+        self._track(1)
+        try:
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        finally:
+            self._track(-1)
+
+    async def run_with_callback(
+        self,
+        func: Callable[..., Any],
+        *args,
+        callback_name: str,
+        callback: Callable[..., Any],
+        **kwargs,
+    ) -> Any:
+        """
+        Like `run`, but pass `func` a callback keyword argument that reaches the event loop.
+
+        Each call made in the worker to the `callback_name` argument is
+        forwarded to `callback` (awaited if it is a coroutine function), in
+        order and while `func` is still running.
+        """
+        return await self.run_with_callbacks(func, *args, callbacks={callback_name: callback}, **kwargs)
+
+    async def run_with_callbacks(
+        self,
+        func: Callable[..., Any],
+        *args,
+        callbacks: Mapping[str, Callable[..., Any]],
+        **kwargs,
+    ) -> Any:
+        """
+        Like `run_with_callback`, with one callback keyword argument per entry of `callbacks`.
+
+        Calls to all of them are forwarded in the order they were made.
+        """
+        if self._manager is None:
+            self._manager = multiprocessing.get_context("spawn").Manager()
+        events = self._manager.Queue()
+        loop = asyncio.get_running_loop()
+        self._track(1)
+        try:
+            future = loop.run_in_executor(
+                self.executor, partial(_run_with_events, func, events, list(callbacks), args, kwargs)
+            )
+            while True:
+                # Events are queued before the worker returns, so once it has finished
+                # an empty queue means every event was received
+                finished = future.done()
+                try:
+                    event = await loop.run_in_executor(None, partial(events.get, timeout=0.2))
+                except queue.Empty:
+                    if finished:  # worker died before signalling completion
+                        break
+                    continue
+                if event is None:
+                    break
+                name, event_args = event
+                result = callbacks[name](*event_args)
+                if inspect.isawaitable(result):
+                    await result
+            return await future
+        finally:
+            self._track(-1)
+
+    def shutdown(self, wait: bool = True):
+        """Stop all worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+# Global extraction pool instance
+extraction_pool = ExtractionPool()
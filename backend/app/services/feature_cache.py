@@ -0,0 +1,31 @@
+# backend/app/services/feature_cache.py
+
+import hashlib
+import json
+from typing import Any, Mapping
+
+# Bytes read per step when hashing audio files
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def feature_cache_key(content_hash: str, pipeline_version: str, params: Mapping[str, Any]) -> str:
+    """
+    Key identifying the features extracted from given audio content.
+
+    Recordings with equal keys have identical audio processed by the same
+    pipeline version with the same parameters, so their features are equal.
+    """
+    payload = json.dumps(
+        {"content": content_hash, "pipeline": pipeline_version, "params": params},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
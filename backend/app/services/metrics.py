@@ -0,0 +1,178 @@
+# backend/app/services/metrics.py
+"""
+Pipeline stage timers and process metrics in the Prometheus text format.
+
+StageTimer runs in the extraction workers: it times each named stage and
+reports it through an `on_stage(name, stats)` callback, which the
+extraction pool forwards to the API process. There the stats are stored
+in the task result and aggregated into the prometheus_client histograms
+below, served with request latency, database pool checkouts and
+extraction queue depth by the /metrics endpoint. Run several API workers
+with PROMETHEUS_MULTIPROC_DIR set so that endpoint reports all of them.
+
+Stage stats hold the wall time and the worker's resident memory after the
+stage. Peak traced allocations of each stage (tracemalloc, which sees
+NumPy buffers but not Praat's internal allocations) are added with
+STAGE_MEMORY_TRACING=true; tracing slows extraction down by about 15%.
+"""
+
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+# Trace allocations of every stage (about 15% slower extraction)
+STAGE_MEMORY_TRACING = os.getenv("STAGE_MEMORY_TRACING", "false").lower() == "true"
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+StageCallback = Callable[[str, Dict[str, float]], None]
+
+_MB = 2 ** 20
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident memory of this process, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StageTimer:
+    """
+    Times named pipeline stages, reporting each as it finishes.
+
+    Each stage's stats are {"seconds", "rss_mb"}, plus "peak_mb" (the peak
+    of memory allocated during the stage) when tracing memory. Tracing is
+    started on first use and left running for the rest of the process.
+    """
+
+    def __init__(self, on_stage: Optional[StageCallback] = None, trace_memory: bool = STAGE_MEMORY_TRACING):
+        self.on_stage = on_stage
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        yield
+        stats = {"seconds": round(time.perf_counter() - start, 4)}
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            stats["peak_mb"] = round((peak - before) / _MB, 1)
+        rss = _rss_bytes()
+        if rss is not None:
+            stats["rss_mb"] = round(rss / _MB, 1)
+        self.stages[name] = stats
+        if self.on_stage is not None:
+            self.on_stage(name, stats)
+
+    def run(self, name: str, func: Callable, *args, **kwargs):
+        """Call `func(*args, **kwargs)` as the stage `name` and return its result."""
+        with self.stage(name):
+            return func(*args, **kwargs)
+
+
+# --- Prometheus metrics ---
+
+# Shared directory of the per-process metric files of all API workers (see
+# prometheus_client multiprocess mode); unset serves this process's metrics
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+_SECONDS_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+_REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_BYTES_BUCKETS = tuple(mb * _MB for mb in (1, 4, 16, 64, 256, 512, 1024, 2048, 4096, 8192))
+
+STAGE_SECONDS = Histogram(
+    "neurocapture_stage_duration_seconds", "Wall time of audio pipeline stages", ["stage"],
+    buckets=_SECONDS_BUCKETS,
+)
+STAGE_PEAK_BYTES = Histogram(
+    "neurocapture_stage_peak_allocated_bytes",
+    "Peak memory allocated during audio pipeline stages (with STAGE_MEMORY_TRACING)", ["stage"],
+    buckets=_BYTES_BUCKETS,
+)
+STAGE_RSS_BYTES = Histogram(
+    "neurocapture_stage_resident_memory_bytes",
+    "Resident memory of the extraction worker after audio pipeline stages", ["stage"],
+    buckets=_BYTES_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "neurocapture_http_request_duration_seconds", "API request latency until the response starts",
+    ["method", "route", "status"], buckets=_REQUEST_BUCKETS,
+)
+DB_POOL_CHECKOUTS = Counter("neurocapture_db_pool_checkouts_total", "Database connections checked out of the pool")
+# Gauges of stopped workers are dropped in multiprocess mode ("livesum")
+DB_POOL_CHECKED_OUT = Gauge(
+    "neurocapture_db_pool_checked_out", "Database connections currently checked out",
+    multiprocess_mode="livesum",
+)
+EXTRACTION_TASKS_RUNNING = Gauge(
+    "neurocapture_extraction_tasks_running", "Extraction pool tasks being processed by a worker",
+    multiprocess_mode="livesum",
+)
+EXTRACTION_QUEUE_DEPTH = Gauge(
+    "neurocapture_extraction_queue_depth", "Extraction pool tasks waiting for a free worker",
+    multiprocess_mode="livesum",
+)
+
+
+def render_metrics() -> bytes:
+    """
+    All metrics in the Prometheus text format.
+
+    With PROMETHEUS_MULTIPROC_DIR set, the values of every API worker that
+    wrote to that directory are aggregated, so any worker answers /metrics
+    for all of them; otherwise only this process's values are reported.
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop the live gauges of a stopped API worker (gunicorn child_exit hook)."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
+
+
+def observe_stage(name: str, stats: Dict[str, float]) -> None:
+    """Add the stats of one pipeline stage, as reported by StageTimer, to the stage histograms."""
+    STAGE_SECONDS.labels(stage=name).observe(stats["seconds"])
+    if "peak_mb" in stats:
+        STAGE_PEAK_BYTES.labels(stage=name).observe(stats["peak_mb"] * _MB)
+    if "rss_mb" in stats:
+        STAGE_RSS_BYTES.labels(stage=name).observe(stats["rss_mb"] * _MB)
+
+
+def instrument_engine(engine) -> None:
+    """Count connection checkouts from the pool of a (sync or async) SQLAlchemy engine."""
+    from sqlalchemy import event
+
+    target = getattr(engine, "sync_engine", engine)
+
+    def on_checkout(*args):
+        DB_POOL_CHECKOUTS.inc()
+        DB_POOL_CHECKED_OUT.inc()
+
+    def on_checkin(*args):
+        DB_POOL_CHECKED_OUT.dec()
+
+    event.listen(target, "checkout", on_checkout)
+    event.listen(target, "checkin", on_checkin)
@@ -0,0 +1,123 @@
+# backend/app/services/pipeline_config.py
+"""
+Audio pipeline configuration and feature group registry.
+
+Everything the API process needs to schedule and store extractions, with
+no dependency on the audio stack (librosa, scipy, parselmouth, ...),
+which is only imported by the extraction workers. The names are
+re-exported by app.services.audio_processing.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Version of the cleaning pipeline stored with processed recordings; bump
+# whenever the cleaned audio changes (forces a full reprocess)
+PIPELINE_VERSION = "1"
+# soxr resampler quality used when a file is not at the pipeline sample rate
+# (QQ, LQ, MQ, HQ or VHQ; HQ is what librosa.load uses)
+RESAMPLE_QUALITY = os.getenv("RESAMPLE_QUALITY", "HQ").upper()
+# Noise reduction: "nonstationary" tracks the noise floor over the whole signal
+# (noisereduce default), "vad" gates against a noise clip cut from the
+# silences found by extract_silences
+NOISE_REDUCTION_MODE = os.getenv("NOISE_REDUCTION_MODE", "nonstationary").lower()
+if NOISE_REDUCTION_MODE not in ("nonstationary", "vad"):
+    raise ValueError(f"Unknown NOISE_REDUCTION_MODE: {NOISE_REDUCTION_MODE}")
+# Directory of per-recording-device noise clips reused in "vad" mode (unset: estimate per recording)
+NOISE_PROFILE_DIR = os.getenv("NOISE_PROFILE_DIR") or None
+# Pipeline parameters that affect extracted values (part of the feature cache key)
+PIPELINE_PARAMS = {
+    "sample_rate": 16000,
+    "resample_quality": RESAMPLE_QUALITY,
+    "noise_reduction": NOISE_REDUCTION_MODE,
+}
+
+# Feature groups in extraction order, reported through `on_group` callbacks
+ACOUSTIC_FEATURE_GROUPS = (
+    'voice_quality', 'formant', 'spectral', 'hnr', 'amplitude', 'complexity',
+    'pitch', 'additional', 'avqi', 'amplitude_extrema',
+)
+PROSODIC_FEATURE_GROUPS = ('timing', 'rhythm', 'tempo', 'energy')
+FEATURE_GROUPS = ACOUSTIC_FEATURE_GROUPS + PROSODIC_FEATURE_GROUPS
+# Groups that can be extracted block by block (app.services.streaming), in extraction order
+STREAMING_FEATURE_GROUPS = (
+    'formant', 'spectral', 'hnr', 'amplitude', 'complexity', 'pitch', 'additional', 'avqi',
+    'amplitude_extrema', 'timing', 'energy',
+)
+
+# Version of each feature group, stored with the features it produced; bump
+# a group's version when its values change so only that group is recomputed
+FEATURE_GROUP_VERSIONS = {
+    'voice_quality': "1",
+    'formant': "1",
+    'spectral': "1",
+    'hnr': "1",
+    'amplitude': "1",
+    'complexity': "1",
+    'pitch': "1",
+    'additional': "1",
+    'avqi': "1",
+    'amplitude_extrema': "1",
+    'timing': "1",
+    'rhythm': "1",
+    'tempo': "1",
+    'energy': "1",
+}
+# Versions stored for streamed groups. Groups approximated per block (Praat
+# analyses) or missing whole-recording features (spectral slope and
+# centroid) get their own tag, so they never pass for in-memory results
+STREAMING_FEATURE_GROUP_VERSIONS = {
+    group: FEATURE_GROUP_VERSIONS[group] + ("-stream" if group in ('formant', 'spectral', 'hnr', 'pitch') else "")
+    for group in STREAMING_FEATURE_GROUPS
+}
+
+
+def cleaning_params(recording_device: Optional[str] = None) -> Dict:
+    """PIPELINE_PARAMS, plus the recording device when its stored noise profile shapes the cleaned audio."""
+    if NOISE_REDUCTION_MODE == "vad" and NOISE_PROFILE_DIR and recording_device:
+        return {**PIPELINE_PARAMS, "noise_profile": recording_device}
+    return PIPELINE_PARAMS
+
+
+def cleaning_key(recording_device: Optional[str] = None) -> str:
+    """
+    Key of the pipeline version and cleaning parameters that produce a
+    recording's cleaned audio; stored features and cleaned files with
+    another key must be cleaned again.
+    """
+    payload = json.dumps(
+        {"pipeline": PIPELINE_VERSION, "params": cleaning_params(recording_device)},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def validate_feature_groups(groups: Iterable[str]) -> List[str]:
+    """Requested groups in extraction order; raises ValueError for unknown groups."""
+    groups = set(groups)
+    unknown = groups.difference(FEATURE_GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown feature groups: {sorted(unknown)}")
+    return [group for group in FEATURE_GROUPS if group in groups]
+
+
+def assign_feature_groups(group_features: Dict[str, Dict[str, float]],
+                          stored: Optional[Dict[str, Tuple[str, float]]] = None) -> Dict[str, Tuple[str, float]]:
+    """
+    Flatten per-group features into {name: (group, value)}.
+
+    Groups missing from `group_features` are taken from `stored` (a previous
+    result of this function). When several groups produce the same feature
+    name, the group extracted last wins, as in extract_all_features.
+    """
+    stored_groups: Dict[str, Dict[str, float]] = {}
+    for name, (group, value) in (stored or {}).items():
+        stored_groups.setdefault(group, {})[name] = value
+
+    features = {}
+    for group in FEATURE_GROUPS:
+        for name, value in group_features.get(group, stored_groups.get(group, {})).items():
+            features[name] = (group, value)
+    return features
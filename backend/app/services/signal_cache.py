@@ -0,0 +1,111 @@
+# backend/app/services/signal_cache.py
+"""
+Cache of cleaned audio signals and per-device noise profiles.
+
+The cleaned signal of a recording is stored as raw float32 `.npy` next to
+the upload, named after the upload and a key over its content hash and the
+cleaning parameters. Later extractions memory-map it instead of decoding,
+normalizing, denoising and peak-reducing the original again; unlike the
+`_cleaned` audio file it keeps full float32 precision, so features
+extracted from it equal those of a full run.
+
+Noise profiles (the noise clip used by VAD-guided noise reduction) can be
+kept per recording device, so recordings from one setup are cleaned
+against the same noise estimate.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from app.services.feature_cache import feature_cache_key
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _entries_pattern(prefix: str) -> str:
+    return f"{glob.escape(prefix)}.*.npy"
+
+
+def cleaned_signal_path(file_path: str, content_hash: str, pipeline_version: str,
+                        params: Mapping[str, Any]) -> str:
+    """Cache entry for the cleaned signal of an upload under the given cleaning parameters."""
+    base, _ = os.path.splitext(file_path)
+    key = feature_cache_key(content_hash, pipeline_version, params)
+    return f"{base}_cleaned.{key[:16]}.npy"
+
+
+def _load_array(path: str) -> Optional['np.ndarray']:
+    # Imported here so the API process (which only builds and removes paths) does not load NumPy
+    import numpy as np
+
+    try:
+        return np.asarray(np.load(path, mmap_mode='r'))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_array(path: str, audio_data: 'np.ndarray') -> None:
+    import numpy as np
+
+    # A temporary file per writer: concurrent saves of one entry each replace it whole
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.asarray(audio_data, dtype=np.float32))
+        # Readers never see a partially written entry
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _remove_entry(path: str) -> None:
+    # Another process may have removed it first
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def load_cleaned_signal(path: str) -> Optional['np.ndarray']:
+    """Memory-mapped, read-only cleaned signal, or None if the entry is missing or unreadable."""
+    return _load_array(path)
+
+
+def save_cleaned_signal(path: str, audio_data: 'np.ndarray') -> None:
+    """Store a cleaned signal, replacing entries of the same upload made with other parameters."""
+    _save_array(path, audio_data)
+    # Entries are named <prefix>.<key>.npy
+    for stale in glob.glob(_entries_pattern(path.rsplit('.', 2)[0])):
+        if stale != path:
+            _remove_entry(stale)
+
+
+def remove_cleaned_signals(file_path: str) -> None:
+    """Remove every cached cleaned signal of an upload."""
+    base, _ = os.path.splitext(file_path)
+    for entry in glob.glob(_entries_pattern(f"{base}_cleaned")):
+        _remove_entry(entry)
+
+
+def noise_profile_path(profile_dir: str, recording_device: str, params: Mapping[str, Any]) -> str:
+    """Noise profile entry of a recording device under the given cleaning parameters."""
+    payload = json.dumps({"device": recording_device, "params": params}, sort_keys=True)
+    return os.path.join(profile_dir, f"{hashlib.sha256(payload.encode()).hexdigest()[:16]}.npy")
+
+
+def load_noise_profile(path: str) -> Optional['np.ndarray']:
+    """Stored noise clip, or None if there is none yet."""
+    return _load_array(path)
+
+
+def save_noise_profile(path: str, noise_clip: 'np.ndarray') -> None:
+    """Store the noise clip of a recording device."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _save_array(path, noise_clip)
@@ -0,0 +1,884 @@
+# backend/app/services/streaming.py
+"""
+Bounded-memory streaming extraction for very long recordings.
+
+clean_and_extract_features keeps several full-length copies of a recording
+in memory (original, normalized, denoised and peak-reduced signals plus the
+float64 copies behind each analysis), so hour-long sessions need several GB
+per worker. The streaming pipeline reads the file in blocks, keeps the
+intermediate signal in a temporary file on disk and aggregates frame-level
+measurements with mergeable accumulators, so memory stays constant
+regardless of recording length.
+
+Cleaning follows the in-memory pipeline step by step; noise reduction is
+run on the same padded chunks noisereduce uses internally. Only feature
+groups built from frame- or sample-level measurements are available (see
+STREAMING_FEATURE_GROUPS); groups that need whole-signal analyses (point
+process, intensity PVI, beat tracking) are not, and the spectral group
+lacks the two features of the long-term spectrum. Praat-based groups
+(formant, hnr, pitch) are analysed per block with context on both sides
+and closely approximate the in-memory values. Groups whose streamed values
+differ from the in-memory ones are stored with their own version (see
+STREAMING_FEATURE_GROUP_VERSIONS), so they are recomputed by a later
+in-memory run.
+"""
+
+import math
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import librosa
+import numpy as np
+import parselmouth
+import soundfile as sf
+import soxr
+import webrtcvad
+from parselmouth.praat import call
+
+from app.services.audio_processing import (
+    FEATURE_GROUPS,
+    NOISE_CHUNK_SIZE,
+    NOISE_PADDING,
+    PIPELINE_PARAMS,
+    RESAMPLE_QUALITY,
+    GroupCallback,
+    _calculate_hfd_batch,
+    _formant_tracks,
+    _reduce_noise_chunk,
+    hop_block_energy,
+    noise_clip_from_silences,
+    noise_profile,
+    timing_features,
+    vad_frame_decisions,
+    vad_segments,
+)
+from app.services.metrics import StageCallback, StageTimer
+from app.services.pipeline_config import STREAMING_FEATURE_GROUPS
+
+# Approximate block length; blocks are rounded to whole VAD frames and HFD windows
+BLOCK_SECONDS = 60
+# Signal on each side of a block given to Praat analyses
+CONTEXT_SECONDS = 1.0
+HOP_LENGTH = 512
+N_FFT = 2048
+HFD_WINDOW_SIZES = (128, 256, 512, 1024)
+N_MELS = 128  # librosa.feature.melspectrogram default
+N_MFCC = 30
+# Frames of the delta filter (librosa.feature.delta default)
+DELTA_WIDTH = 9
+# STFT frames analysed at a time within a block
+STFT_SLICE_FRAMES = 256
+# Mel frames analysed at a time when the spectral group is finished
+MEL_CHUNK_FRAMES = 4096
+
+
+class OnlineStats:
+    """
+    Mergeable running statistics of a stream of values.
+
+    Keeps the count, mean and central moments M2-M4 (combined with the
+    pairwise update formulas of Chan and Pébay), min and max, and
+    optionally a fixed-bin histogram for quantiles, so blocks can be
+    summarized independently and merged in any order.
+
+    Args:
+        histogram_range: (low, high) range of the quantile histogram; values
+            outside are counted in the edge bins. No histogram when None.
+        bins: Number of histogram bins
+    """
+
+    def __init__(self, histogram_range: Optional[Tuple[float, float]] = None, bins: int = 1000):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.histogram_range = histogram_range
+        self.histogram = np.zeros(bins, dtype=np.int64) if histogram_range is not None else None
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a block of values."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        block = OnlineStats()
+        block.count = values.size
+        block.mean = float(values.mean())
+        centered = values - block.mean
+        squared = centered * centered
+        block.m2 = float(squared.sum())
+        block.m3 = float((squared * centered).sum())
+        block.m4 = float((squared * squared).sum())
+        block.min = float(values.min())
+        block.max = float(values.max())
+        if self.histogram is not None:
+            low, high = self.histogram_range
+            block.histogram_range = self.histogram_range
+            block.histogram = np.histogram(
+                np.clip(values, low, high), bins=len(self.histogram), range=self.histogram_range
+            )[0]
+        self.merge(block)
+
+    def merge(self, other: 'OnlineStats') -> None:
+        """Combine another accumulator into this one."""
+        if other.count == 0:
+            return
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta ** 2 * na * nb / n
+        m3 = (self.m3 + other.m3 + delta ** 3 * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * other.m2 - nb * self.m2) / n)
+        m4 = (self.m4 + other.m4 + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+              + 6 * delta ** 2 * (na * na * other.m2 + nb * nb * self.m2) / n ** 2
+              + 4 * delta * (na * other.m3 - nb * self.m3) / n)
+        self.mean += delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if self.histogram is not None and other.histogram is not None:
+            self.histogram += other.histogram
+
+    def var(self, ddof: int = 0) -> float:
+        return self.m2 / (self.count - ddof) if self.count > ddof else math.nan
+
+    def std(self, ddof: int = 0) -> float:
+        return math.sqrt(self.var(ddof))
+
+    def skewness(self) -> float:
+        """Biased sample skewness, as scipy.stats.skew."""
+        if self.count == 0 or self.m2 == 0:
+            return math.nan
+        return math.sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self) -> float:
+        """Biased excess (Fisher) kurtosis, as scipy.stats.kurtosis."""
+        if self.count == 0 or self.m2 == 0:
+            return math.nan
+        return self.count * self.m4 / self.m2 ** 2 - 3
+
+    def quantile(self, q: float) -> float:
+        """Quantile interpolated within the histogram bin that contains it."""
+        if self.histogram is None:
+            raise ValueError("OnlineStats was created without a histogram")
+        if self.count == 0:
+            return math.nan
+        cumulative = np.cumsum(self.histogram)
+        target = q * self.count
+        index = min(int(np.searchsorted(cumulative, target)), len(cumulative) - 1)
+        low, high = self.histogram_range
+        width = (high - low) / len(self.histogram)
+        before = cumulative[index - 1] if index else 0
+        fraction = (target - before) / self.histogram[index] if self.histogram[index] else 0.0
+        return min(max(low + (index + fraction) * width, self.min), self.max)
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+
+# --- Block I/O ---
+
+def _reblock(chunks: Iterable[np.ndarray], block_length: int) -> Iterator[np.ndarray]:
+    """Regroup chunks of any size into blocks of block_length (the last may be shorter)."""
+    pending: List[np.ndarray] = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= block_length:
+            buffer = np.concatenate(pending)
+            full = len(buffer) - len(buffer) % block_length
+            yield from buffer[:full].reshape(-1, block_length)
+            pending, size = [buffer[full:]], len(buffer) - full
+    if size:
+        yield np.concatenate(pending)
+
+
+def _read_blocks(file_path: str, sr: int, block_length: int) -> Iterator[np.ndarray]:
+    """Mono float32 blocks of a file resampled to sr, as load_audio would return them."""
+    def chunks():
+        with sf.SoundFile(file_path) as f:
+            resampler = None
+            if f.samplerate != sr:
+                # Same resampler load_audio uses
+                resampler = soxr.ResampleStream(f.samplerate, sr, 1, dtype='float32', quality=RESAMPLE_QUALITY)
+            while True:
+                frames = f.read(block_length, dtype='float32', always_2d=True)
+                last = len(frames) < block_length
+                mono = frames.mean(axis=1) if frames.shape[1] > 1 else frames[:, 0]
+                if resampler is not None:
+                    mono = resampler.resample_chunk(mono, last=last)
+                yield mono
+                if last:
+                    return
+    return _reblock(chunks(), block_length)
+
+
+def _with_context(blocks: Iterable[np.ndarray], context: int) -> Iterator[Tuple[np.ndarray, int, np.ndarray, np.ndarray]]:
+    """(block, start sample, left context, right context) for consecutive blocks."""
+    left = np.zeros(0, dtype=np.float32)
+    start = 0
+    current = None
+    for block in blocks:
+        if current is not None:
+            yield current, start, left, block[:context]
+            left = np.concatenate((left, current))[-context:]
+            start += len(current)
+        current = block
+    if current is not None:
+        yield current, start, left, current[:0]
+
+
+def _block_length(sr: int, block_seconds: float) -> int:
+    """Block size in samples: a multiple of VAD frames, HFD windows and the hop length."""
+    unit = math.lcm(int(sr * 30 / 1000), max(HFD_WINDOW_SIZES), HOP_LENGTH)
+    return max(1, int(block_seconds * sr) // unit) * unit
+
+
+# --- Block Extractors ---
+
+class _FrameEnergy:
+    """Streaming AudioAnalysis.frame_energy: sums of `width` consecutive hop energies."""
+
+    def __init__(self, width: int, lead: int):
+        self.width = width
+        self.tail = np.zeros(lead)
+        self.emitted = 0
+
+    def update(self, hop_energy: np.ndarray) -> np.ndarray:
+        sequence = np.concatenate((self.tail, hop_energy))
+        if len(sequence) < self.width:
+            self.tail = sequence
+            return np.zeros(0)
+        frames = np.lib.stride_tricks.sliding_window_view(sequence, self.width).sum(axis=1)
+        self.tail = sequence[len(frames):]
+        self.emitted += len(frames)
+        return frames
+
+    def finish(self, total_frames: int) -> np.ndarray:
+        """Remaining frames, zero-padded past the end of the signal."""
+        frames = self.update(np.zeros(self.width - 1))
+        return frames[:max(0, total_frames - (self.emitted - len(frames)))]
+
+
+class _BlockExtractor(ABC):
+    def __init__(self, sr: int):
+        self.sr = sr
+        self.samples = 0
+
+    def update(self, block: np.ndarray, start: int, left: np.ndarray, right: np.ndarray) -> None:
+        self.samples += len(block)
+
+    @abstractmethod
+    def result(self) -> Dict[str, float]:
+        """Features of the group over all blocks seen so far."""
+
+
+class _PraatBlockExtractor(_BlockExtractor):
+    """Runs a Praat analysis on each block with its context, in recording time."""
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        values = np.concatenate((left, block, right)).astype(np.float64)
+        sound = parselmouth.Sound(values, self.sr, start_time=(start - len(left)) / self.sr)
+        self.analyse(sound, start / self.sr, (start + len(block)) / self.sr)
+
+    @abstractmethod
+    def analyse(self, sound: parselmouth.Sound, core_start: float, core_end: float) -> None:
+        """Accumulate the analysis of `sound` between core_start and core_end (seconds)."""
+
+
+class _FormantExtractor(_PraatBlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.values = {i: OnlineStats(histogram_range=(0, 8000), bins=8000) for i in range(1, 5)}
+        self.deltas = {i: OnlineStats() for i in range(1, 5)}
+        self.last_values: Dict[int, np.ndarray] = {i: np.zeros(0) for i in range(1, 5)}
+        self.f3_bandwidths = OnlineStats()
+
+    def analyse(self, sound, core_start, core_end):
+        formant = sound.to_formant_burg(time_step=0.01, max_number_of_formants=5, maximum_formant=6500)
+        # The recording-wide 10 ms grid of _extract_formant_features, within this block
+        times = np.arange(math.ceil(core_start * 100 - 1e-9), math.ceil(core_end * 100 - 1e-9)) * 0.01
+        if times.size == 0:
+            return
+        frequencies, f3_bandwidths = _formant_tracks(formant, times)
+        for formant_number, track in enumerate(frequencies, start=1):
+            values = track[track > 0]
+            self.values[formant_number].update(values)
+            # Deltas between consecutive defined values continue across blocks
+            self.deltas[formant_number].update(np.diff(np.concatenate((self.last_values[formant_number], values))))
+            if values.size:
+                self.last_values[formant_number] = values[-1:]
+        self.f3_bandwidths.update(f3_bandwidths[f3_bandwidths > 0])
+
+    def result(self):
+        features = {}
+        for formant_number, values in self.values.items():
+            prefix = f'F{formant_number}'
+            if values.count:
+                features.update({
+                    f'{prefix}_mean': values.mean,
+                    f'{prefix}_std': values.std(),
+                    f'{prefix}_range': values.max - values.min,
+                    f'{prefix}_median': values.median(),
+                    f'{prefix}_skewness': values.skewness(),
+                    f'{prefix}_kurtosis': values.kurtosis(),
+                })
+                if formant_number == 4:
+                    features[f'{prefix}_coefficient_of_variation'] = values.std() / values.mean
+                deltas = self.deltas[formant_number]
+                if deltas.count:
+                    features.update({
+                        f'{prefix}_delta_mean': deltas.mean,
+                        f'{prefix}_delta_std': deltas.std(),
+                        f'{prefix}_delta_range': deltas.max - deltas.min,
+                    })
+            else:
+                features.update({
+                    f'{prefix}_{name}': 0
+                    for name in ('mean', 'std', 'range', 'median', 'skewness', 'kurtosis',
+                                 'delta_mean', 'delta_std', 'delta_range')
+                })
+                if formant_number == 4:
+                    features[f'{prefix}_coefficient_of_variation'] = 0
+        features['F3_B3'] = self.f3_bandwidths.mean if self.f3_bandwidths.count else 0
+        features['F1_sd'] = self.values[1].std() if self.values[1].count else 0
+        return features
+
+
+class _HnrExtractor(_PraatBlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.values = OnlineStats()
+
+    def analyse(self, sound, core_start, core_end):
+        # Same settings as AudioAnalysis.harmonicity
+        harmonicity = call(sound, "To Harmonicity (ac)", 0.01, 60, 0.1, 3.0)
+        values, times = harmonicity.values[0], harmonicity.xs()
+        # Praat's mean skips unvoiced frames (-200 dB)
+        self.values.update(values[(times >= core_start) & (times < core_end) & (values != -200)])
+
+    def result(self):
+        return {'hnr_mean': self.values.mean if self.values.count else 0}
+
+
+class _PitchExtractor(_PraatBlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.values = OnlineStats()
+
+    def analyse(self, sound, core_start, core_end):
+        # Same settings as AudioAnalysis.pitch
+        pitch = call(sound, "To Pitch", 0.01, 75, 500)
+        frequencies, times = pitch.selected_array['frequency'], pitch.xs()
+        self.values.update(frequencies[(times >= core_start) & (times < core_end) & (frequencies > 0)])
+
+    def result(self):
+        # Praat's mean and (n - 1) standard deviation over voiced frames
+        return {'pitch_mean': self.values.mean if self.values.count else math.nan,
+                'pitch_std': self.values.std(ddof=1)}
+
+
+class _ComplexityExtractor(_BlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.values = OnlineStats()
+
+    def update(self, block, start, left, right):
+        # Blocks hold whole windows of every size, so windows line up with the recording's
+        super().update(block, start, left, right)
+        for window_size in HFD_WINDOW_SIZES:
+            num_windows = len(block) // window_size
+            if num_windows:
+                hfd = _calculate_hfd_batch(block[:num_windows * window_size].reshape(num_windows, window_size))
+                self.values.update(hfd[~np.isnan(hfd)])
+
+    def result(self):
+        if not self.values.count:
+            return {'HFD_mean': 0, 'HFD_max': 0, 'HFD_min': 0, 'HFD_std': 0, 'HFD_var': 0}
+        return {
+            'HFD_mean': self.values.mean,
+            'HFD_max': self.values.max,
+            'HFD_min': self.values.min,
+            'HFD_std': self.values.std(),
+            'HFD_var': self.values.var(),
+        }
+
+
+class _SignalStatsExtractor(_BlockExtractor):
+    """Sample moments and mean absolute difference of the signal."""
+
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.values = OnlineStats()
+        self.abs_diff_sum = 0.0
+        self.last_sample = None
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        samples = np.asarray(block, dtype=np.float64)
+        self.values.update(samples)
+        if self.last_sample is not None:
+            samples = np.concatenate(([self.last_sample], samples))
+        self.abs_diff_sum += float(np.abs(np.diff(samples)).sum())
+        if samples.size:
+            self.last_sample = samples[-1]
+
+    def mean_abs_diff(self) -> float:
+        return self.abs_diff_sum / (self.values.count - 1) if self.values.count > 1 else math.nan
+
+
+class _AdditionalExtractor(_SignalStatsExtractor):
+    def result(self):
+        std = self.values.std()
+        return {
+            'Asymmetry': (self.values.m3 / self.values.count) / std ** 3 if std else math.nan,
+            'TrajIntra': self.mean_abs_diff(),
+        }
+
+
+class _AmplitudeExtremaExtractor(_SignalStatsExtractor):
+    def result(self):
+        return {
+            'Amplitude_Maximum_Difference_mean': self.mean_abs_diff(),
+            'Amplitude_Minimum': self.values.min if self.values.count else 0,
+        }
+
+
+class _AvqiExtractor(_BlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        # Centered 2048-sample frames, as in _extract_avqi_hnr_sd
+        self.frames = _FrameEnergy(2048 // HOP_LENGTH, 2048 // HOP_LENGTH // 2)
+        self.rms = OnlineStats()
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        self.rms.update(np.sqrt(self.frames.update(hop_block_energy(block, HOP_LENGTH)) / 2048))
+
+    def result(self):
+        self.rms.update(np.sqrt(self.frames.finish(1 + self.samples // HOP_LENGTH) / 2048))
+        return {'AVQI_HNR_sd': self.rms.std() if self.rms.count else 0}
+
+
+class _AmplitudeExtractor(_BlockExtractor):
+    """Amplitude of the original (unnormalized) signal, as _extract_amplitude_group."""
+
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.values = OnlineStats()
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        self.values.update(block)
+
+    def result(self):
+        if not self.values.count:
+            return {'average_amplitude': 0, 'peak_amplitude': 0, 'amplitude_variance': 0}
+        return {
+            'average_amplitude': self.values.mean,
+            'peak_amplitude': max(abs(self.values.min), abs(self.values.max)),
+            'amplitude_variance': self.values.var(),
+        }
+
+
+class _SpectralExtractor(_BlockExtractor):
+    """
+    Frame-based spectral features, as _extract_spectral_features.
+
+    STFT, roll-off and zero-crossing frames are centered on the recording's
+    hop grid, with the block's context standing in for the neighbouring
+    samples. The dB scale of the mel spectrogram is clipped relative to the
+    recording's maximum, so mel frames are kept in a temporary file and
+    MFCCs, their deltas and spectral flux are computed from it once all
+    blocks are seen. spectral_slope and spectral_centroid come from the
+    spectrum of the whole recording and are not available.
+    """
+
+    def __init__(self, sr):
+        super().__init__(sr)
+        self.mel_file = tempfile.TemporaryFile()
+        self.mel_frames = 0
+        self.mel_max = 0.0
+        self.frame_energy: List[np.ndarray] = []
+        self.rolloff = OnlineStats()
+        self.zero_crossing_rate = OnlineStats()
+
+    @staticmethod
+    def _frames(block, left, right, pad_mode: str, num_frames: int) -> np.ndarray:
+        """Centered N_FFT frames of the block; padded like the in-memory frames at the recording's ends."""
+        half = N_FFT // 2
+        left, right = left[len(left) - min(len(left), half):], right[:half]
+        segment = np.concatenate((left, block, right)).astype(np.float64)
+        segment = np.pad(segment, (half - len(left), half - len(right)), mode=pad_mode)
+        return librosa.util.frame(segment, frame_length=N_FFT, hop_length=HOP_LENGTH)[:, :num_frames]
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        # Frames centered in this block; the last block also has the frame centered on its end
+        num_frames = len(block) // HOP_LENGTH + (1 if len(right) == 0 else 0)
+        if num_frames == 0:
+            return
+        frames = self._frames(block, left, right, 'constant', num_frames)
+        zcr_frames = self._frames(block, left, right, 'edge', num_frames)
+        window = librosa.filters.get_window('hann', N_FFT, fftbins=True)[:, np.newaxis]
+        # A slice of frames at a time keeps the spectra of a block small
+        for first in range(0, num_frames, STFT_SLICE_FRAMES):
+            frame_slice = slice(first, first + STFT_SLICE_FRAMES)
+            # The magnitude STFT, as librosa.stft computes it
+            magnitude = np.abs(np.fft.rfft(frames[:, frame_slice] * window, axis=0))
+            power = magnitude ** 2
+            self.frame_energy.append(power.sum(axis=0))
+            self.rolloff.update(librosa.feature.spectral_rolloff(S=magnitude, sr=self.sr))
+            mel = librosa.feature.melspectrogram(S=power, sr=self.sr, n_mels=N_MELS)
+            self.mel_max = max(self.mel_max, float(mel.max()))
+            self.mel_file.write(np.ascontiguousarray(mel.T).tobytes())
+            self.mel_frames += mel.shape[1]
+            self.zero_crossing_rate.update(
+                np.mean(librosa.zero_crossings(zcr_frames[:, frame_slice], axis=-2, pad=False), axis=-2)
+            )
+
+    def _log_mel(self, start: int, stop: int, floor: float) -> np.ndarray:
+        """Mel frames start..stop in dB, clipped as power_to_db clips the whole spectrogram."""
+        self.mel_file.seek(start * N_MELS * 8)
+        mel = np.fromfile(self.mel_file, dtype=np.float64, count=(stop - start) * N_MELS).reshape(-1, N_MELS).T
+        return np.maximum(librosa.power_to_db(mel, top_db=None), floor)
+
+    def result(self):
+        try:
+            return self._result()
+        except Exception as e:
+            print(f"Error in spectral analysis: {e}")
+            names = ['spectral_flux_mean', 'spectral_flux_std', 'spectral_rolloff_mean', 'spectral_rolloff_std',
+                     'zero_crossing_rate_mean', 'zero_crossing_rate_std', 'energy_entropy']
+            for prefix in ('mfcc', 'delta_mfcc', 'delta2_mfcc'):
+                names += [f'{prefix}_{i+1}_{stat}' for stat in ('mean', 'std') for i in range(N_MFCC)]
+            return {name: 0 for name in names}
+        finally:
+            self.mel_file.close()
+
+    def _result(self):
+        total = self.mel_frames
+        if total < DELTA_WIDTH:
+            raise ValueError(f"{total} frames are too few for delta features")
+        floor = float(librosa.power_to_db(np.array(self.mel_max), top_db=None)) - 80.0
+        mfcc_stats = {prefix: [OnlineStats() for _ in range(N_MFCC)] for prefix in ('mfcc', 'delta_mfcc', 'delta2_mfcc')}
+        # Onset strength: mean positive log-mel increase, shifted by 3 frames with leading zeros
+        flux = OnlineStats()
+        flux.update(np.zeros(min(3, total)))
+        # Enough neighbouring frames that the delta filter sees the same frames as over the whole recording
+        context = DELTA_WIDTH - 1
+        for start in range(0, total, MEL_CHUNK_FRAMES):
+            stop = min(start + MEL_CHUNK_FRAMES, total)
+            low, high = max(0, start - context), min(total, stop + context)
+            log_mel = self._log_mel(low, high, floor)
+            mfcc = librosa.feature.mfcc(S=log_mel, sr=self.sr, n_mfcc=N_MFCC)
+            core = slice(start - low, stop - low)
+            for prefix, values in (
+                ('mfcc', mfcc),
+                ('delta_mfcc', librosa.feature.delta(mfcc, width=DELTA_WIDTH)),
+                ('delta2_mfcc', librosa.feature.delta(mfcc, width=DELTA_WIDTH, order=2)),
+            ):
+                for stats, row in zip(mfcc_stats[prefix], values[:, core]):
+                    stats.update(row)
+
+            # Increases into frames 1..total-3
+            first, last = max(start, 1), min(stop, total - 2)
+            if first < last:
+                increase = log_mel[:, first - low:last - low] - log_mel[:, first - low - 1:last - low - 1]
+                flux.update(np.mean(np.maximum(0.0, increase), axis=0))
+
+        features = {}
+        for i in range(N_MFCC):
+            for prefix, stats in mfcc_stats.items():
+                features[f'{prefix}_{i+1}_mean'] = stats[i].mean
+                features[f'{prefix}_{i+1}_std'] = stats[i].std()
+        features.update({
+            'spectral_flux_mean': flux.mean,
+            'spectral_flux_std': flux.std(),
+            'spectral_rolloff_mean': self.rolloff.mean,
+            'spectral_rolloff_std': self.rolloff.std(),
+            'zero_crossing_rate_mean': self.zero_crossing_rate.mean,
+            'zero_crossing_rate_std': self.zero_crossing_rate.std(),
+        })
+        energy = np.concatenate(self.frame_energy)
+        energy_norm = energy / np.sum(energy)
+        features['energy_entropy'] = -np.sum(energy_norm * np.log2(energy_norm + 1e-12))
+        return features
+
+
+class _EnergyExtractor(_BlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        # 1024-sample frames every hop, as in _extract_energy_temporal_features
+        self.frames = _FrameEnergy(1024 // HOP_LENGTH, 0)
+        self.energy = OnlineStats()
+        # Entropy of the normalized energies is log2(S) - sum(e * log2(e)) / S
+        self.energy_log_sum = 0.0
+
+    def _add(self, energy: np.ndarray) -> None:
+        self.energy.update(energy)
+        positive = energy[energy > 0]
+        self.energy_log_sum += float(np.sum(positive * np.log2(positive)))
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        self._add(self.frames.update(hop_block_energy(block, HOP_LENGTH)))
+
+    def result(self):
+        self._add(self.frames.finish(math.ceil(self.samples / HOP_LENGTH)))
+        if not self.energy.count:
+            return {'energy_mean': 0, 'energy_std': 0, 'energy_cv': 0, 'energy_entropy': 0}
+        total = self.energy.mean * self.energy.count
+        mean, std = self.energy.mean, self.energy.std()
+        return {
+            'energy_mean': mean,
+            'energy_std': std,
+            'energy_cv': std / mean if mean > 0 else 0,
+            'energy_entropy': math.log2(total) - self.energy_log_sum / total if total > 0 else 0,
+        }
+
+
+class _TimingExtractor(_BlockExtractor):
+    def __init__(self, sr):
+        super().__init__(sr)
+        # One VAD instance over the whole stream, as extract_silences uses
+        self.vad = webrtcvad.Vad(3)
+        self.frame_size = int(sr * 30 / 1000)
+        # One bool per 30 ms frame (~120 kB per hour)
+        self.decisions: List[np.ndarray] = []
+        self.previous = False
+
+    def update(self, block, start, left, right):
+        super().update(block, start, left, right)
+        is_speech = vad_frame_decisions(self.vad, block, self.sr, self.frame_size, self.previous)
+        if is_speech.size:
+            self.previous = bool(is_speech[-1])
+        self.decisions.append(is_speech)
+
+    def segments(self) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """Silence and speech segments of the stream, as extract_silences returns them."""
+        is_speech = np.concatenate(self.decisions) if self.decisions else np.zeros(0, dtype=bool)
+        return vad_segments(is_speech, self.frame_size, self.sr, self.samples / self.sr)
+
+    def result(self):
+        silence_segments, speech_segments = self.segments()
+        return timing_features(silence_segments, speech_segments, self.samples / self.sr)
+
+
+STREAMING_EXTRACTORS = {
+    'formant': _FormantExtractor,
+    'spectral': _SpectralExtractor,
+    'hnr': _HnrExtractor,
+    'amplitude': _AmplitudeExtractor,
+    'complexity': _ComplexityExtractor,
+    'pitch': _PitchExtractor,
+    'additional': _AdditionalExtractor,
+    'avqi': _AvqiExtractor,
+    'amplitude_extrema': _AmplitudeExtremaExtractor,
+    'timing': _TimingExtractor,
+    'energy': _EnergyExtractor,
+}
+
+
+def _streaming_groups(groups: Iterable[str]) -> List[str]:
+    groups = set(groups)
+    unknown = groups.difference(FEATURE_GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown feature groups: {sorted(unknown)}")
+    unsupported = groups.difference(STREAMING_FEATURE_GROUPS)
+    if unsupported:
+        raise ValueError(f"Feature groups not available in streaming mode: {sorted(unsupported)}")
+    return [group for group in STREAMING_FEATURE_GROUPS if group in groups]
+
+
+def _extract_blocks(blocks: Iterable[np.ndarray], sr: int, groups: List[str],
+                    on_group: Optional[GroupCallback],
+                    amplitude: Optional[_AmplitudeExtractor] = None) -> Dict[str, float]:
+    """
+    Extract `groups` from the cleaned blocks. The amplitude group reads the
+    original signal instead: `amplitude` must have been given its blocks.
+    """
+    extractors = {
+        group: amplitude if group == 'amplitude' else STREAMING_EXTRACTORS[group](sr) for group in groups
+    }
+    cleaned = [extractor for group, extractor in extractors.items() if group != 'amplitude']
+    for block, start, left, right in _with_context(blocks, int(CONTEXT_SECONDS * sr)):
+        for extractor in cleaned:
+            extractor.update(block, start, left, right)
+
+    features = {}
+    for group, extractor in extractors.items():
+        group_features = extractor.result()
+        features.update(group_features)
+        if on_group is not None:
+            on_group(group, group_features)
+    return features
+
+
+# --- Streaming Pipelines ---
+
+def stream_clean_and_extract_features(input_file_path: str, output_file_path: str = None,
+                                      on_group: Optional[GroupCallback] = None,
+                                      groups: Iterable[str] = STREAMING_FEATURE_GROUPS,
+                                      block_seconds: float = BLOCK_SECONDS,
+                                      recording_device: Optional[str] = None,
+                                      on_stage: Optional[StageCallback] = None) -> Tuple[Dict[str, float], str]:
+    """
+    Streaming counterpart of clean_and_extract_features with bounded memory.
+
+    The file is read in blocks (any format soundfile reads). The resampled
+    signal is kept in a temporary file and cleaned in three passes: RMS for
+    normalization, chunked noise reduction (also collecting the statistics
+    for peak removal), then peak removal while the cleaned audio is written
+    and features are extracted block by block. In "vad" noise reduction
+    mode, a VAD pass over the normalized signal selects the noise clip
+    before noise reduction.
+
+    Args:
+        input_file_path: Path to the input audio file
+        output_file_path: Optional path to save cleaned audio
+        on_group: Optional callback called with (group, features) as each feature group finishes
+        groups: Feature groups to extract, from STREAMING_FEATURE_GROUPS (default: all of them)
+        block_seconds: Approximate length of the blocks analysed at a time
+        recording_device: Optional device name selecting a stored noise profile (see noise_profile)
+        on_stage: Optional callback called with (stage, stats) as each pass finishes (see StageTimer);
+            peak removal, writing and extraction share the last pass, "extract_streaming"
+
+    Returns:
+        Tuple of (features dict, cleaned audio file path)
+    """
+    groups = _streaming_groups(groups)
+    timer = StageTimer(on_stage)
+    sr = PIPELINE_PARAMS["sample_rate"]
+    block_length = _block_length(sr, block_seconds)
+    if output_file_path is None:
+        base, ext = os.path.splitext(input_file_path)
+        output_file_path = f"{base}_cleaned{ext}"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Pass 1: resampled mono signal to disk, its energy for normalize_audio
+        # and the amplitude of the original signal
+        signal_path = os.path.join(tmp_dir, "signal.f32")
+        num_samples, sum_squares = 0, 0.0
+        amplitude = _AmplitudeExtractor(sr) if 'amplitude' in groups else None
+        with timer.stage("load_audio"), open(signal_path, "wb") as f:
+            for block in _read_blocks(input_file_path, sr, block_length):
+                f.write(block.tobytes())
+                if amplitude is not None:
+                    amplitude.update(block, num_samples, block[:0], block[:0])
+                num_samples += len(block)
+                sum_squares += float(np.dot(block.astype(np.float64), block))
+        if num_samples == 0:
+            raise ValueError(f"Audio file has no samples: {input_file_path}")
+        # Explicit reads and writes rather than a memmap, whose touched pages count as resident
+        signal = open(signal_path, "r+b")
+
+        def read(start: int, stop: int) -> np.ndarray:
+            signal.seek(4 * start)
+            return np.fromfile(signal, dtype=np.float32, count=stop - start)
+
+        def write(start: int, samples: np.ndarray) -> None:
+            signal.seek(4 * start)
+            signal.write(samples.tobytes())
+
+        current_rms = np.sqrt(np.float32(sum_squares / num_samples))
+        gain = 0.1 / current_rms if current_rms > 0 else None
+
+        def normalized(start: int, stop: int) -> np.ndarray:
+            samples = read(start, stop)
+            return samples * gain if gain is not None else samples
+
+        def estimate_noise_clip() -> Optional[np.ndarray]:
+            vad = _TimingExtractor(sr)
+            for start in range(0, num_samples, block_length):
+                vad.update(normalized(start, min(start + block_length, num_samples)), start, None, None)
+            silences, _ = vad.segments()
+            return noise_clip_from_silences(silences, normalized, sr)
+
+        noise_clip = timer.run("noise_profile", noise_profile, estimate_noise_clip, recording_device)
+
+        # Pass 2: noise reduction on noisereduce's padded chunks, in place. A
+        # chunk's output is written once the next chunk (whose padding
+        # overlaps it) has been read.
+        chunk_size = NOISE_CHUNK_SIZE if num_samples > NOISE_CHUNK_SIZE else num_samples
+        reduced_stats = OnlineStats()
+        pending = None
+        with timer.stage("reduce_noise"):
+            for start in range(0, num_samples, chunk_size):
+                low, high = start - NOISE_PADDING, start + chunk_size + NOISE_PADDING
+                chunk = np.zeros(high - low)
+                read_low, read_high = max(low, 0), min(high, num_samples)
+                chunk[read_low - low:read_high - low] = normalized(read_low, read_high)
+                if pending is not None:
+                    write(*pending)
+                reduced = _reduce_noise_chunk(chunk, sr, noise_clip)
+                reduced = reduced[NOISE_PADDING:NOISE_PADDING + min(chunk_size, num_samples - start)]
+                reduced = reduced.astype(np.float32)
+                reduced_stats.update(reduced)
+                pending = (start, reduced)
+            write(*pending)
+
+        # Pass 3: remove_extreme_peaks with the recording-wide threshold
+        threshold = 7 * np.float32(reduced_stats.std())
+
+        def cleaned_blocks():
+            with sf.SoundFile(output_file_path, "w", samplerate=sr, channels=1) as out:
+                for start in range(0, num_samples, block_length):
+                    block = read(start, min(start + block_length, num_samples))
+                    block[np.abs(block) > threshold] *= (1 - 0.99)
+                    out.write(block)
+                    yield block
+
+        try:
+            features = timer.run(
+                "extract_streaming", _extract_blocks, cleaned_blocks(), sr, groups, on_group, amplitude
+            )
+        finally:
+            signal.close()
+
+    return features, output_file_path
+
+
+def stream_extract_features(input_file_path: str, cleaned_file_path: str,
+                            groups: Iterable[str] = STREAMING_FEATURE_GROUPS,
+                            on_group: Optional[GroupCallback] = None,
+                            block_seconds: float = BLOCK_SECONDS,
+                            on_stage: Optional[StageCallback] = None) -> Dict[str, float]:
+    """
+    Extract feature groups from an already cleaned recording, block by block.
+
+    Streaming counterpart of recompute_feature_groups: the original file is
+    only read for the amplitude group.
+
+    Args:
+        input_file_path: Path to the original audio file
+        cleaned_file_path: Path of cleaned audio written by a cleaning pipeline
+        groups: Feature groups to extract, from STREAMING_FEATURE_GROUPS (default: all of them)
+        on_group: Optional callback called with (group, features) as each feature group finishes
+        block_seconds: Approximate length of the blocks analysed at a time
+        on_stage: Optional callback called with (stage, stats) as each pass finishes (see StageTimer)
+
+    Returns:
+        Features of the requested groups
+    """
+    groups = _streaming_groups(groups)
+    timer = StageTimer(on_stage)
+    sr = PIPELINE_PARAMS["sample_rate"]
+    block_length = _block_length(sr, block_seconds)
+    amplitude = None
+    if 'amplitude' in groups:
+        amplitude = _AmplitudeExtractor(sr)
+        with timer.stage("load_audio"):
+            for block in _read_blocks(input_file_path, sr, block_length):
+                amplitude.update(block, amplitude.samples, block[:0], block[:0])
+    return timer.run(
+        "extract_streaming", _extract_blocks, _read_blocks(cleaned_file_path, sr, block_length), sr, groups,
+        on_group, amplitude,
+    )
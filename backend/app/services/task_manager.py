@@ -1,12 +1,77 @@
 # backend/app/services/task_manager.py
 
 import asyncio
+import os
+import socket
+import time
 import uuid
-from typing import Dict, Any, Optional
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 from enum import Enum
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
-import json
+
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import ProcessingTask
+
+# "database" shares task state between API workers and survives restarts;
+# "memory" keeps it process-local
+TASK_STORE = os.getenv("TASK_STORE", "database")
+TASK_RETENTION_HOURS = int(os.getenv("TASK_RETENTION_HOURS", "24"))
+TASK_CLEANUP_INTERVAL_SECONDS = int(os.getenv("TASK_CLEANUP_INTERVAL_SECONDS", "3600"))
+# How often a process refreshes the unfinished tasks it owns and looks for orphaned ones
+TASK_HEARTBEAT_SECONDS = int(os.getenv("TASK_HEARTBEAT_SECONDS", "30"))
+# Pending/running tasks without an update or heartbeat for this long are considered orphaned
+TASK_STALE_SECONDS = int(os.getenv("TASK_STALE_SECONDS", "120"))
+
+# Tells this process apart from an earlier one that had the same PID (e.g. PID 1 in a container)
+_PROCESS_TOKEN = uuid.uuid4().hex[:12]
+
+
+def _boot_id() -> str:
+    """Identifier of the current boot of this host, where the kernel exposes one."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def process_owner() -> str:
+    """Owner recorded on the tasks this process runs: host, boot, PID and process token."""
+    return f"{socket.gethostname()}/{_boot_id()}/{os.getpid()}/{_PROCESS_TOKEN}"
+
+
+def owner_is_dead(owner: Optional[str]) -> bool:
+    """
+    True when `owner` (see process_owner) is a process of this host that no longer runs.
+
+    Owners on other hosts, and processes whose state cannot be checked, are
+    not reported; their tasks are left to the stale window.
+    """
+    try:
+        host, boot, pid, token = (owner or "").rsplit("/", 3)
+        pid = int(pid)
+    except ValueError:
+        return False
+    if host != socket.gethostname():
+        return False
+    if boot != _boot_id():
+        return True  # the host restarted since
+    if pid == os.getpid():
+        return token != _PROCESS_TOKEN
+    if os.name != "posix":
+        return False  # os.kill(pid, 0) is no liveness check on Windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False  # exists, owned by another user
+    return False
 
 class TaskStatus(str, Enum):
     PENDING = "pending"
@@ -24,77 +89,511 @@ class Task:
     created_at: datetime = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    
+    updated_at: Optional[datetime] = None
+    owner: Optional[str] = None
+    batch_id: Optional[str] = None
+    recording_id: Optional[int] = None
+
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now(timezone.utc)
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
+# ─── Task stores ──────────────────────────────────────────────────────────────
+
+class TaskStore(ABC):
+    """Storage backend interface used by TaskManager."""
+
+    @abstractmethod
+    async def add(self, task: Task) -> None:
+        ...
+
+    @abstractmethod
+    async def add_many(self, tasks: List[Task]) -> None:
+        """Add several tasks at once."""
+
+    @abstractmethod
+    async def get(self, task_id: str) -> Optional[Task]:
+        ...
+
+    @abstractmethod
+    async def get_many(self, task_ids: Iterable[str]) -> Dict[str, Task]:
+        """The given tasks that exist, by task ID."""
+
+    @abstractmethod
+    async def get_batch(self, batch_id: str) -> List[Task]:
+        """Tasks of a batch job, ordered by recording ID."""
+
+    @abstractmethod
+    async def update(self, task_id: str, **fields) -> None:
+        """Set the given Task fields (no-op for unknown task IDs)."""
+
+    @abstractmethod
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        """Remove completed/failed tasks that finished before `cutoff`; return how many were removed."""
+
+    @abstractmethod
+    async def fail_stale(self, cutoff: datetime, error: str) -> int:
+        """Mark pending/running tasks not updated since `cutoff` as failed."""
+
+    @abstractmethod
+    async def get_unfinished_owners(self) -> Dict[str, Optional[str]]:
+        """Owner of every pending/running task, by task ID."""
+
+    @abstractmethod
+    async def fail_tasks(self, task_ids: Iterable[str], error: str) -> int:
+        """Mark the given tasks as failed if they are still pending/running."""
+
+    @abstractmethod
+    async def touch(self, task_ids: Iterable[str]) -> Set[str]:
+        """Refresh the update time of the given tasks that are pending/running; return their IDs."""
+
+    @abstractmethod
+    async def restart(self, task_ids: Iterable[str], owner: str) -> None:
+        """Reset the given tasks to pending, owned by `owner`, so they can run again."""
+
+class InMemoryTaskStore(TaskStore):
+    """Process-local task store."""
 
-class TaskManager:
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
-        
-    def create_task(self) -> str:
+
+    async def add(self, task: Task) -> None:
+        self._tasks[task.id] = task
+
+    async def add_many(self, tasks: List[Task]) -> None:
+        self._tasks.update((task.id, task) for task in tasks)
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        return self._tasks.get(task_id)
+
+    async def get_many(self, task_ids: Iterable[str]) -> Dict[str, Task]:
+        return {task_id: self._tasks[task_id] for task_id in task_ids if task_id in self._tasks}
+
+    async def get_batch(self, batch_id: str) -> List[Task]:
+        tasks = [task for task in self._tasks.values() if task.batch_id == batch_id]
+        return sorted(tasks, key=lambda task: task.recording_id)
+
+    async def update(self, task_id: str, **fields) -> None:
+        task = self._tasks.get(task_id)
+        if task:
+            for name, value in fields.items():
+                setattr(task, name, value)
+            task.updated_at = datetime.now(timezone.utc)
+
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        to_remove = [
+            task_id for task_id, task in self._tasks.items()
+            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
+            and task.completed_at is not None and task.completed_at < cutoff
+        ]
+        for task_id in to_remove:
+            del self._tasks[task_id]
+        return len(to_remove)
+
+    async def fail_stale(self, cutoff: datetime, error: str) -> int:
+        now = datetime.now(timezone.utc)
+        stale = [
+            task for task in self._tasks.values()
+            if task.status in (TaskStatus.PENDING, TaskStatus.RUNNING) and task.updated_at < cutoff
+        ]
+        for task in stale:
+            task.status, task.error = TaskStatus.FAILED, error
+            task.completed_at = task.updated_at = now
+        return len(stale)
+
+    def _unfinished(self, task_ids: Iterable[str]) -> List[Task]:
+        tasks = (self._tasks.get(task_id) for task_id in task_ids)
+        return [task for task in tasks if task and task.status in (TaskStatus.PENDING, TaskStatus.RUNNING)]
+
+    async def get_unfinished_owners(self) -> Dict[str, Optional[str]]:
+        return {task.id: task.owner for task in self._unfinished(self._tasks)}
+
+    async def fail_tasks(self, task_ids: Iterable[str], error: str) -> int:
+        now = datetime.now(timezone.utc)
+        tasks = self._unfinished(task_ids)
+        for task in tasks:
+            task.status, task.error = TaskStatus.FAILED, error
+            task.completed_at = task.updated_at = now
+        return len(tasks)
+
+    async def touch(self, task_ids: Iterable[str]) -> Set[str]:
+        now = datetime.now(timezone.utc)
+        tasks = self._unfinished(task_ids)
+        for task in tasks:
+            task.updated_at = now
+        return {task.id for task in tasks}
+
+    async def restart(self, task_ids: Iterable[str], owner: str) -> None:
+        for task_id in task_ids:
+            task = self._tasks.get(task_id)
+            if task:
+                task.status, task.progress, task.result, task.error = TaskStatus.PENDING, 0.0, None, None
+                task.started_at = task.completed_at = None
+                task.updated_at = datetime.now(timezone.utc)
+                task.owner = owner
+
+class DatabaseTaskStore(TaskStore):
+    """
+    Task store backed by the processing_tasks table.
+
+    Every API worker sees the same tasks, and task state survives restarts.
+    Works with any database supported by the application engine (SQLite
+    locally, PostgreSQL in production).
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    @staticmethod
+    def _to_task(row: ProcessingTask) -> Task:
+        def aware(value: Optional[datetime]) -> Optional[datetime]:
+            # SQLite drops the timezone; all stored timestamps are UTC
+            if value is not None and value.tzinfo is None:
+                return value.replace(tzinfo=timezone.utc)
+            return value
+
+        return Task(
+            id=row.task_id,
+            status=TaskStatus(row.status),
+            progress=row.progress,
+            result=row.result,
+            error=row.error,
+            created_at=aware(row.created_at),
+            started_at=aware(row.started_at),
+            completed_at=aware(row.completed_at),
+            updated_at=aware(row.updated_at),
+            owner=row.owner,
+            batch_id=row.batch_id,
+            recording_id=row.recording_id,
+        )
+
+    @staticmethod
+    def _to_row(task: Task) -> Dict[str, Any]:
+        return {
+            "task_id": task.id,
+            "status": task.status.value,
+            "progress": task.progress,
+            "result": task.result,
+            "error": task.error,
+            "created_at": task.created_at,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "updated_at": task.updated_at,
+            "owner": task.owner,
+            "batch_id": task.batch_id,
+            "recording_id": task.recording_id,
+        }
+
+    async def add(self, task: Task) -> None:
+        async with self.session_factory() as db:
+            db.add(ProcessingTask(**self._to_row(task)))
+            await db.commit()
+
+    async def add_many(self, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+        async with self.session_factory() as db:
+            # One multi-row INSERT instead of a round trip per task
+            await db.execute(insert(ProcessingTask), [self._to_row(task) for task in tasks])
+            await db.commit()
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        async with self.session_factory() as db:
+            row = await db.get(ProcessingTask, task_id)
+            return self._to_task(row) if row else None
+
+    async def get_many(self, task_ids: Iterable[str]) -> Dict[str, Task]:
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+        async with self.session_factory() as db:
+            result = await db.execute(select(ProcessingTask).where(ProcessingTask.task_id.in_(task_ids)))
+            return {row.task_id: self._to_task(row) for row in result.scalars().all()}
+
+    async def get_batch(self, batch_id: str) -> List[Task]:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(ProcessingTask)
+                .where(ProcessingTask.batch_id == batch_id)
+                .order_by(ProcessingTask.recording_id)
+            )
+            return [self._to_task(row) for row in result.scalars().all()]
+
+    async def update(self, task_id: str, **fields) -> None:
+        if "status" in fields:
+            fields["status"] = TaskStatus(fields["status"]).value
+        async with self.session_factory() as db:
+            await db.execute(
+                update(ProcessingTask)
+                .where(ProcessingTask.task_id == task_id)
+                .values(**fields, updated_at=datetime.now(timezone.utc))
+            )
+            await db.commit()
+
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                delete(ProcessingTask).where(
+                    ProcessingTask.status.in_([TaskStatus.COMPLETED.value, TaskStatus.FAILED.value]),
+                    ProcessingTask.completed_at < cutoff,
+                )
+            )
+            await db.commit()
+            return result.rowcount
+
+    async def fail_stale(self, cutoff: datetime, error: str) -> int:
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(ProcessingTask)
+                .where(
+                    ProcessingTask.status.in_([TaskStatus.PENDING.value, TaskStatus.RUNNING.value]),
+                    ProcessingTask.updated_at < cutoff,
+                )
+                .values(status=TaskStatus.FAILED.value, error=error, completed_at=now, updated_at=now)
+            )
+            await db.commit()
+            return result.rowcount
+
+    @staticmethod
+    def _unfinished():
+        return ProcessingTask.status.in_([TaskStatus.PENDING.value, TaskStatus.RUNNING.value])
+
+    async def get_unfinished_owners(self) -> Dict[str, Optional[str]]:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(ProcessingTask.task_id, ProcessingTask.owner).where(self._unfinished())
+            )
+            return dict(result.all())
+
+    async def fail_tasks(self, task_ids: Iterable[str], error: str) -> int:
+        task_ids = list(task_ids)
+        if not task_ids:
+            return 0
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(ProcessingTask)
+                .where(ProcessingTask.task_id.in_(task_ids), self._unfinished())
+                .values(status=TaskStatus.FAILED.value, error=error, completed_at=now, updated_at=now)
+            )
+            await db.commit()
+            return result.rowcount
+
+    async def touch(self, task_ids: Iterable[str]) -> Set[str]:
+        task_ids = list(task_ids)
+        if not task_ids:
+            return set()
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(ProcessingTask)
+                .where(ProcessingTask.task_id.in_(task_ids), self._unfinished())
+                .values(updated_at=datetime.now(timezone.utc))
+                .returning(ProcessingTask.task_id)
+            )
+            touched = set(result.scalars().all())
+            await db.commit()
+            return touched
+
+    async def restart(self, task_ids: Iterable[str], owner: str) -> None:
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        async with self.session_factory() as db:
+            await db.execute(
+                update(ProcessingTask)
+                .where(ProcessingTask.task_id.in_(task_ids))
+                .values(
+                    status=TaskStatus.PENDING.value, progress=0.0, result=None, error=None,
+                    started_at=None, completed_at=None, updated_at=datetime.now(timezone.utc), owner=owner,
+                )
+            )
+            await db.commit()
+
+# ─── Task manager ─────────────────────────────────────────────────────────────
+
+class TaskManager:
+    def __init__(self, store: Optional[TaskStore] = None):
+        self.store = store or InMemoryTaskStore()
+        # Unfinished tasks created by this process, kept fresh by heartbeat()
+        self._owned: Set[str] = set()
+        # Active watchers: the task IDs each one follows and the event set on changes
+        self._watchers: List[Tuple[Set[str], asyncio.Event]] = []
+
+    def _notify(self, task_id: str):
+        for task_ids, changed in self._watchers:
+            if task_id in task_ids:
+                changed.set()
+
+    @contextmanager
+    def watch(self, task_ids: Iterable[str]) -> Iterator[asyncio.Event]:
+        """
+        Yield an event that is set whenever one of `task_ids` changes in this process.
+
+        Changes made by other API workers are not signalled; readers should
+        also re-read the store periodically.
+        """
+        watcher = (set(task_ids), asyncio.Event())
+        self._watchers.append(watcher)
+        try:
+            yield watcher[1]
+        finally:
+            self._watchers.remove(watcher)
+
+    async def create_task(self) -> str:
         """Create a new task and return its ID."""
         task_id = str(uuid.uuid4())
         task = Task(
             id=task_id,
             status=TaskStatus.PENDING,
-            progress=0.0
+            progress=0.0,
+            owner=process_owner(),
         )
-        self._tasks[task_id] = task
+        await self.store.add(task)
+        self._owned.add(task_id)
+        self._notify(task_id)
         return task_id
-    
-    def get_task(self, task_id: str) -> Optional[Task]:
+
+    async def create_batch_tasks(self, batch_id: str, recording_ids: Iterable[int]) -> List[str]:
+        """Create one task per recording of a batch job, in a single write; return their IDs."""
+        owner = process_owner()
+        tasks = [
+            Task(id=str(uuid.uuid4()), status=TaskStatus.PENDING, progress=0.0,
+                 owner=owner, batch_id=batch_id, recording_id=recording_id)
+            for recording_id in recording_ids
+        ]
+        await self.store.add_many(tasks)
+        task_ids = [task.id for task in tasks]
+        self._owned.update(task_ids)
+        for task_id in task_ids:
+            self._notify(task_id)
+        return task_ids
+
+    async def get_batch_tasks(self, batch_id: str) -> List[Task]:
+        """Get the per-recording tasks of a batch job."""
+        return await self.store.get_batch(batch_id)
+
+    async def restart_tasks(self, task_ids: Iterable[str]) -> None:
+        """Reset finished tasks to pending so they can run again in this process."""
+        task_ids = list(task_ids)
+        await self.store.restart(task_ids, process_owner())
+        self._owned.update(task_ids)
+        for task_id in task_ids:
+            self._notify(task_id)
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
-        return self._tasks.get(task_id)
-    
-    def update_task_progress(self, task_id: str, progress: float):
-        """Update task progress (0.0 to 1.0)."""
-        if task_id in self._tasks:
-            self._tasks[task_id].progress = progress
-    
-    def mark_task_running(self, task_id: str):
+        return await self.store.get(task_id)
+
+    async def update_task_progress(self, task_id: str, progress: float, result: Any = None):
+        """Update task progress (0.0 to 1.0) and, optionally, its partial result."""
+        if result is None:
+            await self.store.update(task_id, progress=progress)
+        else:
+            await self.store.update(task_id, progress=progress, result=result)
+        self._notify(task_id)
+
+    async def mark_task_running(self, task_id: str):
         """Mark task as running."""
-        if task_id in self._tasks:
-            task = self._tasks[task_id]
-            task.status = TaskStatus.RUNNING
-            task.started_at = datetime.now(timezone.utc)
-    
-    def mark_task_completed(self, task_id: str, result: Any = None):
+        await self.store.update(
+            task_id,
+            status=TaskStatus.RUNNING,
+            started_at=datetime.now(timezone.utc),
+        )
+        self._notify(task_id)
+
+    async def mark_task_completed(self, task_id: str, result: Any = None):
         """Mark task as completed with optional result."""
-        if task_id in self._tasks:
-            task = self._tasks[task_id]
-            task.status = TaskStatus.COMPLETED
-            task.progress = 1.0
-            task.result = result
-            task.completed_at = datetime.now(timezone.utc)
-    
-    def mark_task_failed(self, task_id: str, error: str):
+        await self.store.update(
+            task_id,
+            status=TaskStatus.COMPLETED,
+            progress=1.0,
+            result=result,
+            completed_at=datetime.now(timezone.utc),
+        )
+        self._owned.discard(task_id)
+        self._notify(task_id)
+
+    async def mark_task_failed(self, task_id: str, error: str):
         """Mark task as failed with error message."""
-        if task_id in self._tasks:
-            task = self._tasks[task_id]
-            task.status = TaskStatus.FAILED
-            task.error = error
-            task.completed_at = datetime.now(timezone.utc)
-    
-    def cleanup_old_tasks(self, max_age_hours: int = 24):
-        """Remove tasks older than max_age_hours."""
-        cutoff = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
-        to_remove = []
-        
-        for task_id, task in self._tasks.items():
-            if task.created_at.timestamp() < cutoff:
-                to_remove.append(task_id)
-        
-        for task_id in to_remove:
-            del self._tasks[task_id]
-    
-    def get_task_dict(self, task_id: str) -> Optional[Dict[str, Any]]:
+        await self.store.update(
+            task_id,
+            status=TaskStatus.FAILED,
+            error=error,
+            completed_at=datetime.now(timezone.utc),
+        )
+        self._owned.discard(task_id)
+        self._notify(task_id)
+
+    async def cleanup_old_tasks(self, max_age_hours: int = TASK_RETENTION_HOURS) -> int:
+        """
+        Remove tasks that completed or failed more than max_age_hours ago.
+        Pending and running tasks (such as a long batch and its items) are kept.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+        return await self.store.delete_finished_before(cutoff)
+
+    async def heartbeat(self) -> None:
+        """Refresh the unfinished tasks of this process, so other workers do not take them for orphans."""
+        owned = list(self._owned)
+        # Tasks failed or removed elsewhere (e.g. by the orphan sweep) are no longer followed
+        self._owned.difference_update(set(owned) - await self.store.touch(owned))
+
+    async def recover_orphaned_tasks(self, stale_after_seconds: int = TASK_STALE_SECONDS) -> int:
+        """
+        Mark pending/running tasks whose process stopped as failed.
+
+        Tasks owned by a process of this host that no longer runs are failed
+        right away; this is what clears tasks of a crashed or restarted
+        worker on startup. Tasks without an update or heartbeat for
+        `stale_after_seconds` are failed too, which covers owners on other
+        hosts.
+        """
+        error = "Task interrupted: worker stopped before completion"
+        owners = await self.store.get_unfinished_owners()
+        dead = [task_id for task_id, owner in owners.items() if owner_is_dead(owner)]
+        failed = await self.store.fail_tasks(dead, error) if dead else 0
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)
+        return failed + await self.store.fail_stale(cutoff, error)
+
+    async def run_periodic_cleanup(
+        self,
+        interval_seconds: int = TASK_CLEANUP_INTERVAL_SECONDS,
+        max_age_hours: int = TASK_RETENTION_HOURS,
+        heartbeat_seconds: int = TASK_HEARTBEAT_SECONDS,
+    ):
+        """
+        Until cancelled, refresh this process's tasks and fail orphaned ones every
+        heartbeat_seconds, and drop expired tasks every interval_seconds.
+        """
+        last_cleanup = None
+        while True:
+            try:
+                await self.heartbeat()
+                await self.recover_orphaned_tasks()
+                if last_cleanup is None or time.monotonic() - last_cleanup >= interval_seconds:
+                    await self.cleanup_old_tasks(max_age_hours)
+                    last_cleanup = time.monotonic()
+            except Exception as e:
+                print(f"Warning: Task cleanup failed: {e}")
+            await asyncio.sleep(heartbeat_seconds)
+
+    async def get_task_dict(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task as dictionary for JSON serialization."""
-        task = self.get_task(task_id)
+        task = await self.get_task(task_id)
         if not task:
             return None
-        
+        return self._task_dict(task)
+
+    async def get_task_dicts(self, task_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several tasks as dictionaries with one store read; unknown IDs are left out."""
+        tasks = await self.store.get_many(task_ids)
+        return {task_id: self._task_dict(task) for task_id, task in tasks.items()}
+
+    @staticmethod
+    def _task_dict(task: Task) -> Dict[str, Any]:
         return {
             "id": task.id,
             "status": task.status.value,
@@ -106,5 +605,11 @@ class TaskManager:
             "completed_at": task.completed_at.isoformat() if task.completed_at else None,
         }
 
+def _create_task_store() -> TaskStore:
+    if TASK_STORE == "memory":
+        return InMemoryTaskStore()
+    from app.core.database import async_session
+    return DatabaseTaskStore(async_session)
+
 # Global task manager instance
-task_manager = TaskManager()
+task_manager = TaskManager(_create_task_store())
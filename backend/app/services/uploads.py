@@ -0,0 +1,85 @@
+# backend/app/services/uploads.py
+
+import asyncio
+import hashlib
+import os
+from typing import BinaryIO, Optional
+
+from fastapi import UploadFile
+
+from app.services.feature_cache import HASH_CHUNK_SIZE
+
+# Bytes needed to recognize every supported container
+SNIFF_BYTES = 12
+
+
+class UnsupportedAudioFormat(ValueError):
+    """The upload does not start with the header of a supported audio container."""
+
+
+class UploadTooLarge(ValueError):
+    """The upload exceeds the configured maximum size."""
+
+
+def sniff_audio_format(header: bytes) -> Optional[str]:
+    """Audio container identified from the first bytes of a file, or None."""
+    if header[:4] in (b"RIFF", b"RF64", b"BW64") and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[:4] == b"OggS":
+        return "ogg"
+    if header[:4] == b"FORM" and header[8:12] in (b"AIFF", b"AIFC"):
+        return "aiff"
+    if header[:4] == b"\x1a\x45\xdf\xa3":
+        return "webm"
+    if header[4:8] == b"ftyp":
+        return "mp4"
+    # ID3 tag, or an MPEG audio frame sync (11 set bits)
+    if header[:3] == b"ID3" or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
+
+
+def _write_chunk(out: BinaryIO, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    out.write(chunk)
+
+
+async def save_upload(upload: UploadFile, dest_path: str, max_bytes: int) -> str:
+    """
+    Save an uploaded audio file to dest_path and return its SHA-256 digest.
+
+    The upload is validated, hashed and written in a single pass of
+    HASH_CHUNK_SIZE chunks, with file I/O and hashing run in a worker thread
+    so large uploads never block the event loop. The header is sniffed
+    before anything is written, and writing stops as soon as max_bytes is
+    exceeded; the partial file is removed on any failure.
+
+    Raises:
+        UnsupportedAudioFormat: The file does not look like audio
+        UploadTooLarge: The file is larger than max_bytes
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLarge(f"File exceeds the maximum upload size of {max_bytes} bytes")
+
+    chunk = await upload.read(HASH_CHUNK_SIZE)
+    if sniff_audio_format(chunk[:SNIFF_BYTES]) is None:
+        raise UnsupportedAudioFormat("File is not a supported audio format")
+
+    digest = hashlib.sha256()
+    size = 0
+    out = await asyncio.to_thread(open, dest_path, "wb")
+    try:
+        while chunk:
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(f"File exceeds the maximum upload size of {max_bytes} bytes")
+            await asyncio.to_thread(_write_chunk, out, digest, chunk)
+            chunk = await upload.read(HASH_CHUNK_SIZE)
+    except BaseException:
+        await asyncio.to_thread(out.close)
+        await asyncio.to_thread(os.remove, dest_path)
+        raise
+    await asyncio.to_thread(out.close)
+    return digest.hexdigest()
@@ -0,0 +1,224 @@
+# backend/benchmarks/run.py
+"""
+Per-stage benchmarks of the in-memory cleaning and extraction pipeline.
+
+For each benchmark duration a deterministic synthetic recording is written
+to a temporary WAV file and run through the stages of
+clean_and_extract_features one at a time: loading, normalization, noise
+clip estimation, noise reduction, peak removal and writing the cleaned
+audio. The extraction worker warm-up (warm_up) runs first, untimed, so
+one-off costs (numba compilation, FFT plans) do not count against the
+first stages that hit them; a stage that still pays them points to a gap
+in the warm-up. Every feature extractor is then timed on its own (with a fresh
+analysis context, so each pays for the analyses it requires) and
+extract_all_features once with shared analyses. Each stage records its
+wall time, the peak memory it allocated (tracemalloc, which sees NumPy
+buffers but not Praat's internal allocations) and the resident memory
+after it, as the task results of the API do (app.services.metrics).
+
+The features of extract_all_features are compared with golden values, and
+stage times with a stored baseline; the run fails when a feature differs
+beyond tolerance or a stage slowed down by more than --max-slowdown.
+
+Usage (from backend/):
+    python -m benchmarks                         # 30 s recording
+    python -m benchmarks --durations 30s 5min 30min
+    python -m benchmarks --update-baseline       # record this machine's times
+    python -m benchmarks --update-golden         # accept new feature values
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+from app.services.audio_processing import (
+    FEATURE_EXTRACTORS,
+    FEATURE_GROUPS,
+    NOISE_REDUCTION_THREADS,
+    AudioAnalysis,
+    estimate_noise_clip,
+    extract_all_features,
+    load_audio,
+    noise_profile,
+    normalize_audio,
+    reduce_noise,
+    remove_extreme_peaks,
+    warm_up,
+)
+from app.services.metrics import StageTimer
+from benchmarks.signals import DURATIONS, SR, synthetic_speech
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+GOLDEN_DIR = os.path.join(BENCHMARK_DIR, "golden")
+
+# Allowed time ratio to the baseline before a stage counts as a regression
+MAX_SLOWDOWN = float(os.getenv("BENCHMARK_MAX_SLOWDOWN", 1.25))
+# Slowdowns smaller than this many seconds are timing noise, never regressions
+MIN_SLOWDOWN_SECONDS = float(os.getenv("BENCHMARK_MIN_SLOWDOWN_SECONDS", 0.05))
+# Tolerance of feature values against the golden values
+GOLDEN_RTOL = 1e-5
+GOLDEN_ATOL = 1e-8
+
+
+def _print_stage(name: str, stats: Dict[str, float]) -> None:
+    print(f"  {name:<28} {stats['seconds']:9.3f} s {stats['peak_mb']:9.1f} MB", flush=True)
+
+
+def benchmark_recording(seconds: float, groups: List[str] = FEATURE_GROUPS,
+                        verbose: bool = True) -> Dict[str, Any]:
+    """Stage timings and extracted features for a synthetic recording of the given length."""
+    timer = StageTimer(_print_stage if verbose else None, trace_memory=True)
+    tracemalloc.start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "recording.wav")
+            sf.write(input_path, synthetic_speech(seconds), SR, subtype="PCM_16")
+
+            # Cleaning, step by step as in clean_and_extract_features
+            original, sr = timer.run("load_audio", load_audio, input_path, SR)
+            audio_data = timer.run("normalize_audio", normalize_audio, original)
+            noise_clip = timer.run(
+                "noise_profile", noise_profile, lambda: estimate_noise_clip(audio_data, sr)
+            )
+            audio_data = timer.run(
+                "reduce_noise", reduce_noise, audio_data, sr, noise_clip, n_threads=NOISE_REDUCTION_THREADS
+            )
+            audio_data = timer.run("remove_extreme_peaks", remove_extreme_peaks, audio_data)
+            timer.run("write_cleaned", sf.write, os.path.join(tmp_dir, "cleaned.wav"), audio_data, sr)
+
+        # Each extractor on its own, including the analyses it requires
+        for group in groups:
+            analysis = AudioAnalysis(audio_data, sr, original_audio_data=original)
+            timer.run(f"extract.{group}", FEATURE_EXTRACTORS[group].extract, analysis)
+            del analysis
+
+        features = timer.run(
+            "extract_all_features", extract_all_features, audio_data, sr, original, groups=groups
+        )
+    finally:
+        tracemalloc.stop()
+    return {"stages": timer.stages, "features": _json_features(features)}
+
+
+def _json_features(features: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Plain floats, NaN and infinite values as None."""
+    return {
+        name: float(value) if math.isfinite(value) else None
+        for name, value in sorted(features.items())
+        if isinstance(value, (int, float, np.number))
+    }
+
+
+def find_slowdowns(stages: Dict[str, Dict[str, float]], baseline: Dict[str, float],
+                   max_slowdown: float = MAX_SLOWDOWN,
+                   min_seconds: float = MIN_SLOWDOWN_SECONDS) -> List[str]:
+    """Stages slower than max_slowdown times their baseline (by at least min_seconds)."""
+    slow = []
+    for name, stage in stages.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        seconds = stage["seconds"]
+        if seconds > reference * max_slowdown and seconds - reference >= min_seconds:
+            slow.append(f"{name}: {seconds:.3f} s vs baseline {reference:.3f} s ({seconds / reference:.2f}x)")
+    return slow
+
+
+def find_mismatches(features: Dict[str, Optional[float]], golden: Dict[str, Optional[float]],
+                    rtol: float = GOLDEN_RTOL, atol: float = GOLDEN_ATOL) -> List[str]:
+    """Features missing from either side or differing from the golden values beyond tolerance."""
+    mismatches = []
+    for name in sorted(set(features) | set(golden)):
+        if name not in features or name not in golden:
+            mismatches.append(f"{name}: {'missing' if name not in features else 'not in golden values'}")
+            continue
+        value, expected = features[name], golden[name]
+        if value is None or expected is None:
+            if value is not expected:
+                mismatches.append(f"{name}: {value} vs golden {expected}")
+        elif not math.isclose(value, expected, rel_tol=rtol, abs_tol=atol):
+            mismatches.append(f"{name}: {value!r} vs golden {expected!r}")
+    return mismatches
+
+
+def _load_json(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--durations", nargs="+", choices=DURATIONS, default=["30s"])
+    parser.add_argument("--groups", nargs="+", choices=FEATURE_GROUPS, default=list(FEATURE_GROUPS))
+    parser.add_argument("--max-slowdown", type=float, default=MAX_SLOWDOWN)
+    parser.add_argument("--min-slowdown-seconds", type=float, default=MIN_SLOWDOWN_SECONDS)
+    parser.add_argument("--rtol", type=float, default=GOLDEN_RTOL)
+    parser.add_argument("--atol", type=float, default=GOLDEN_ATOL)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run's stage times")
+    parser.add_argument("--update-golden", action="store_true", help="store this run's features")
+    parser.add_argument("--output", help="write the full results as JSON")
+    args = parser.parse_args(argv)
+
+    warm_up()
+
+    baseline = _load_json(args.baseline) or {}
+    results, failures = {}, []
+    for duration in args.durations:
+        print(f"{duration} recording", flush=True)
+        result = benchmark_recording(DURATIONS[duration], args.groups)
+        results[duration] = result
+
+        golden_path = os.path.join(GOLDEN_DIR, f"{duration}.json")
+        golden = _load_json(golden_path)
+        if args.update_golden:
+            _write_json(golden_path, result["features"])
+        elif golden is None:
+            print(f"  no golden values for {duration}; run with --update-golden to record them")
+        else:
+            if set(args.groups) != set(FEATURE_GROUPS):
+                golden = {name: golden[name] for name in result["features"] if name in golden}
+            failures += [f"{duration} {m}" for m in find_mismatches(result["features"], golden, args.rtol, args.atol)]
+
+        stage_times = {name: stage["seconds"] for name, stage in result["stages"].items()}
+        if args.update_baseline:
+            baseline[duration] = stage_times
+        elif duration not in baseline:
+            print(f"  no baseline for {duration}; run with --update-baseline to record one")
+        else:
+            failures += [
+                f"{duration} {s}"
+                for s in find_slowdowns(result["stages"], baseline[duration],
+                                        args.max_slowdown, args.min_slowdown_seconds)
+            ]
+
+    if args.update_baseline:
+        _write_json(args.baseline, baseline)
+    if args.output:
+        _write_json(os.path.abspath(args.output), results)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# backend/benchmarks/startup.py
+"""
+Startup budget of the API process.
+
+Imports app.main in fresh interpreters and reports the import time
+(median over --runs), the peak resident memory and any audio stack module
+that got imported. API processes must not load the audio stack: it is
+imported by the extraction workers only, on startup of the pool. The run
+fails when a budget is exceeded or an audio module is loaded.
+
+Usage (from backend/):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --max-seconds 0.5 --max-rss-mb 80
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budgets for importing app.main in a fresh interpreter
+MAX_STARTUP_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", 1.0))
+MAX_STARTUP_RSS_MB = float(os.getenv("STARTUP_BUDGET_RSS_MB", 100))
+# Modules that only extraction workers may import
+AUDIO_STACK_MODULES = (
+    "numpy", "scipy", "librosa", "numba", "noisereduce", "parselmouth", "soundfile", "soxr", "webrtcvad",
+)
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+seconds = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "seconds": seconds,
+    "rss_mb": rss / (2 ** 20 if sys.platform == "darwin" else 2 ** 10),
+    "audio_modules": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def measure_startup() -> Dict[str, Any]:
+    """Import time, peak RSS and loaded audio stack modules of `import app.main` in a new interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE % (AUDIO_STACK_MODULES,)],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def find_budget_violations(runs: List[Dict[str, Any]], max_seconds: float = MAX_STARTUP_SECONDS,
+                           max_rss_mb: float = MAX_STARTUP_RSS_MB) -> List[str]:
+    """Budgets exceeded by the median import time and largest RSS of the runs, and audio modules loaded."""
+    violations = []
+    seconds = statistics.median(run["seconds"] for run in runs)
+    rss_mb = max(run["rss_mb"] for run in runs)
+    if seconds > max_seconds:
+        violations.append(f"import took {seconds:.3f} s (budget {max_seconds:.3f} s)")
+    if rss_mb > max_rss_mb:
+        violations.append(f"peak RSS {rss_mb:.0f} MB (budget {max_rss_mb:.0f} MB)")
+    loaded = sorted({name for run in runs for name in run["audio_modules"]})
+    if loaded:
+        violations.append(f"audio stack imported: {', '.join(loaded)}")
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=MAX_STARTUP_SECONDS)
+    parser.add_argument("--max-rss-mb", type=float, default=MAX_STARTUP_RSS_MB)
+    args = parser.parse_args(argv)
+
+    measure_startup()  # bytecode compilation and a warm file cache do not count
+    runs = [measure_startup() for _ in range(args.runs)]
+    print(f"import app.main: {statistics.median(run['seconds'] for run in runs):.3f} s median, "
+          f"{max(run['rss_mb'] for run in runs):.0f} MB peak RSS")
+
+    violations = find_budget_violations(runs, args.max_seconds, args.max_rss_mb)
+    for violation in violations:
+        print(f"FAIL {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
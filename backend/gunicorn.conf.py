@@ -0,0 +1,14 @@
+# backend/gunicorn.conf.py
+"""
+Gunicorn settings read from the working directory (backend/).
+
+With PROMETHEUS_MULTIPROC_DIR set, every worker writes its metrics to that
+directory and /metrics aggregates them; the live gauges of a worker that
+exits are dropped here.
+"""
+
+
+def child_exit(server, worker):
+    from app.services.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
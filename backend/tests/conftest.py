@@ -4,7 +4,10 @@ sys.path.insert(0, ROOT)
 
 # tests/conftest.py
 import asyncio
+import io
+import shutil
 import uuid # Import the uuid module
+from datetime import datetime, timezone
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
@@ -15,6 +18,9 @@ from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.models import Base
 from app.api.dependencies import get_db
+from app.api.v1.endpoints import audio_processing as processing_endpoint
+from app.api.v1.endpoints import recordings as recordings_endpoint
+from app.services.task_manager import task_manager, DatabaseTaskStore
 
 # In-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -26,6 +32,9 @@ AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Keep background task state in the test database
+task_manager.store = DatabaseTaskStore(AsyncSessionLocal)
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an event loop for session-scoped async fixtures."""
@@ -42,6 +51,21 @@ async def prepare_database():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path_factory, monkeypatch):
+    """Keep uploaded files in a per-test directory instead of uploads/recordings."""
+    # Stored file paths ("/uploads/recordings/<name>") are resolved against the
+    # working directory, so run the test from the temporary directory as well
+    work_dir = tmp_path_factory.mktemp("work")
+    upload_path = work_dir / "uploads" / "recordings"
+    upload_path.mkdir(parents=True)
+    monkeypatch.chdir(work_dir)
+    monkeypatch.setenv("AUDIO_UPLOAD_DIR", str(upload_path))
+    monkeypatch.setattr(recordings_endpoint, "UPLOAD_DIR", str(upload_path))
+    monkeypatch.setattr(processing_endpoint, "UPLOAD_DIR", str(upload_path))
+    yield upload_path
+    shutil.rmtree(work_dir, ignore_errors=True)
+
 @pytest_asyncio.fixture
 async def db_session():
     """Provide a clean database session for each test."""
@@ -76,3 +100,29 @@ async def test_patient(client: AsyncClient):
     assert response.status_code == 201, f"Failed to create patient: {response.text}"
     patient_json = response.json()
     yield patient_json
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_recording(client: AsyncClient, test_patient):
+    """Create an assessment with one uploaded recording and yield the recording data."""
+    patient_id = test_patient["patient_id"]
+    response = await client.post(
+        f"/api/v1/patients/{patient_id}/assessments/",
+        json={
+            "assessment_type": "MMSE",
+            "score": 25,
+            "assessment_date": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+    assert response.status_code == 201, f"Failed to create assessment: {response.text}"
+    assessment_id = response.json()["assessment_id"]
+
+    response = await client.post(
+        f"/api/v1/patients/{patient_id}/assessments/{assessment_id}/recordings/",
+        files={"file": ("speech.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVEdummy audio data"), "audio/wav")},
+        data={"task_type": "Spontaneous Speech", "recording_device": "Test Microphone"},
+    )
+    assert response.status_code == 201, f"Failed to upload recording: {response.text}"
+    recording_json = response.json()
+    recording_json["patient_id"] = patient_id
+    yield recording_json
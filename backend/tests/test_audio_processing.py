@@ -0,0 +1,275 @@
+# backend/tests/test_audio_processing.py
+import numpy as np
+import pytest
+import librosa
+import soundfile as sf
+from parselmouth.praat import call
+
+from app.services import audio_processing, pipeline_config
+from app.services.audio_processing import (
+    AudioAnalysis,
+    NOISE_CHUNK_SIZE,
+    FEATURE_EXTRACTORS,
+    _calculate_hfd_batch,
+    _extract_complexity_features,
+    _formant_tracks,
+    assign_feature_groups,
+    extract_all_features,
+    extract_silences,
+    load_audio,
+    noise_clip_from_silences,
+    noise_profile,
+    reduce_noise,
+    required_analyses,
+)
+
+SR = 16000
+
+
+def make_speech_like_signal(seconds: float = 3.0, sr: int = SR, seed: int = 0) -> np.ndarray:
+    """Deterministic harmonic 'syllables' separated by low-level noise pauses."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sr)) / sr
+    signal = np.zeros_like(t)
+    pos = 0.2
+    while pos < seconds - 0.4:
+        dur = rng.uniform(0.25, 0.6)
+        f0 = rng.uniform(100, 220)
+        mask = (t >= pos) & (t < pos + dur)
+        tt = t[mask] - pos
+        phase = 2 * np.pi * f0 * tt
+        voiced = sum(np.sin(k * phase) / k for k in range(1, 10))
+        signal[mask] = 0.3 * voiced * np.sin(np.pi * tt / dur)
+        pos += dur + rng.uniform(0.2, 0.6)
+    signal += 0.003 * rng.standard_normal(len(signal))
+    return signal.astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def speech_signal():
+    return make_speech_like_signal()
+
+
+def test_analysis_context_matches_direct_librosa(speech_signal):
+    analysis = AudioAnalysis(speech_signal, SR)
+    y = speech_signal.astype(np.float64)
+
+    assert np.allclose(analysis.stft_magnitude, np.abs(librosa.stft(y, n_fft=2048, hop_length=512)))
+    assert np.allclose(
+        librosa.feature.mfcc(S=analysis.log_mel_spectrogram, sr=SR, n_mfcc=30),
+        librosa.feature.mfcc(y=y, sr=SR, n_mfcc=30, hop_length=512),
+    )
+    rms = np.sqrt(np.mean(analysis.frames(2048) ** 2, axis=0))
+    assert np.allclose(rms, librosa.feature.rms(y=y)[0])
+
+
+def test_analysis_context_computes_each_representation_once(speech_signal):
+    analysis = AudioAnalysis(speech_signal, SR)
+    assert analysis.stft_magnitude is analysis.stft_magnitude
+    assert analysis.frames(2048) is analysis.frames(2048)
+    assert analysis.frames(2048, pad_mode='edge') is not analysis.frames(2048)
+
+
+def test_point_process_reuses_pitch_track(speech_signal):
+    analysis = AudioAnalysis(speech_signal, SR)
+    reference = call(analysis.sound, "To PointProcess (periodic, cc)", 75, 500)
+
+    assert call(analysis.point_process, "Get number of points") == call(reference, "Get number of points")
+    assert call(analysis.point_process, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3) == pytest.approx(
+        call(reference, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3)
+    )
+    assert analysis.pitch is analysis.pitch
+    assert analysis.sound is analysis.sound
+
+
+def test_formant_tracks_match_per_frame_queries(speech_signal):
+    analysis = AudioAnalysis(speech_signal, SR)
+    formant = analysis.formant
+    times = np.arange(0, analysis.sound.duration, 0.01)
+
+    frequencies, f3_bandwidths = _formant_tracks(formant, times)
+
+    expected = np.array([[formant.get_value_at_time(n, t) for t in times] for n in range(1, 5)])
+    expected_b3 = np.array([formant.get_bandwidth_at_time(3, t) for t in times])
+    assert np.array_equal(np.isnan(frequencies), np.isnan(expected))
+    assert np.allclose(frequencies, expected, equal_nan=True)
+    assert np.allclose(f3_bandwidths, expected_b3, equal_nan=True)
+
+
+def _reference_hfd(signal: np.ndarray, kmax: int = 10) -> float:
+    """Per-window Higuchi FD with explicit loops over k and m."""
+    N = len(signal)
+    L = np.zeros(kmax)
+    x = np.zeros(kmax)
+    for k in range(1, kmax + 1):
+        Lk = 0
+        for m in range(k):
+            indices = np.arange(1, int((N - m) / k))
+            Lmk = np.abs(signal[m + k * indices] - signal[m + k * (indices - 1)]).sum()
+            Lk += (Lmk * (N - 1) / (((N - m) / k) * k)) / k
+        L[k - 1] = Lk / k
+        x[k - 1] = np.log(1.0 / k)
+    return np.polyfit(x, np.log(L), 1)[0]
+
+
+def test_batched_hfd_matches_per_window_definition(speech_signal):
+    signal = speech_signal.astype(np.float64)
+    for window_size in (128, 1024):
+        windows = signal[:20 * window_size].reshape(20, window_size)
+        expected = [_reference_hfd(window) for window in windows]
+        assert np.allclose(_calculate_hfd_batch(windows), expected)
+
+    silent = np.zeros((2, 128))
+    assert np.isnan(_calculate_hfd_batch(silent)).all()
+
+
+def test_complexity_features_independent_of_chunk_size(speech_signal):
+    full = _extract_complexity_features(speech_signal)
+    chunked = _extract_complexity_features(speech_signal, chunk_samples=5000)
+    assert full.keys() == chunked.keys()
+    assert all(np.isclose(full[name], chunked[name]) for name in full)
+
+
+def test_extract_silences_segments_speech_and_pauses():
+    t = np.arange(SR) / SR
+    voiced = 0.3 * sum(np.sin(2 * np.pi * k * 150 * t) / k for k in range(1, 10))
+    quiet = np.zeros(SR)
+    signal = np.concatenate([quiet, voiced, quiet, voiced, quiet]).astype(np.float32)
+
+    silences, speech = extract_silences(signal, SR)
+
+    assert len(speech) == 2
+    assert speech[0][0] == pytest.approx(1.0, abs=0.2)
+    assert speech[1][1] == pytest.approx(4.0, abs=0.2)
+    assert silences[0][0] == 0
+    assert silences[-1][1] == pytest.approx(5.0)
+    assert all(end - start >= 0.5 for start, end in silences)
+    assert silences == sorted(silences)
+
+
+def test_extract_silences_handles_short_and_silent_input():
+    assert extract_silences(np.zeros(100, dtype=np.float32), SR, min_silence_duration=0) == ([(0.0, 100 / SR)], [])
+    assert extract_silences(np.zeros(SR, dtype=np.float32), SR) == ([(0.0, 1.0)], [])
+
+
+def test_frame_energy_matches_direct_framing(speech_signal):
+    signal = speech_signal[:SR + 123].astype(np.float64)
+    analysis = AudioAnalysis(signal, SR)
+
+    expected_energy = [np.sum(signal[i:i + 1024] ** 2) for i in range(0, len(signal), 512)]
+    assert np.allclose(analysis.frame_energy(1024), expected_energy)
+
+    rms = np.sqrt(analysis.frame_energy(2048, center=True) / 2048)
+    assert np.allclose(rms, librosa.feature.rms(y=signal)[0])
+
+    assert AudioAnalysis(np.zeros(0), SR).frame_energy(1024).size == 0
+    with pytest.raises(ValueError):
+        analysis.frame_energy(1000)
+
+
+def test_selected_groups_match_full_extraction(speech_signal):
+    full_groups = {}
+    extract_all_features(speech_signal, SR, on_group=lambda group, f: full_groups.setdefault(group, f))
+
+    selected_groups = {}
+    selected = extract_all_features(
+        speech_signal, SR, groups=['formant', 'timing'],
+        on_group=lambda group, f: selected_groups.setdefault(group, f),
+    )
+
+    assert list(selected_groups) == ['formant', 'timing']
+    assert selected == {**full_groups['formant'], **full_groups['timing']}
+    with pytest.raises(ValueError):
+        extract_all_features(speech_signal, SR, groups=['mfcc_only'])
+
+
+@pytest.mark.parametrize("group", list(FEATURE_EXTRACTORS))
+def test_extractors_compute_only_declared_analyses(speech_signal, group):
+    analysis = AudioAnalysis(speech_signal, SR)
+    FEATURE_EXTRACTORS[group].extract(analysis)
+
+    # Cached analyses live in the instance dict under their property name
+    computed = {name for name in vars(analysis) if hasattr(AudioAnalysis, name)}
+    if analysis._frames:
+        computed.add('frames')
+    assert computed <= set(FEATURE_EXTRACTORS[group].requires)
+
+
+def test_pause_only_run_skips_spectral_and_praat_analyses(speech_signal):
+    assert required_analyses(['timing']) == ['vad_segments']
+    assert 'stft_magnitude' in required_analyses(['timing', 'tempo'])
+
+
+def test_assign_feature_groups_keeps_extraction_precedence():
+    grouped = assign_feature_groups({
+        'spectral': {'energy_entropy': 1.0, 'Spectral_Centroid_mean': 2.0},
+        'energy': {'energy_entropy': 3.0},
+    })
+    assert grouped == {'energy_entropy': ('energy', 3.0), 'Spectral_Centroid_mean': ('spectral', 2.0)}
+
+    # Recomputing only the spectral group keeps the stored energy value
+    updated = assign_feature_groups({'spectral': {'energy_entropy': 5.0, 'Spectral_Centroid_mean': 6.0}}, grouped)
+    assert updated == {'energy_entropy': ('energy', 3.0), 'Spectral_Centroid_mean': ('spectral', 6.0)}
+
+
+@pytest.mark.parametrize("sr,subtype,channels", [
+    (16000, 'PCM_16', 1),
+    (44100, 'PCM_16', 2),
+    (48000, 'PCM_24', 1),
+    (22050, 'FLOAT', 2),
+])
+def test_load_audio_matches_librosa_load(tmp_path, sr, subtype, channels):
+    rng = np.random.default_rng(0)
+    signal = np.clip(rng.standard_normal((sr * 2, channels)) * 0.2, -1, 1)
+    path = str(tmp_path / "input.wav")
+    sf.write(path, signal, sr, subtype=subtype)
+
+    audio_data, out_sr = load_audio(path, target_sr=SR)
+    expected, _ = librosa.load(path, sr=SR, mono=True)
+    assert out_sr == SR
+    assert audio_data.dtype == np.float32
+    np.testing.assert_array_equal(audio_data, expected)
+
+
+def test_noise_clip_takes_silences_in_order_up_to_limit():
+    signal = np.arange(10 * SR, dtype=np.float32)
+    read = lambda start, stop: signal[start:stop]
+    clip = noise_clip_from_silences([(1.0, 2.0), (4.0, 7.0)], read, SR, max_seconds=2.5)
+    np.testing.assert_array_equal(clip, np.concatenate((signal[SR:2 * SR], signal[4 * SR:int(5.5 * SR)])))
+    assert noise_clip_from_silences([], read, SR) is None
+
+
+@pytest.mark.parametrize("with_clip", [False, True])
+def test_threaded_noise_reduction_matches_single_pass(with_clip):
+    signal = np.tile(make_speech_like_signal(), 14)[:NOISE_CHUNK_SIZE + SR * 3]
+    noise_clip = signal[:SR] * 0.01 if with_clip else None
+    np.testing.assert_array_equal(
+        reduce_noise(signal, SR, noise_clip, n_threads=3),
+        reduce_noise(signal, SR, noise_clip),
+    )
+
+
+def test_noise_profile_is_stored_per_device(tmp_path, monkeypatch):
+    # Configured in pipeline_config, which audio_processing re-exports
+    for module in (audio_processing, pipeline_config):
+        monkeypatch.setattr(module, "NOISE_REDUCTION_MODE", "vad")
+        monkeypatch.setattr(module, "NOISE_PROFILE_DIR", str(tmp_path))
+    estimates = []
+
+    def estimate():
+        estimates.append(1)
+        return np.full(SR, len(estimates), dtype=np.float32)
+
+    first = noise_profile(estimate, "Booth A")
+    again = noise_profile(estimate, "Booth A")
+    other = noise_profile(estimate, "Booth B")
+
+    np.testing.assert_array_equal(again, first)
+    assert other[0] == 2 and len(estimates) == 2
+    # The stored profile becomes part of the cache keys of the device's recordings
+    assert audio_processing.cleaning_params("Booth A")["noise_profile"] == "Booth A"
+
+    for module in (audio_processing, pipeline_config):
+        monkeypatch.setattr(module, "NOISE_REDUCTION_MODE", "nonstationary")
+    assert noise_profile(estimate, "Booth A") is None
+    assert "noise_profile" not in audio_processing.cleaning_params("Booth A")
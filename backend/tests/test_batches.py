@@ -0,0 +1,175 @@
+# backend/tests/test_batches.py
+import asyncio
+import io
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import batches
+from app.crud.audio_crud import get_features, get_recordings_in_scope, replace_features
+from app.services.audio_processing import PIPELINE_VERSION
+from app.services.task_manager import task_manager
+
+
+async def upload_recording(client: AsyncClient, recording: dict, task_type: str) -> int:
+    response = await client.post(
+        f"/api/v1/patients/{recording['patient_id']}/assessments/{recording['assessment_id']}/recordings/",
+        files={"file": ("reading.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVEdummy audio data"), "audio/wav")},
+        data={"task_type": task_type},
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["recording_id"]
+
+
+@pytest.mark.asyncio
+async def test_recordings_in_scope_filters_by_processing_state(db_session, client: AsyncClient, test_recording):
+    assessment_id = test_recording["assessment_id"]
+    processed_id = test_recording["recording_id"]
+    other_id = await upload_recording(client, test_recording, "Sentence Reading")
+
+    await replace_features(db_session, processed_id, {"pitch_mean": 150.0}, "0")
+    await replace_features(db_session, processed_id, {"pitch_mean": 151.0, "F1_mean": 500.0}, "0")
+    stored = {f.feature_name: f.feature_value for f in await get_features(db_session, processed_id)}
+    assert stored == {"pitch_mean": 151.0, "F1_mean": 500.0}
+
+    async def scope_ids(**filters):
+        recordings = await get_recordings_in_scope(
+            db_session, assessment_id=assessment_id, pipeline_version=PIPELINE_VERSION, **filters
+        )
+        return [r.recording_id for r in recordings]
+
+    assert await scope_ids() == [processed_id, other_id]
+    assert await scope_ids(only="unprocessed") == [other_id]
+    assert await scope_ids(only="outdated") == [processed_id]
+    assert await scope_ids(task_type="Sentence Reading") == [other_id]
+    assert await scope_ids(patient_id=test_recording["patient_id"], only="unprocessed") == [other_id]
+
+    await replace_features(db_session, processed_id, {"pitch_mean": 152.0}, PIPELINE_VERSION)
+    assert await scope_ids(only="outdated") == []
+
+
+@pytest.mark.asyncio
+async def test_manual_features_are_kept_and_never_outdated(db_session, client: AsyncClient, test_recording):
+    recording_id = test_recording["recording_id"]
+    versions = {"pitch": "1", "formant": "1"}
+
+    async def extract(values):
+        await replace_features(db_session, recording_id, values, PIPELINE_VERSION,
+                               feature_groups={"pitch_mean": "pitch", "F1_mean": "formant"},
+                               group_versions=versions)
+
+    async def outdated_ids():
+        recordings = await get_recordings_in_scope(
+            db_session, assessment_id=test_recording["assessment_id"], only="outdated",
+            pipeline_version=PIPELINE_VERSION, group_versions=versions,
+        )
+        return [r.recording_id for r in recordings]
+
+    await extract({"pitch_mean": 150.0, "F1_mean": 500.0})
+    response = await client.post(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}"
+        f"/recordings/{recording_id}/features/",
+        json={"feature_name": "clinician_rating", "feature_value": 3.0},
+    )
+    assert response.status_code == 201
+    assert await outdated_ids() == []
+
+    await extract({"pitch_mean": 151.0})
+    stored = {f.feature_name: (f.feature_value, f.feature_group) for f in await get_features(db_session, recording_id)}
+    assert stored == {"pitch_mean": (151.0, "pitch"), "clinician_rating": (3.0, None)}
+
+    versions["pitch"] = "2"
+    assert await outdated_ids() == [recording_id]
+
+
+@pytest.mark.asyncio
+async def test_batch_job_isolates_and_retries_failures(client: AsyncClient, test_recording, monkeypatch):
+    failing_id = await upload_recording(client, test_recording, "Sentence Reading")
+    attempts = []
+
+    async def fake_process(task_id, recording_id, file_path):
+        attempts.append(recording_id)
+        if recording_id == failing_id and attempts.count(recording_id) == 1:
+            await task_manager.mark_task_failed(task_id, "corrupt file")
+        else:
+            await task_manager.mark_task_completed(task_id, {"features_extracted": 1})
+
+    monkeypatch.setattr(batches, "process_audio_background", fake_process)
+
+    response = await client.post(
+        "/api/v1/batches/", json={"assessment_id": test_recording["assessment_id"]}
+    )
+    assert response.status_code == 202
+    batch_id = response.json()["batch_id"]
+    assert response.json()["total"] == 2
+
+    # Background tasks have run by the time the test client returns
+    batch = (await client.get(f"/api/v1/batches/{batch_id}")).json()
+    assert batch["status"] == "completed"
+    assert batch["progress"] == 1.0
+    assert (batch["result"]["completed"], batch["result"]["failed"]) == (1, 1)
+    failed_item = next(item for item in batch["result"]["items"] if item["status"] == "failed")
+    assert failed_item["recording_id"] == failing_id
+    assert failed_item["error"] == "corrupt file"
+
+    response = await client.post(f"/api/v1/batches/{batch_id}/retry")
+    assert response.status_code == 202
+    assert response.json()["task_ids"] == [failed_item["task_id"]]
+
+    batch = (await client.get(f"/api/v1/batches/{batch_id}")).json()
+    assert (batch["result"]["completed"], batch["result"]["failed"]) == (2, 0)
+    assert sorted(attempts) == sorted([test_recording["recording_id"], failing_id, failing_id])
+
+    response = await client.post(f"/api/v1/batches/{batch_id}/retry")
+    assert response.json()["task_ids"] == []
+
+
+@pytest.mark.asyncio
+async def test_batch_row_holds_only_throttled_aggregate_counts(client: AsyncClient, test_recording, monkeypatch):
+    for _ in range(3):
+        await upload_recording(client, test_recording, "Sentence Reading")
+
+    async def fake_process(task_id, recording_id, file_path):
+        await task_manager.mark_task_completed(task_id, {"features_extracted": 1})
+
+    added, batch_writes = [], []
+    add_many = task_manager.store.add_many
+    update = task_manager.store.update
+
+    async def record_add_many(tasks):
+        added.append(len(tasks))
+        await add_many(tasks)
+
+    async def record_update(task_id, **fields):
+        if "result" in fields and isinstance(fields["result"], dict) and "scope" in fields["result"]:
+            batch_writes.append(fields["result"])
+        await update(task_id, **fields)
+
+    monkeypatch.setattr(batches, "process_audio_background", fake_process)
+    monkeypatch.setattr(batches, "BATCH_PROGRESS_INTERVAL", 3600.0)
+    # The module semaphore is bound to the loop of the first test that waited on it
+    monkeypatch.setattr(batches, "_batch_slots", asyncio.Semaphore(1))
+    monkeypatch.setattr(task_manager.store, "add_many", record_add_many)
+    monkeypatch.setattr(task_manager.store, "update", record_update)
+
+    response = await client.post(
+        "/api/v1/batches/", json={"assessment_id": test_recording["assessment_id"]}
+    )
+    assert response.status_code == 202
+    # Item tasks are inserted at once; the batch row is written when the batch
+    # starts and when it completes, not after every recording
+    assert added == [4]
+    assert len(batch_writes) == 2
+    assert all("items" not in result for result in batch_writes)
+
+    batch = (await client.get(f"/api/v1/batches/{response.json()['batch_id']}")).json()
+    assert (batch["result"]["completed"], batch["result"]["failed"]) == (4, 0)
+    assert [item["task_id"] for item in batch["result"]["items"]] == response.json()["task_ids"]
+    assert all(item["status"] == "completed" for item in batch["result"]["items"])
+
+
+@pytest.mark.asyncio
+async def test_batch_with_empty_scope_is_rejected(client: AsyncClient):
+    response = await client.post("/api/v1/batches/", json={"assessment_id": 999999})
+    assert response.status_code == 404
+    assert (await client.get("/api/v1/batches/not-a-batch")).status_code == 404
@@ -0,0 +1,56 @@
+# backend/tests/test_benchmarks.py
+import numpy as np
+
+from app.services.audio_processing import extract_silences
+from benchmarks.run import benchmark_recording, find_mismatches, find_slowdowns
+from benchmarks.signals import SR, synthetic_speech
+from benchmarks.startup import find_budget_violations, measure_startup
+
+
+def test_synthetic_speech_is_deterministic_with_pauses():
+    signal = synthetic_speech(10)
+    np.testing.assert_array_equal(signal, synthetic_speech(10))
+    assert not np.array_equal(signal, synthetic_speech(10, seed=1))
+    assert signal.dtype == np.float32 and len(signal) == 10 * SR
+    silences, speech = extract_silences(signal, SR)
+    assert silences and speech
+
+
+def test_benchmark_times_each_stage_and_extractor():
+    result = benchmark_recording(2, ["timing", "energy"], verbose=False)
+    assert list(result["stages"]) == [
+        "load_audio", "normalize_audio", "noise_profile", "reduce_noise", "remove_extreme_peaks",
+        "write_cleaned", "extract.timing", "extract.energy", "extract_all_features",
+    ]
+    assert all(stage["seconds"] >= 0 and stage["peak_mb"] >= 0 for stage in result["stages"].values())
+    assert "speech_rate" in result["features"] and "energy_mean" in result["features"]
+
+
+def test_slowdowns_beyond_ratio_and_noise_floor_fail():
+    stages = {name: {"seconds": seconds} for name, seconds in
+              {"reduce_noise": 1.5, "normalize_audio": 0.02, "extract.pitch": 1.1, "new_stage": 9.0}.items()}
+    baseline = {"reduce_noise": 1.0, "normalize_audio": 0.01, "extract.pitch": 1.0}
+    slow = find_slowdowns(stages, baseline, max_slowdown=1.25, min_seconds=0.05)
+    assert len(slow) == 1 and slow[0].startswith("reduce_noise")
+
+
+def test_feature_mismatches_respect_tolerance():
+    golden = {"pitch_mean": 150.0, "jitter": None, "F1_mean": 500.0}
+    assert find_mismatches({"pitch_mean": 150.0 * (1 + 1e-7), "jitter": None, "F1_mean": 500.0}, golden) == []
+    mismatches = find_mismatches({"pitch_mean": 151.0, "jitter": 0.1, "shimmer": 0.2}, golden)
+    assert [m.split(":")[0] for m in mismatches] == ["F1_mean", "jitter", "pitch_mean", "shimmer"]
+
+
+def test_api_startup_does_not_import_audio_stack():
+    run = measure_startup()
+    assert run["audio_modules"] == []
+    assert run["seconds"] > 0 and run["rss_mb"] > 0
+
+
+def test_startup_budget_uses_median_time_and_peak_memory():
+    runs = [{"seconds": seconds, "rss_mb": 60.0, "audio_modules": []} for seconds in (0.5, 0.6, 3.0)]
+    assert find_budget_violations(runs, max_seconds=1.0, max_rss_mb=100) == []
+    runs.append({"seconds": 0.5, "rss_mb": 240.0, "audio_modules": ["scipy", "numpy"]})
+    violations = find_budget_violations(runs, max_seconds=0.5, max_rss_mb=100)
+    assert violations == ["import took 0.550 s (budget 0.500 s)", "peak RSS 240 MB (budget 100 MB)",
+                          "audio stack imported: numpy, scipy"]
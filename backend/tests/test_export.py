@@ -0,0 +1,108 @@
+# backend/tests/test_export.py
+import csv
+import io
+import threading
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import export as export_endpoint
+from app.crud.audio_crud import create_features_bulk
+from app.services.task_manager import task_manager
+
+
+@pytest.mark.asyncio
+async def test_export_features_csv_streams_joined_rows(client: AsyncClient, db_session, test_recording, monkeypatch):
+    # Force several chunks so the cursor is read incrementally
+    monkeypatch.setattr(export_endpoint, "EXPORT_CHUNK_ROWS", 7)
+    # The response body reads through a session of its own, outside the request's
+    sessions = []
+
+    def session_factory():
+        sessions.append(task_manager.store.session_factory())
+        return sessions[-1]
+
+    monkeypatch.setattr(export_endpoint, "async_session", session_factory)
+    recording_id = test_recording["recording_id"]
+    features = {f"mfcc_{i}_mean": float(i) for i in range(1, 21)}
+    await create_features_bulk(db_session, recording_id, features)
+
+    response = await client.get("/api/v1/export/features/csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == export_endpoint.FEATURE_CSV_HEADERS
+
+    ours = [row for row in rows[1:] if row[5] == str(recording_id)]
+    assert len(ours) == 20
+    assert {row[10]: float(row[11]) for row in ours} == features
+    first = ours[0]
+    assert first[0] == str(test_recording["patient_id"])
+    assert first[2] == str(test_recording["assessment_id"])
+    assert first[3] == "MMSE"
+    assert first[6] == "speech.wav"
+    assert first[7] == "Spontaneous Speech"
+    assert first[8] == "Test Microphone"
+    assert [row[10] for row in ours] == sorted(features)
+    assert len(sessions) == 1 and sessions[0] is not db_session
+
+
+@pytest.mark.asyncio
+async def test_export_feature_matrix_parquet(client: AsyncClient, db_session, test_recording, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    # Serialized in a worker thread, not on the event loop
+    threads = []
+    matrix_file = export_endpoint._matrix_file
+
+    def recording_matrix_file(*args):
+        threads.append(threading.current_thread())
+        return matrix_file(*args)
+
+    monkeypatch.setattr(export_endpoint, "_matrix_file", recording_matrix_file)
+    recording_id = test_recording["recording_id"]
+    await create_features_bulk(db_session, recording_id, {"pitch_mean": 150.0, "F1_mean": 520.0})
+
+    response = await client.get(
+        "/api/v1/export/features/matrix",
+        params={"format": "parquet", "assessment_type": "MMSE", "task_type": "Spontaneous Speech"},
+    )
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    rows = {row["recording_id"]: row for row in table.to_pylist()}
+    assert rows[recording_id]["pitch_mean"] == 150.0
+    assert rows[recording_id]["F1_mean"] == 520.0
+    assert rows[recording_id]["study_identifier"].startswith("TestPatient-")
+    assert table.column_names[:10] == export_endpoint.MATRIX_METADATA_COLUMNS
+    # one row per recording
+    assert len(rows) == table.num_rows
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_export_feature_matrix_csv_and_filters(client: AsyncClient, db_session, test_recording):
+    recording_id = test_recording["recording_id"]
+    await create_features_bulk(db_session, recording_id, {"HFD_mean": 1.5})
+
+    response = await client.get(
+        "/api/v1/export/features/matrix",
+        params={"format": "csv", "task_type": "Spontaneous Speech"},
+    )
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    ours = [row for row in rows if row["recording_id"] == str(recording_id)]
+    assert len(ours) == 1
+    assert float(ours[0]["HFD_mean"]) == 1.5
+
+    response = await client.get(
+        "/api/v1/export/features/matrix",
+        params={"format": "csv", "task_type": "No Such Task"},
+    )
+    assert response.status_code == 404
+
+    response = await client.get(
+        "/api/v1/export/features/matrix",
+        params={"format": "csv", "start_date": "2000-01-01", "end_date": "2000-12-31"},
+    )
+    assert response.status_code == 404
@@ -0,0 +1,159 @@
+# backend/tests/test_extraction_pool.py
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import audio_processing
+from app.services.extraction_pool import ExtractionPool, _init_worker
+
+
+def running_tasks() -> float:
+    return REGISTRY.get_sample_value("neurocapture_extraction_tasks_running")
+
+
+def queued_tasks() -> float:
+    return REGISTRY.get_sample_value("neurocapture_extraction_queue_depth")
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_runs_in_worker_process():
+    pool = ExtractionPool(max_workers=1, warm_up=False)
+    try:
+        worker_pid = await pool.run(os.getpid)
+        assert worker_pid != os.getpid()
+        assert await pool.run(divmod, 7, 2) == (3, 1)
+    finally:
+        pool.shutdown()
+
+
+def _count_up(n, on_step=None):
+    for i in range(n):
+        on_step(i, i * i)
+    return n
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_forwards_worker_callbacks_in_order():
+    pool = ExtractionPool(max_workers=1, warm_up=False)
+    received = []
+
+    async def record(i, square):
+        received.append((i, square))
+
+    try:
+        result = await pool.run_with_callback(_count_up, 4, callback_name="on_step", callback=record)
+        assert result == 4
+        assert received == [(0, 0), (1, 1), (2, 4), (3, 9)]
+    finally:
+        pool.shutdown()
+
+
+def _count_with_squares(n, on_step=None, on_square=None):
+    for i in range(n):
+        on_step(i)
+        on_square(i * i)
+    return n
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_forwards_several_callbacks_in_call_order():
+    pool = ExtractionPool(max_workers=1, warm_up=False)
+    received = []
+
+    async def record_step(i):
+        received.append(("step", i))
+
+    try:
+        result = await pool.run_with_callbacks(
+            _count_with_squares, 3,
+            callbacks={"on_step": record_step, "on_square": lambda square: received.append(("square", square))},
+        )
+        assert result == 3
+        assert received == [("step", 0), ("square", 0), ("step", 1), ("square", 1), ("step", 2), ("square", 4)]
+        assert running_tasks() == queued_tasks() == 0
+    finally:
+        pool.shutdown()
+
+
+class _SlowPollQueue:
+    """Manager queue whose first get times out only after the worker has finished."""
+
+    def __init__(self, events):
+        self.events = events
+        self.polled = False
+
+    def put(self, item):
+        self.events.put(item)
+
+    def get(self, timeout=None):
+        if not self.polled:
+            self.polled = True
+            time.sleep(1.0)
+            raise queue.Empty
+        return self.events.get(timeout=timeout)
+
+
+class _SlowPollManager:
+    def __init__(self, manager):
+        self.manager = manager
+
+    def Queue(self):
+        return _SlowPollQueue(self.manager.Queue())
+
+    def shutdown(self):
+        self.manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_delivers_events_queued_before_completion():
+    pool = ExtractionPool(max_workers=1, warm_up=False)
+    pool._manager = _SlowPollManager(multiprocessing.get_context("spawn").Manager())
+    received = []
+    try:
+        await pool.run(os.getpid)  # worker started, so the task finishes during the first poll
+        result = await pool.run_with_callback(_count_up, 3, callback_name="on_step",
+                                              callback=lambda i, square: received.append(i))
+        assert result == 3
+        assert received == [0, 1, 2]
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_reports_running_and_queued_tasks():
+    pool = ExtractionPool(max_workers=1, warm_up=False)
+    try:
+        tasks = [asyncio.create_task(pool.run(time.sleep, 0.1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert running_tasks() == 1
+        assert queued_tasks() == 2
+        await asyncio.gather(*tasks)
+        assert running_tasks() == queued_tasks() == 0
+    finally:
+        pool.shutdown()
+
+
+def test_worker_warm_up_runs_the_pipeline_and_tolerates_failures(monkeypatch, capsys):
+    assert audio_processing.warm_up(seconds=2.0) > 0
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("no cache")
+
+    monkeypatch.setattr(audio_processing, "warm_up", fail)
+    _init_worker(warm_up=True)
+    assert "warm-up failed: no cache" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_start_spawns_all_workers():
+    pool = ExtractionPool(max_workers=2, warm_up=False)
+    try:
+        pool.start()
+        assert len(pool.executor._processes) == 2
+        assert await pool.run(os.getpid) in pool.executor._processes
+    finally:
+        pool.shutdown()
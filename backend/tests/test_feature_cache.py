@@ -0,0 +1,274 @@
+# backend/tests/test_feature_cache.py
+import hashlib
+import io
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import audio_processing as processing_endpoint
+from app.crud.audio_crud import get_features, get_recording, get_recordings_in_scope
+from app.services import pipeline_config
+from app.services.feature_cache import feature_cache_key, hash_file
+from app.services.task_manager import task_manager
+
+AUDIO_BYTES = b"RIFF\x00\x00\x00\x00WAVE identical audio content" * 100
+
+
+async def upload(client: AsyncClient, recording: dict) -> dict:
+    response = await client.post(
+        f"/api/v1/patients/{recording['patient_id']}/assessments/{recording['assessment_id']}/recordings/",
+        files={"file": ("repeat.wav", io.BytesIO(AUDIO_BYTES), "audio/wav")},
+        data={"task_type": "Sentence Reading"},
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_cache_key_depends_on_content_version_and_params():
+    key = feature_cache_key("abc", "1", {"sample_rate": 16000})
+    assert key == feature_cache_key("abc", "1", {"sample_rate": 16000})
+    assert key != feature_cache_key("abd", "1", {"sample_rate": 16000})
+    assert key != feature_cache_key("abc", "2", {"sample_rate": 16000})
+    assert key != feature_cache_key("abc", "1", {"sample_rate": 22050})
+
+
+@pytest.mark.asyncio
+async def test_upload_stores_content_hash(client: AsyncClient, test_recording):
+    recording = await upload(client, test_recording)
+    expected = hashlib.sha256(AUDIO_BYTES).hexdigest()
+    assert recording["content_hash"] == expected
+    assert hash_file(recording["file_path"].lstrip("/")) == expected
+
+
+@pytest.mark.asyncio
+async def test_identical_upload_reuses_stored_features(client: AsyncClient, db_session, test_recording, monkeypatch):
+    first = await upload(client, test_recording)
+    second = await upload(client, test_recording)
+    extractions = []
+
+    async def fake_extraction(func, input_path, cleaned_path, callbacks, groups, **kwargs):
+        extractions.append(input_path)
+        with open(cleaned_path, "wb") as f:
+            f.write(b"cleaned")
+        callbacks["on_stage"]("load_audio", {"seconds": 0.25, "rss_mb": 80.0})
+        for group in groups:
+            values = {"pitch": {"pitch_mean": 150.0}, "formant": {"F1_mean": 520.0}}
+            await callbacks["on_group"](group, values.get(group, {}))
+        return {"pitch_mean": 150.0, "F1_mean": 520.0}, cleaned_path
+
+    monkeypatch.setattr(processing_endpoint, "async_session", task_manager.store.session_factory)
+    monkeypatch.setattr(processing_endpoint.extraction_pool, "run_with_callbacks", fake_extraction)
+
+    first_task = await task_manager.create_task()
+    await processing_endpoint.process_audio_background(first_task, first["recording_id"], first["file_path"])
+    second_task = await task_manager.create_task()
+    await processing_endpoint.process_audio_background(second_task, second["recording_id"], second["file_path"])
+
+    assert len(extractions) == 1
+    first_result = (await task_manager.get_task(first_task)).result
+    second_result = (await task_manager.get_task(second_task)).result
+    assert first_result["cache_hit"] is False
+    assert first_result["stages"] == {"load_audio": {"seconds": 0.25, "rss_mb": 80.0}}
+    assert second_result["cache_hit"] is True
+    assert second_result["features_extracted"] == 2
+
+    stored = {f.feature_name: f.feature_value for f in await get_features(db_session, second["recording_id"])}
+    assert stored == {"pitch_mean": 150.0, "F1_mean": 520.0}
+    with open(second_result["cleaned_audio_path"].lstrip("/"), "rb") as f:
+        assert f.read() == b"cleaned"
+
+    db_session.expire_all()
+    first_row = await get_recording(db_session, first["recording_id"])
+    second_row = await get_recording(db_session, second["recording_id"])
+    assert first_row.feature_cache_key == second_row.feature_cache_key is not None
+
+
+@pytest.mark.asyncio
+async def test_reprocess_recomputes_only_changed_groups(client: AsyncClient, db_session, test_recording, monkeypatch):
+    # Unique content so the cache from other tests does not apply
+    response = await client.post(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}/recordings/",
+        files={"file": ("versioned.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVE versioned audio"), "audio/wav")},
+        data={"task_type": "Sentence Reading"},
+    )
+    recording = response.json()
+    calls = []
+
+    async def fake_extraction(func, input_path, cleaned_path, *args, callbacks, **kwargs):
+        calls.append((func.__name__, args))
+        if func.__name__ == "clean_and_extract_features":
+            with open(cleaned_path, "wb") as f:
+                f.write(b"cleaned")
+            for group in kwargs["groups"]:
+                values = {"formant": {"F1_mean": 500.0}, "pitch": {"pitch_mean": 150.0}}
+                await callbacks["on_group"](group, values.get(group, {}))
+            return {"F1_mean": 500.0, "pitch_mean": 150.0}, cleaned_path
+        await callbacks["on_group"]("formant", {"F1_mean": 510.0})
+        return {"F1_mean": 510.0}
+
+    monkeypatch.setattr(processing_endpoint, "async_session", task_manager.store.session_factory)
+    monkeypatch.setattr(processing_endpoint.extraction_pool, "run_with_callbacks", fake_extraction)
+
+    async def process():
+        task_id = await task_manager.create_task()
+        await processing_endpoint.process_audio_background(task_id, recording["recording_id"], recording["file_path"])
+        return (await task_manager.get_task(task_id)).result
+
+    await process()
+    # Groups that were extracted but produced no values are not recomputed either
+    assert (await process())["recomputed_groups"] == []
+
+    monkeypatch.setitem(processing_endpoint.FEATURE_GROUP_VERSIONS, "formant", "2")
+    result = await process()
+
+    assert result["recomputed_groups"] == ["formant"]
+    assert [name for name, _ in calls] == ["clean_and_extract_features", "recompute_feature_groups"]
+    assert calls[-1][1] == (["formant"],)
+    stored = {f.feature_name: (f.feature_value, f.feature_group, f.group_version)
+              for f in await get_features(db_session, recording["recording_id"])}
+    assert stored == {"F1_mean": (510.0, "formant", "2"), "pitch_mean": (150.0, "pitch", "1")}
+
+
+@pytest.mark.asyncio
+async def test_changed_cleaning_params_reclean_the_recording(client: AsyncClient, db_session, test_recording,
+                                                             monkeypatch):
+    response = await client.post(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}/recordings/",
+        files={"file": ("recleaned.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVE recleaned audio"), "audio/wav")},
+        data={"task_type": "Sentence Reading"},
+    )
+    recording = response.json()
+    calls = []
+
+    async def fake_extraction(func, input_path, cleaned_path, *args, callbacks, **kwargs):
+        calls.append((func.__name__, kwargs.get("signal_cache_path")))
+        with open(cleaned_path, "wb") as f:
+            f.write(b"cleaned")
+        for group in kwargs["groups"]:
+            await callbacks["on_group"](group, {"pitch": {"pitch_mean": 150.0}}.get(group, {}))
+        return {"pitch_mean": 150.0}, cleaned_path
+
+    monkeypatch.setattr(processing_endpoint, "async_session", task_manager.store.session_factory)
+    monkeypatch.setattr(processing_endpoint.extraction_pool, "run_with_callbacks", fake_extraction)
+
+    async def process():
+        task_id = await task_manager.create_task()
+        await processing_endpoint.process_audio_background(task_id, recording["recording_id"], recording["file_path"])
+        return (await task_manager.get_task(task_id)).result
+
+    async def outdated_ids():
+        recordings = await get_recordings_in_scope(
+            db_session, assessment_id=test_recording["assessment_id"], only="outdated",
+            pipeline_version=pipeline_config.PIPELINE_VERSION, cleaning_key=pipeline_config.cleaning_key,
+        )
+        return [r.recording_id for r in recordings]
+
+    await process()
+    first_key = (await get_recording(db_session, recording["recording_id"])).feature_cache_key
+    assert await outdated_ids() == []
+    assert (await process())["recomputed_groups"] == []
+
+    monkeypatch.setitem(pipeline_config.PIPELINE_PARAMS, "noise_reduction", "vad")
+    db_session.expire_all()
+    assert await outdated_ids() == [recording["recording_id"]]
+
+    result = await process()
+    # Cleaned again from the original with the new parameters, not recomputed from the old cleaned audio
+    assert result["recomputed_groups"] == list(pipeline_config.FEATURE_GROUPS)
+    assert [name for name, _ in calls] == ["clean_and_extract_features", "clean_and_extract_features"]
+    assert calls[0][1] != calls[1][1]
+
+    db_session.expire_all()
+    row = await get_recording(db_session, recording["recording_id"])
+    assert row.cleaning_key == pipeline_config.cleaning_key(row.recording_device)
+    assert row.feature_cache_key not in (None, first_key)
+    assert await outdated_ids() == []
+
+
+@pytest.mark.asyncio
+async def test_process_selected_groups_keeps_other_groups(client: AsyncClient, db_session, test_recording, monkeypatch):
+    response = await client.post(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}/recordings/",
+        files={"file": ("selected.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVE selected groups audio"), "audio/wav")},
+        data={"task_type": "Sentence Reading"},
+    )
+    recording = response.json()
+    calls = []
+
+    async def fake_extraction(func, input_path, cleaned_path, *args, callbacks, **kwargs):
+        groups = args[0] if args else kwargs["groups"]
+        calls.append((func.__name__, groups))
+        with open(cleaned_path, "wb") as f:
+            f.write(b"cleaned")
+        for group in groups:
+            await callbacks["on_group"](group, {f"{group}_value": 1.0})
+        features = {f"{group}_value": 1.0 for group in groups}
+        return (features, cleaned_path) if func.__name__ == "clean_and_extract_features" else features
+
+    monkeypatch.setattr(processing_endpoint, "async_session", task_manager.store.session_factory)
+    monkeypatch.setattr(processing_endpoint.extraction_pool, "run_with_callbacks", fake_extraction)
+
+    for groups in (["timing"], ["pitch", "timing"]):
+        task_id = await task_manager.create_task()
+        await processing_endpoint.process_audio_background(
+            task_id, recording["recording_id"], recording["file_path"], groups
+        )
+
+    # The second run reuses the cleaned audio and only extracts the missing group
+    assert calls == [("clean_and_extract_features", ["timing"]), ("recompute_feature_groups", ["pitch"])]
+    stored = {f.feature_name: f.feature_group for f in await get_features(db_session, recording["recording_id"])}
+    assert stored == {"pitch_value": "pitch", "timing_value": "timing"}
+
+    db_session.expire_all()
+    row = await get_recording(db_session, recording["recording_id"])
+    assert row.feature_group_versions == {"pitch": "1", "timing": "1"}
+    # Partial results never serve as feature cache source
+    assert row.feature_cache_key is None
+
+    base = (
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}"
+        f"/recordings/{recording['recording_id']}/process"
+    )
+    response = await client.post(base, json={"groups": ["timing", "mfcc_only"]})
+    assert response.status_code == 400
+    assert "mfcc_only" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_groups_not_received_from_the_worker_stay_outdated(
+    client: AsyncClient, db_session, test_recording, monkeypatch
+):
+    response = await client.post(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}/recordings/",
+        files={"file": ("lost.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVE lost group audio"), "audio/wav")},
+        data={"task_type": "Sentence Reading"},
+    )
+    recording = response.json()
+    calls = []
+
+    async def fake_extraction(func, input_path, cleaned_path, *args, callbacks, **kwargs):
+        groups = args[0] if args else kwargs["groups"]
+        calls.append((func.__name__, groups))
+        with open(cleaned_path, "wb") as f:
+            f.write(b"cleaned")
+        # The "timing" group never reaches the API process
+        await callbacks["on_group"]("pitch", {"pitch_mean": 150.0})
+        features = {"pitch_mean": 150.0}
+        return (features, cleaned_path) if func.__name__ == "clean_and_extract_features" else features
+
+    monkeypatch.setattr(processing_endpoint, "async_session", task_manager.store.session_factory)
+    monkeypatch.setattr(processing_endpoint.extraction_pool, "run_with_callbacks", fake_extraction)
+
+    results = []
+    for _ in range(2):
+        task_id = await task_manager.create_task()
+        await processing_endpoint.process_audio_background(
+            task_id, recording["recording_id"], recording["file_path"], ["pitch", "timing"]
+        )
+        results.append((await task_manager.get_task(task_id)).result)
+
+    assert results[0]["recomputed_groups"] == ["pitch"]
+    assert calls == [("clean_and_extract_features", ["pitch", "timing"]), ("recompute_feature_groups", ["timing"])]
+    db_session.expire_all()
+    row = await get_recording(db_session, recording["recording_id"])
+    assert row.feature_group_versions == {"pitch": "1"}
@@ -0,0 +1,68 @@
+# backend/tests/test_features.py
+import math
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from app.crud.audio_crud import create_features_bulk, get_features
+
+
+def features_url(recording: dict) -> str:
+    return (
+        f"/api/v1/patients/{recording['patient_id']}/assessments/{recording['assessment_id']}"
+        f"/recordings/{recording['recording_id']}/features/"
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_features_bulk_skips_invalid_values(db_session, test_recording):
+    recording_id = test_recording["recording_id"]
+    features = {
+        "pitch_mean": 182.5,
+        "silence_count": 4,
+        "energy_mean": np.float32(0.25),
+        "jitter_local": float("nan"),
+        "speech_to_pause_ratio": float("inf"),
+        "tempo_bpm": np.array([120.0]),
+    }
+
+    created = await create_features_bulk(db_session, recording_id, features)
+
+    assert created == 3
+    stored = {f.feature_name: f.feature_value for f in await get_features(db_session, recording_id)}
+    assert stored == {"pitch_mean": 182.5, "silence_count": 4.0, "energy_mean": 0.25}
+    assert all(math.isfinite(value) for value in stored.values())
+
+
+@pytest.mark.asyncio
+async def test_add_features_batch_endpoint(client: AsyncClient, test_recording):
+    url = features_url(test_recording)
+
+    payload = [{"feature_name": f"mfcc_{i}_mean", "feature_value": i * 0.5} for i in range(1, 31)]
+    response = await client.post(url + "batch", json=payload)
+
+    assert response.status_code == 201
+    assert response.json() == {"features_created": 30}
+
+    listed = await client.get(url)
+    assert listed.status_code == 200
+    assert len(listed.json()) == 30
+
+
+@pytest.mark.asyncio
+async def test_add_features_batch_rejects_duplicates_and_unknown_recordings(client: AsyncClient, test_recording):
+    url = features_url(test_recording)
+    payload = [
+        {"feature_name": "pitch_mean", "feature_value": 150.0},
+        {"feature_name": "jitter", "feature_value": 0.01},
+        {"feature_name": "pitch_mean", "feature_value": 151.0},
+    ]
+
+    response = await client.post(url + "batch", json=payload)
+    assert response.status_code == 400
+    assert "pitch_mean" in response.json()["detail"]
+    assert (await client.get(url)).json() == []
+
+    missing = features_url({**test_recording, "recording_id": 999999})
+    response = await client.post(missing + "batch", json=payload[:2])
+    assert response.status_code == 404
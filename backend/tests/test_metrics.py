@@ -0,0 +1,117 @@
+# backend/tests/test_metrics.py
+import os
+import subprocess
+import sys
+
+import pytest
+import soundfile as sf
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from prometheus_client.parser import text_string_to_metric_families
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.services import audio_processing
+from app.services.metrics import CONTENT_TYPE, StageTimer, instrument_engine
+from test_audio_processing import SR, make_speech_like_signal
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_WORKER = """
+import os
+from app.services.metrics import DB_POOL_CHECKED_OUT, HTTP_REQUEST_SECONDS
+HTTP_REQUEST_SECONDS.labels(method="GET", route="/", status="200").observe(0.02)
+DB_POOL_CHECKED_OUT.inc()
+print(os.getpid())
+"""
+
+
+def test_metrics_are_aggregated_across_api_workers(tmp_path):
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+
+    def run(code: str) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+
+    def samples() -> dict:
+        body = run("from app.services.metrics import render_metrics; print(render_metrics().decode())")
+        return {
+            sample.name: sample.value
+            for family in text_string_to_metric_families(body) for sample in family.samples
+            if not sample.labels.get("le")
+        }
+
+    pids = [int(run(_WORKER)) for _ in range(2)]
+    assert samples()["neurocapture_http_request_duration_seconds_count"] == 2
+    assert samples()["neurocapture_db_pool_checked_out"] == 2
+
+    # Counters of a stopped worker are kept, its live gauges are dropped
+    run(f"from app.services.metrics import mark_process_dead; mark_process_dead({pids[0]})")
+    assert samples()["neurocapture_http_request_duration_seconds_count"] == 2
+    assert samples()["neurocapture_db_pool_checked_out"] == 1
+
+
+def test_stage_timer_reports_time_and_traced_memory():
+    reported = []
+    timer = StageTimer(lambda name, stats: reported.append((name, stats)), trace_memory=True)
+    data = timer.run("allocate", bytearray, 8 * 2 ** 20)
+
+    assert len(data) == 8 * 2 ** 20
+    assert [name for name, _ in reported] == ["allocate"]
+    stats = reported[0][1]
+    assert stats == timer.stages["allocate"]
+    assert stats["seconds"] >= 0 and stats["peak_mb"] >= 8
+
+
+def test_cleaning_stages_and_extractors_are_timed(tmp_path):
+    input_path = str(tmp_path / "speech.wav")
+    sf.write(input_path, make_speech_like_signal(), SR)
+    stages = {}
+
+    audio_processing.clean_and_extract_features(
+        input_path, groups=["timing", "energy"], on_stage=stages.__setitem__
+    )
+
+    assert list(stages) == [
+        "load_audio", "normalize_audio", "noise_profile", "reduce_noise", "remove_extreme_peaks",
+        "write_cleaned", "extract.timing", "extract.energy",
+    ]
+    assert all(stats["seconds"] >= 0 for stats in stages.values())
+
+
+@pytest.mark.asyncio
+async def test_db_pool_checkouts_are_counted():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine)
+    before = REGISTRY.get_sample_value("neurocapture_db_pool_checkouts_total")
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert REGISTRY.get_sample_value("neurocapture_db_pool_checked_out") >= 1
+    await engine.dispose()
+    assert REGISTRY.get_sample_value("neurocapture_db_pool_checkouts_total") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exports_request_latency_by_route(client: AsyncClient, test_recording):
+    await client.get(f"/api/v1/patients/{test_recording['patient_id']}")
+    await client.get(f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}")
+    await client.get(test_recording["file_path"])
+    await client.get("/no/such/route")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    body = response.text
+    assert "# TYPE neurocapture_stage_duration_seconds histogram" in body
+    assert "neurocapture_extraction_queue_depth" in body
+    assert "neurocapture_db_pool_checkouts_total" in body
+    routes = [line.split("{", 1)[1] for line in body.splitlines()
+              if line.startswith("neurocapture_http_request_duration_seconds_count")]
+    for route in (
+        'method="GET",route="/api/v1/patients/{patient_id}",status="200"}',
+        'method="GET",route="/api/v1/patients/{patient_id}/assessments/{assessment_id}",status="200"}',
+        'method="GET",route="/uploads/{path}",status="200"}',
+        'method="GET",route="unmatched",status="404"}',
+    ):
+        assert any(line.startswith(route) for line in routes), route
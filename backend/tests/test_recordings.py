@@ -33,7 +33,7 @@ async def test_upload_audio_recording(client: AsyncClient, test_patient: dict):
     task_type = "Test Speech Task"
     recording_device = "Test Microphone"
     filename = "test_audio.wav"
-    dummy_audio_content = b"dummy audio data"
+    dummy_audio_content = b"RIFF\x00\x00\x00\x00WAVEdummy audio data"
     dummy_file_object = io.BytesIO(dummy_audio_content)
 
     # 3. Perform Upload
@@ -65,3 +65,47 @@ async def test_upload_audio_recording(client: AsyncClient, test_patient: dict):
     assert isinstance(parse_iso_datetime_str(response_data["recording_date"]), datetime)
     assert isinstance(parse_iso_datetime_str(response_data["created_at"]), datetime)
     assert isinstance(parse_iso_datetime_str(response_data["updated_at"]), datetime)
+
+
+def test_sniff_audio_format():
+    from app.services.uploads import sniff_audio_format
+
+    assert sniff_audio_format(b"RIFF\x24\x00\x00\x00WAVEfmt ") == "wav"
+    assert sniff_audio_format(b"fLaC\x00\x00\x00\x22") == "flac"
+    assert sniff_audio_format(b"OggS\x00\x02") == "ogg"
+    assert sniff_audio_format(b"ID3\x04\x00") == "mp3"
+    assert sniff_audio_format(b"\xff\xfb\x90\x64") == "mp3"
+    assert sniff_audio_format(b"\x00\x00\x00\x20ftypM4A ") == "mp4"
+    assert sniff_audio_format(b"\x1a\x45\xdf\xa3\x9f") == "webm"
+    assert sniff_audio_format(b"RIFF\x24\x00\x00\x00AVI ") is None
+    assert sniff_audio_format(b"%PDF-1.7") is None
+    assert sniff_audio_format(b"") is None
+
+
+@pytest.mark.asyncio
+async def test_upload_rejects_non_audio_and_oversized_files(client: AsyncClient, test_recording, monkeypatch):
+    from app.api.v1.endpoints import recordings as recordings_endpoint
+
+    upload_url = (
+        f"/api/v1/patients/{test_recording['patient_id']}"
+        f"/assessments/{test_recording['assessment_id']}/recordings/"
+    )
+    stored = set(os.listdir(recordings_endpoint.UPLOAD_DIR))
+
+    response = await client.post(
+        upload_url,
+        files={"file": ("notes.wav", io.BytesIO(b"%PDF-1.7 not audio"), "audio/wav")},
+        data={"task_type": "Test Speech Task"},
+    )
+    assert response.status_code == 415
+
+    monkeypatch.setattr(recordings_endpoint, "MAX_UPLOAD_SIZE_MB", 1 / 1024)
+    response = await client.post(
+        upload_url,
+        files={"file": ("long.wav", io.BytesIO(b"RIFF\x00\x00\x00\x00WAVE" + bytes(2048)), "audio/wav")},
+        data={"task_type": "Test Speech Task"},
+    )
+    assert response.status_code == 413
+
+    # Rejected uploads leave nothing behind
+    assert set(os.listdir(recordings_endpoint.UPLOAD_DIR)) == stored
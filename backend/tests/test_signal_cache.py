@@ -0,0 +1,103 @@
+# backend/tests/test_signal_cache.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import soundfile as sf
+from httpx import AsyncClient
+
+from app.services import audio_processing
+from app.services.signal_cache import (
+    cleaned_signal_path,
+    load_cleaned_signal,
+    load_noise_profile,
+    noise_profile_path,
+    remove_cleaned_signals,
+    save_cleaned_signal,
+    save_noise_profile,
+)
+from test_audio_processing import SR, make_speech_like_signal
+
+
+def test_entries_are_invalidated_by_parameter_changes(tmp_path):
+    upload = str(tmp_path / "recording.wav")
+    old_path = cleaned_signal_path(upload, "abc", "1", {"sample_rate": 16000})
+    new_path = cleaned_signal_path(upload, "abc", "1", {"sample_rate": 22050})
+    assert old_path != new_path
+    assert load_cleaned_signal(old_path) is None
+
+    signal = np.linspace(-1, 1, 100, dtype=np.float32)
+    save_cleaned_signal(old_path, signal)
+    cached = load_cleaned_signal(old_path)
+    np.testing.assert_array_equal(cached, signal)
+    assert not cached.flags.writeable  # memory-mapped, not copied
+
+    # Writing an entry for new parameters drops the stale one
+    save_cleaned_signal(new_path, signal)
+    assert not os.path.exists(old_path) and os.path.exists(new_path)
+
+    remove_cleaned_signals(upload)
+    assert os.listdir(tmp_path) == []
+
+
+
+def test_concurrent_saves_of_one_entry_succeed(tmp_path):
+    upload = str(tmp_path / "recording.wav")
+    paths = [cleaned_signal_path(upload, "abc", "1", {"sample_rate": rate}) for rate in (16000, 22050)]
+    profile = noise_profile_path(str(tmp_path / "profiles"), "booth", {"sample_rate": 16000})
+    signal = np.linspace(-1, 1, 10000, dtype=np.float32)
+
+    def save(worker):
+        for _ in range(100):
+            save_cleaned_signal(paths[worker % 2], signal)
+            save_noise_profile(profile, signal)
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(save, range(4)))
+
+    np.testing.assert_array_equal(load_noise_profile(profile), signal)
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_cached_signal_skips_cleaning(tmp_path, monkeypatch):
+    input_path = str(tmp_path / "speech.wav")
+    sf.write(input_path, make_speech_like_signal(), SR)
+    cache_path = cleaned_signal_path(input_path, "abc", "1", {})
+
+    first, cleaned_path = audio_processing.clean_and_extract_features(
+        input_path, groups=["timing", "energy"], signal_cache_path=cache_path
+    )
+    assert os.path.exists(cache_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached signal should not be cleaned again")
+
+    monkeypatch.setattr(audio_processing, "load_audio", fail)
+    monkeypatch.setattr(audio_processing, "reduce_noise", fail)
+    os.remove(cleaned_path)
+    second, _ = audio_processing.clean_and_extract_features(
+        input_path, groups=["timing", "energy"], signal_cache_path=cache_path
+    )
+    recomputed = audio_processing.recompute_feature_groups(
+        input_path, cleaned_path, ["timing", "energy"], signal_cache_path=cache_path
+    )
+
+    assert second == recomputed == first
+    # The cleaned audio file is restored from the cache
+    assert os.path.exists(cleaned_path)
+
+
+@pytest.mark.asyncio
+async def test_delete_recording_removes_cached_signals(client: AsyncClient, test_recording):
+    file_path = test_recording["file_path"].lstrip("/")
+    cache_path = cleaned_signal_path(file_path, "abc", "1", {})
+    save_cleaned_signal(cache_path, np.zeros(16, dtype=np.float32))
+
+    response = await client.delete(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}"
+        f"/recordings/{test_recording['recording_id']}"
+    )
+    assert response.status_code == 204
+    assert not os.path.exists(cache_path)
+    assert not os.path.exists(file_path)
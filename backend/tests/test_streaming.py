@@ -0,0 +1,138 @@
+# backend/tests/test_streaming.py
+import io
+import math
+
+import numpy as np
+import pytest
+import scipy.stats
+import soundfile as sf
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import audio_processing as processing_endpoint
+from app.crud.audio_crud import get_recording
+from app.services import streaming
+from app.services.audio_processing import clean_and_extract_features, recompute_feature_groups
+from app.services.streaming import (
+    OnlineStats,
+    stream_clean_and_extract_features,
+    stream_extract_features,
+)
+from app.services.task_manager import task_manager
+from test_audio_processing import make_speech_like_signal
+
+# Groups computed from the same samples and frames as the in-memory pipeline
+EXACT_GROUPS = ['spectral', 'amplitude', 'complexity', 'additional', 'avqi', 'amplitude_extrema', 'timing', 'energy']
+
+
+def test_online_stats_merge_matches_numpy():
+    rng = np.random.default_rng(0)
+    values = rng.gamma(2.0, 100.0, size=10000)
+    stats = OnlineStats(histogram_range=(0, 2000), bins=2000)
+    for block in np.array_split(values, [10, 11, 3000, 7000]):
+        stats.update(block)
+
+    assert stats.count == values.size
+    assert stats.mean == pytest.approx(np.mean(values))
+    assert stats.std() == pytest.approx(np.std(values))
+    assert stats.std(ddof=1) == pytest.approx(np.std(values, ddof=1))
+    assert stats.skewness() == pytest.approx(scipy.stats.skew(values))
+    assert stats.kurtosis() == pytest.approx(scipy.stats.kurtosis(values))
+    assert (stats.min, stats.max) == (values.min(), values.max())
+    assert stats.median() == pytest.approx(np.median(values), abs=1.0)
+    assert math.isnan(OnlineStats().std())
+
+
+def test_streaming_pipeline_matches_in_memory_cleaning(tmp_path, monkeypatch):
+    # Longer than one noise reduction chunk, split into several blocks and mel chunks
+    monkeypatch.setattr(streaming, "MEL_CHUNK_FRAMES", 300)
+    path = str(tmp_path / "long.wav")
+    sf.write(path, make_speech_like_signal(45.0, sr=22050, seed=3), 22050)
+
+    streamed, streamed_path = stream_clean_and_extract_features(
+        path, str(tmp_path / "streamed.wav"), groups=EXACT_GROUPS + ['pitch'], block_seconds=10,
+    )
+    expected, expected_path = clean_and_extract_features(
+        path, str(tmp_path / "in_memory.wav"), groups=EXACT_GROUPS + ['pitch'],
+    )
+
+    streamed_audio, _ = sf.read(streamed_path)
+    expected_audio, _ = sf.read(expected_path)
+    assert streamed_audio.shape == expected_audio.shape
+    assert np.max(np.abs(streamed_audio - expected_audio)) <= 1 / 32768
+
+    # The features of the whole-recording spectrum are not streamed
+    assert set(streamed) == set(expected) - {'spectral_slope', 'spectral_centroid'}
+    for name, value in streamed.items():
+        value = expected[name]
+        # Pitch is tracked per block; Asymmetry is a near-zero float32 moment in memory
+        tolerance = 1e-2 if name.startswith('pitch') or name == 'Asymmetry' else 1e-5
+        assert streamed[name] == pytest.approx(value, rel=tolerance, abs=1e-9), name
+
+    groups = []
+    recomputed = stream_extract_features(
+        path, streamed_path, ['energy', 'amplitude', 'spectral'], on_group=lambda group, f: groups.append(group),
+    )
+    assert groups == ['spectral', 'amplitude', 'energy']
+    # Both read the cleaned audio back at its stored precision
+    expected = recompute_feature_groups(path, streamed_path, ['energy', 'amplitude', 'spectral'])
+    for name, value in recomputed.items():
+        assert value == pytest.approx(expected[name], rel=1e-5, abs=1e-9), name
+    with pytest.raises(ValueError):
+        stream_extract_features(path, streamed_path, ['rhythm'])
+
+
+@pytest.mark.asyncio
+async def test_long_recordings_are_streamed_when_enabled(client: AsyncClient, test_recording, monkeypatch):
+    audio = io.BytesIO()
+    sf.write(audio, make_speech_like_signal(1.0, seed=4), 16000, format="WAV")
+    response = await client.post(
+        f"/api/v1/patients/{test_recording['patient_id']}/assessments/{test_recording['assessment_id']}/recordings/",
+        files={"file": ("long.wav", io.BytesIO(audio.getvalue()), "audio/wav")},
+        data={"task_type": "Sentence Reading"},
+    )
+    recording = response.json()
+    calls = []
+
+    async def fake_extraction(func, input_path, cleaned_path, *args, callbacks, groups=None, **kwargs):
+        groups = args[0] if groups is None else groups
+        calls.append((func.__name__, groups))
+        with open(cleaned_path, "wb") as f:
+            f.write(b"cleaned")
+        for group in groups:
+            await callbacks["on_group"](group, {f"{group}_value": 1.0})
+        features = {f"{group}_value": 1.0 for group in groups}
+        if func.__name__ in ("recompute_feature_groups", "stream_extract_features"):
+            return features
+        return features, cleaned_path
+
+    async def process():
+        task_id = await task_manager.create_task()
+        await processing_endpoint.process_audio_background(
+            task_id, recording["recording_id"], recording["file_path"], ["spectral", "timing", "pitch", "rhythm"]
+        )
+        async with task_manager.store.session_factory() as db:
+            versions = (await get_recording(db, recording["recording_id"])).feature_group_versions
+        return (await task_manager.get_task(task_id)).result, versions
+
+    monkeypatch.setattr(processing_endpoint, "STREAMING_MIN_DURATION_SECONDS", 0.5)
+    monkeypatch.setattr(processing_endpoint, "STREAMING_ENABLED", True)
+    monkeypatch.setattr(processing_endpoint, "async_session", task_manager.store.session_factory)
+    monkeypatch.setattr(processing_endpoint.extraction_pool, "run_with_callbacks", fake_extraction)
+
+    result, versions = await process()
+    assert calls == [("stream_clean_and_extract_features", ["spectral", "pitch", "timing"])]
+    assert result["streaming"] is True
+    assert result["skipped_groups"] == ["rhythm"]
+    # Streamed values that differ from in-memory ones are told apart by their version
+    assert versions == {"spectral": "1-stream", "pitch": "1-stream", "timing": "1"}
+
+    # Streamed groups are current while streaming is enabled
+    result, _ = await process()
+    assert len(calls) == 1 and result["skipped_groups"] == ["rhythm"]
+
+    # Without streaming, they are recomputed in memory with the skipped groups
+    monkeypatch.setattr(processing_endpoint, "STREAMING_ENABLED", False)
+    result, versions = await process()
+    assert calls[1:] == [("recompute_feature_groups", ["spectral", "pitch", "rhythm"])]
+    assert result["streaming"] is False
+    assert versions == {"spectral": "1", "pitch": "1", "timing": "1", "rhythm": "1"}
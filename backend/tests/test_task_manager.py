@@ -0,0 +1,265 @@
+# backend/tests/test_task_manager.py
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.task_manager import (
+    TaskManager,
+    TaskStatus,
+    InMemoryTaskStore,
+    DatabaseTaskStore,
+    owner_is_dead,
+    process_owner,
+    task_manager,
+)
+
+
+@pytest.fixture(params=["memory", "database"])
+def manager(request):
+    if request.param == "memory":
+        return TaskManager(InMemoryTaskStore())
+    # Same test database the global task manager uses
+    return TaskManager(DatabaseTaskStore(task_manager.store.session_factory))
+
+
+@pytest.mark.asyncio
+async def test_task_lifecycle(manager: TaskManager):
+    task_id = await manager.create_task()
+    task = await manager.get_task(task_id)
+    assert task.status == TaskStatus.PENDING
+    assert task.progress == 0.0
+
+    await manager.mark_task_running(task_id)
+    await manager.update_task_progress(task_id, 0.5)
+    task = await manager.get_task(task_id)
+    assert task.status == TaskStatus.RUNNING
+    assert task.progress == 0.5
+    assert task.started_at is not None
+
+    await manager.mark_task_completed(task_id, {"features_extracted": 3})
+    info = await manager.get_task_dict(task_id)
+    assert info["status"] == "completed"
+    assert info["progress"] == 1.0
+    assert info["result"] == {"features_extracted": 3}
+    assert info["completed_at"] is not None
+
+    assert await manager.get_task_dict("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_expired_tasks(manager: TaskManager):
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=48)
+    old_id = await manager.create_task()
+    await manager.mark_task_completed(old_id)
+    await manager.store.update(old_id, created_at=long_ago, completed_at=long_ago)
+    failed_id = await manager.create_task()
+    await manager.mark_task_failed(failed_id, "error")
+    await manager.store.update(failed_id, created_at=long_ago, completed_at=long_ago)
+    # Created long ago, finished recently
+    recent_id = await manager.create_task()
+    await manager.mark_task_completed(recent_id)
+    await manager.store.update(recent_id, created_at=long_ago)
+    fresh_id = await manager.create_task()
+
+    assert await manager.cleanup_old_tasks(max_age_hours=24) >= 2
+    assert await manager.get_task(old_id) is None
+    assert await manager.get_task(failed_id) is None
+    assert await manager.get_task(recent_id) is not None
+    assert await manager.get_task(fresh_id) is not None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_keeps_old_unfinished_tasks(manager: TaskManager):
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=48)
+    # A long batch and its item tasks, still in progress past the retention period
+    batch_id = await manager.create_task()
+    await manager.mark_task_running(batch_id)
+    [running_id, pending_id] = await manager.create_batch_tasks(batch_id, [1, 2])
+    await manager.mark_task_running(running_id)
+    for task_id in (batch_id, running_id, pending_id):
+        await manager.store.update(task_id, created_at=long_ago)
+
+    await manager.cleanup_old_tasks(max_age_hours=24)
+
+    assert (await manager.get_task(batch_id)).status == TaskStatus.RUNNING
+    assert [task.id for task in await manager.get_batch_tasks(batch_id)] == [running_id, pending_id]
+    await manager.mark_task_completed(running_id)
+    assert (await manager.get_task(running_id)).status == TaskStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_stale_running_tasks_are_failed(manager: TaskManager):
+    running_id = await manager.create_task()
+    await manager.mark_task_running(running_id)
+    completed_id = await manager.create_task()
+    await manager.mark_task_completed(completed_id)
+
+    # Recently updated tasks are left alone
+    await manager.recover_orphaned_tasks(stale_after_seconds=3600)
+    assert (await manager.get_task(running_id)).status == TaskStatus.RUNNING
+
+    cutoff = datetime.now(timezone.utc) + timedelta(seconds=1)
+    assert await manager.store.fail_stale(cutoff, "interrupted") >= 1
+    orphan = await manager.get_task(running_id)
+    assert orphan.status == TaskStatus.FAILED
+    assert orphan.error == "interrupted"
+    assert orphan.completed_at is not None
+    assert (await manager.get_task(completed_id)).status == TaskStatus.COMPLETED
+
+
+def test_owner_is_dead_for_stopped_processes_of_this_host():
+    host, boot, pid, token = process_owner().rsplit("/", 3)
+    stopped = subprocess.Popen([sys.executable, "-c", "pass"])
+    stopped.wait()
+
+    assert not owner_is_dead(process_owner())
+    assert owner_is_dead(f"{host}/{boot}/{pid}/earlier-process")
+    assert owner_is_dead(f"{host}/previous-boot/{pid}/{token}")
+    assert owner_is_dead(f"{host}/{boot}/{stopped.pid}/{token}")
+    # Unknown: other hosts, tasks created before owners were recorded
+    assert not owner_is_dead(f"other-host/{boot}/{stopped.pid}/{token}")
+    assert not owner_is_dead(None)
+
+
+@pytest.mark.asyncio
+async def test_tasks_of_stopped_owners_fail_at_once_and_heartbeats_keep_tasks(manager: TaskManager):
+    host, boot, pid, token = process_owner().rsplit("/", 3)
+    own = await manager.create_task()
+    crashed = await manager.create_task()
+    # Created through another worker, whose heartbeats stopped
+    remote = await TaskManager(manager.store).create_task()
+    for task_id in (own, crashed, remote):
+        await manager.mark_task_running(task_id)
+    await manager.store.update(crashed, owner=f"{host}/{boot}/{pid}/earlier-process")
+    await manager.store.update(remote, owner="other-host/boot/1/token")
+
+    await manager.recover_orphaned_tasks(stale_after_seconds=3600)
+    assert (await manager.get_task(crashed)).status == TaskStatus.FAILED
+    assert (await manager.get_task(own)).status == TaskStatus.RUNNING
+    assert (await manager.get_task(remote)).status == TaskStatus.RUNNING
+
+    # Past the stale window, only tasks refreshed by their owner's heartbeat are kept
+    await asyncio.sleep(0.05)
+    await manager.heartbeat()
+    await manager.recover_orphaned_tasks(stale_after_seconds=0.02)
+    assert (await manager.get_task(own)).status == TaskStatus.RUNNING
+    assert (await manager.get_task(remote)).status == TaskStatus.FAILED
+
+    assert manager._owned == {own}
+    await manager.mark_task_completed(own)
+
+
+@pytest.mark.asyncio
+async def test_task_status_endpoint_reads_shared_store(client: AsyncClient, test_recording):
+    task_id = await task_manager.create_task()
+    await task_manager.mark_task_running(task_id)
+
+    # A second manager over the same table (another API worker) updates the task
+    other_worker = TaskManager(DatabaseTaskStore(task_manager.store.session_factory))
+    await other_worker.update_task_progress(task_id, 0.4)
+
+    base = (
+        f"/api/v1/patients/{test_recording['patient_id']}"
+        f"/assessments/{test_recording['assessment_id']}"
+        f"/recordings/{test_recording['recording_id']}/process"
+    )
+    response = await client.get(f"{base}/{task_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "running"
+    assert response.json()["progress"] == 0.4
+
+    response = await client.get(f"{base}/does-not-exist")
+    assert response.status_code == 404
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_task_event_stream_multiplexes_tasks(client: AsyncClient):
+    first = await task_manager.create_task()
+    second = await task_manager.create_task()
+
+    async def run_tasks():
+        await asyncio.sleep(0.05)
+        await task_manager.mark_task_running(first)
+        await task_manager.update_task_progress(
+            first, 0.5, {"stage": "spectral", "feature_groups": {"spectral": {"Spectral_Centroid_mean": 1.5}}}
+        )
+        await asyncio.sleep(0.05)
+        # The last group finishes together with the task
+        await task_manager.mark_task_completed(first, {"features_extracted": 2, "feature_groups": {
+            "spectral": {"Spectral_Centroid_mean": 1.5}, "timing": {"speech_rate": 3.0},
+        }})
+        await asyncio.sleep(0.05)
+        await task_manager.mark_task_failed(second, "boom")
+
+    response, _ = await asyncio.wait_for(
+        asyncio.gather(
+            client.get("/api/v1/tasks/events", params={"task_id": [first, second, "missing"]}),
+            run_tasks(),
+        ),
+        timeout=10,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(response.text)
+    first_events = [(name, data) for name, data in events if data.get("task_id", data.get("id")) == first]
+    assert ("features", {"task_id": first, "group": "spectral",
+                         "features": {"Spectral_Centroid_mean": 1.5}}) in first_events
+    features = [data["group"] for name, data in first_events if name == "features"]
+    assert features == ["spectral", "timing"]
+    assert ("features", {"task_id": first, "group": "timing", "features": {"speech_rate": 3.0}}) in first_events
+    assert first_events[-1][0] == "completed"
+    assert first_events[-1][1]["result"]["features_extracted"] == 2
+
+    assert events[-1][0] == "failed" and events[-1][1]["error"] == "boom"
+    assert ("error", {"task_id": "missing", "error": "Task not found"}) in events
+
+
+@pytest.mark.asyncio
+async def test_task_event_stream_reads_all_tasks_at_once(client: AsyncClient, monkeypatch):
+    task_ids = [await task_manager.create_task() for _ in range(3)]
+    reads = []
+    get_many = task_manager.store.get_many
+
+    async def counting_get_many(ids):
+        reads.append(sorted(ids))
+        return await get_many(ids)
+
+    async def single_get(task_id):
+        raise AssertionError("tasks are read one by one")
+
+    monkeypatch.setattr(task_manager.store, "get_many", counting_get_many)
+    monkeypatch.setattr(task_manager.store, "get", single_get)
+
+    async def run_tasks():
+        await asyncio.sleep(0.05)
+        await task_manager.mark_task_running(task_ids[0])
+        await asyncio.sleep(0.05)
+        for task_id in task_ids:
+            await task_manager.mark_task_completed(task_id)
+
+    response, _ = await asyncio.wait_for(
+        asyncio.gather(client.get("/api/v1/tasks/events", params={"task_id": task_ids}), run_tasks()),
+        timeout=10,
+    )
+
+    events = _parse_sse(response.text)
+    assert reads[0] == sorted(task_ids)
+    assert len(reads) < 10
+    # The pending tasks are reported once, not again on every read
+    assert [name for name, data in events if data.get("task_id") == task_ids[1]] == ["progress", "progress"]
+    assert sum(name == "completed" for name, _ in events) == 3